@@ -24,6 +24,20 @@ export function createApiClient({ apiBase = "", fetcher = fetch } = {}) {
       return body.events ?? body.journal ?? body.entries ?? [];
     },
 
+    async getJournalDelta(runId, { sinceEntry, cursor } = {}) {
+      const query = cursor
+        ? `cursor=${encodeURIComponent(cursor)}`
+        : `since_entry=${encodeURIComponent(sinceEntry)}`;
+      const body = await _request(`/v1/runs/${encodeURIComponent(runId)}/journal?${query}`);
+      return {
+        entries: body.entries ?? [],
+        runStatus: body.run_status ?? null,
+        nextCursor: body.next_cursor ?? null,
+        hasMore: Boolean(body.has_more),
+        resyncRequired: Boolean(body.resync_required),
+      };
+    },
+
     async listPendingApprovals() {
       const body = await _request("/v1/approvals/pending");
       return body.items ?? body.approvals ?? body.pending ?? [];
@@ -64,3 +64,37 @@ test("uses decision-id approvals endpoint when decisionId is provided", async ()
 
   assert.equal(calls[0], "/v1/approvals/decisions/dec_1");
 });
+
+test("requests journal delta since the last known entry", async () => {
+  const calls = [];
+  const fetcher = async (url) => {
+    calls.push(url);
+    return {
+      ok: true,
+      async json() {
+        return {
+          entries: [{ entry_id: "jrnl_run_live_0003" }],
+          run_status: { status: "paused", pending_approval: null },
+          next_cursor: "eyJhZnRlciI6M30",
+          has_more: false,
+        };
+      },
+    };
+  };
+  const client = createApiClient({ apiBase: "http://127.0.0.1:8001", fetcher });
+
+  const delta = await client.getJournalDelta("run_live", { sinceEntry: "jrnl_run_live_0002" });
+  await client.getJournalDelta("run_live", { cursor: delta.nextCursor });
+
+  assert.deepEqual(calls, [
+    "http://127.0.0.1:8001/v1/runs/run_live/journal?since_entry=jrnl_run_live_0002",
+    "http://127.0.0.1:8001/v1/runs/run_live/journal?cursor=eyJhZnRlciI6M30",
+  ]);
+  assert.deepEqual(delta, {
+    entries: [{ entry_id: "jrnl_run_live_0003" }],
+    runStatus: { status: "paused", pending_approval: null },
+    nextCursor: "eyJhZnRlciI6M30",
+    hasMore: false,
+    resyncRequired: false,
+  });
+});
@@ -2,6 +2,7 @@ export function createTimelineController({
   runId,
   getDemoEvents,
   getJournalEvents,
+  getJournalDelta,
   listPendingApprovals,
   getDemoPendingApprovals,
   resolveApproval,
@@ -18,6 +19,7 @@ export function createTimelineController({
     pendingApprovals: [],
     pendingSubmissionByEventId: {},
   };
+  let journalCursor = null;
 
   function emit() {
     onState?.(state);
@@ -29,7 +31,7 @@ export function createTimelineController({
     emit();
 
     try {
-      state.events = runId === "demo" ? await getDemoEvents() : await getJournalEvents(runId);
+      state.events = runId === "demo" ? await getDemoEvents() : await _loadJournalEvents();
       state.status = "success";
       emit();
     } catch (err) {
@@ -39,6 +41,28 @@ export function createTimelineController({
     }
   }
 
+  async function _loadJournalEvents() {
+    const lastEntryId = state.events.at(-1)?.entry_id;
+    if (!getJournalDelta || typeof lastEntryId !== "string") return _reloadJournalEvents();
+
+    // Entry ids shift when an event lands mid-timeline, so since_entry only
+    // seeds the first delta; later polls resume from the returned cursor.
+    const delta = await getJournalDelta(
+      runId,
+      journalCursor ? { cursor: journalCursor } : { sinceEntry: lastEntryId },
+    );
+    const knownEventIds = new Set(state.events.map((event) => event.event_id).filter(Boolean));
+    const repeatsKnownEvent = delta.entries.some((entry) => knownEventIds.has(entry.event_id));
+    if (delta.hasMore || delta.resyncRequired || repeatsKnownEvent) return _reloadJournalEvents();
+    journalCursor = delta.nextCursor;
+    return [...state.events, ...delta.entries];
+  }
+
+  async function _reloadJournalEvents() {
+    journalCursor = null;
+    return getJournalEvents(runId);
+  }
+
   async function loadPendingApprovals() {
     state.pendingStatus = "loading";
     state.pendingError = "";
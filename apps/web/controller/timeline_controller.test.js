@@ -303,3 +303,99 @@ test("filters live pending approvals to current runId", async () => {
     ["evt-1", "evt-3"]
   );
 });
+
+test("refreshes a loaded journal with a delta since the last entry", async () => {
+  const deltaCalls = [];
+  let fullLoads = 0;
+  const controller = createTimelineController({
+    runId: "run-1",
+    getDemoEvents: async () => [],
+    getJournalEvents: async () => {
+      fullLoads += 1;
+      return [{ entry_id: "jrnl_run-1_0001", event_id: "evt_1" }];
+    },
+    getJournalDelta: async (runId, position) => {
+      deltaCalls.push([runId, position]);
+      const entries = deltaCalls.length === 1 ? [{ entry_id: "jrnl_run-1_0002", event_id: "evt_2" }] : [];
+      return { entries, nextCursor: `cursor-${deltaCalls.length}`, hasMore: false, resyncRequired: false };
+    },
+    listPendingApprovals: async () => [],
+    resolveApproval: async () => ({ ok: true }),
+  });
+
+  await controller.load();
+  await controller.load();
+  await controller.load();
+
+  assert.equal(fullLoads, 1);
+  assert.deepEqual(deltaCalls, [
+    ["run-1", { sinceEntry: "jrnl_run-1_0001" }],
+    ["run-1", { cursor: "cursor-1" }],
+  ]);
+  assert.deepEqual(controller.state.events, [
+    { entry_id: "jrnl_run-1_0001", event_id: "evt_1" },
+    { entry_id: "jrnl_run-1_0002", event_id: "evt_2" },
+  ]);
+});
+
+test("reloads the journal when a delta reports an append behind the loaded entries", async () => {
+  const journals = [
+    [
+      { entry_id: "jrnl_run-1_0001", event_id: "evt_1" },
+      { entry_id: "jrnl_run-1_0002", event_id: "evt_3" },
+    ],
+    [
+      { entry_id: "jrnl_run-1_0001", event_id: "evt_1" },
+      { entry_id: "jrnl_run-1_0002", event_id: "evt_2" },
+      { entry_id: "jrnl_run-1_0003", event_id: "evt_3" },
+    ],
+  ];
+  let fullLoads = 0;
+  const controller = createTimelineController({
+    runId: "run-1",
+    getDemoEvents: async () => [],
+    getJournalEvents: async () => journals[fullLoads++],
+    // evt_2 landed before evt_3, so the entry now at 0002 is evt_2 and the
+    // delta since it repeats evt_3.
+    getJournalDelta: async () => ({
+      entries: [{ entry_id: "jrnl_run-1_0003", event_id: "evt_3" }],
+      nextCursor: "cursor-1",
+      hasMore: false,
+      resyncRequired: false,
+    }),
+    listPendingApprovals: async () => [],
+    resolveApproval: async () => ({ ok: true }),
+  });
+
+  await controller.load();
+  await controller.load();
+
+  assert.equal(fullLoads, 2);
+  assert.deepEqual(controller.state.events, journals[1]);
+});
+
+test("reloads the journal when a cursor delta requires a resync", async () => {
+  let fullLoads = 0;
+  let deltaCalls = 0;
+  const controller = createTimelineController({
+    runId: "run-1",
+    getDemoEvents: async () => [],
+    getJournalEvents: async () => {
+      fullLoads += 1;
+      return [{ entry_id: "jrnl_run-1_0001", event_id: "evt_1" }];
+    },
+    getJournalDelta: async () => {
+      deltaCalls += 1;
+      return { entries: [], nextCursor: "cursor-1", hasMore: false, resyncRequired: deltaCalls > 1 };
+    },
+    listPendingApprovals: async () => [],
+    resolveApproval: async () => ({ ok: true }),
+  });
+
+  await controller.load();
+  await controller.load();
+  await controller.load();
+
+  assert.equal(deltaCalls, 2);
+  assert.equal(fullLoads, 2);
+});
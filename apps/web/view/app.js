@@ -42,6 +42,7 @@ createApp({
         return MOCK_EVENTS;
       },
       getJournalEvents: apiClient.getJournalEvents,
+      getJournalDelta: apiClient.getJournalDelta,
       listPendingApprovals: apiClient.listPendingApprovals,
       getDemoPendingApprovals: async () => {
         await new Promise((resolve) => setTimeout(resolve, 250));
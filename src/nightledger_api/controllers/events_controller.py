@@ -1,19 +1,41 @@
+import asyncio
 import json
 import logging
 import os
 from datetime import datetime, timedelta, timezone
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, Header, status
-from pydantic import BaseModel, ConfigDict, Field
+from fastapi import APIRouter, Depends, Header, Query, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
+from nightledger_api.models.event_schema import ApprovalStatus, RiskLevel
+from nightledger_api.presenters.columnar_presenter import (
+    COLUMNAR_MEDIA_TYPE,
+    accepts_columnar,
+    present_columnar,
+)
+from nightledger_api.presenters.error_presenter import (
+    present_ambiguous_event_id_error,
+    present_approval_not_found_error,
+    present_duplicate_approval_error,
+    present_inconsistent_run_state_error,
+    present_no_pending_approval_error,
+    present_run_not_found_error,
+    present_storage_write_error,
+)
 from nightledger_api.services.approval_service import (
+    ApprovalDecisionBatchItem,
+    ApprovalResolutionError,
+    approval_latency_metrics,
     get_approval_decision_state,
     list_pending_approvals,
     register_pending_approval_request,
     resolve_pending_approval_by_decision_id,
     resolve_pending_approval,
+    resolve_pending_approvals_by_decision_ids,
+    wait_for_approval_decision_state,
 )
 from nightledger_api.services.authorize_action_service import (
     AuthorizeActionContext,
@@ -22,13 +44,20 @@ from nightledger_api.services.authorize_action_service import (
     evaluate_authorize_action,
     get_policy_catalog,
 )
-from nightledger_api.services.audit_export_service import export_decision_audit
+from nightledger_api.services.audit_export_service import (
+    DecisionAuditQuery,
+    export_decision_audit,
+    iter_decision_audit_records,
+)
 from nightledger_api.services.business_rules_service import validate_event_business_rules
+from nightledger_api.services.decision_waiters import configured_decision_max_wait_seconds
 from nightledger_api.services.event_ingest_service import validate_event_payload
 from nightledger_api.services.event_store import (
     EventStore,
     InMemoryAppendOnlyEventStore,
     SQLiteAppendOnlyEventStore,
+    StoredEvent,
+    configured_event_store_db_path,
 )
 from nightledger_api.services.errors import (
     AmbiguousEventIdError,
@@ -37,6 +66,7 @@ from nightledger_api.services.errors import (
     DuplicateApprovalError,
     DuplicateEventError,
     InconsistentRunStateError,
+    InvalidQueryParameterError,
     NoPendingApprovalError,
     RunNotFoundError,
     SchemaValidationError,
@@ -56,16 +86,60 @@ from nightledger_api.services.execution_token_service import (
     verify_execution_token,
 )
 from nightledger_api.services.execution_replay_store import SQLiteExecutionReplayStore
-from nightledger_api.services.journal_projection_service import project_run_journal
-from nightledger_api.services.run_status_service import project_run_status
+from nightledger_api.services.field_selection import (
+    EVENT_FIELDS,
+    EVENT_NESTED_FIELDS,
+    JOURNAL_ENTRY_FIELDS,
+    JOURNAL_ENTRY_NESTED_FIELDS,
+    nest_fields,
+    parse_fields,
+)
+from nightledger_api.services.journal_projection_service import (
+    JournalVerification,
+    RenderedRunJournal,
+    RenderedWorkflowJournal,
+    decode_journal_cursor,
+    decode_workflow_journal_cursor,
+    encode_json,
+    parse_journal_entry_id,
+)
+from nightledger_api.services.projection_cache import (
+    journal_entry_cache_metrics,
+    load_run_journal,
+    load_run_journal_page,
+    load_run_status,
+    load_run_status_as_of,
+    load_run_statuses,
+    load_workflow_journal_page,
+    projection_cache_metrics,
+)
+from nightledger_api.services.run_catalog_service import (
+    PendingApprovalQuery,
+    RunCatalogQuery,
+    decode_pending_approval_cursor,
+    decode_run_catalog_cursor,
+    encode_run_catalog_cursor,
+)
+from nightledger_api.services.run_status_service import RunWorkflowStatus
 
 
 router = APIRouter()
 _EVENT_STORE_BACKEND_ENV = "NIGHTLEDGER_EVENT_STORE_BACKEND"
-_EVENT_STORE_DB_PATH_ENV = "NIGHTLEDGER_EVENT_STORE_DB_PATH"
 _DEFAULT_EVENT_STORE_BACKEND = "memory"
-_DEFAULT_EVENT_STORE_DB_PATH = "/tmp/nightledger_events.db"
+_MAX_BATCH_STATUS_RUN_IDS = 200
+_MAX_BATCH_APPROVAL_DECISIONS = 100
+_DEFAULT_RUNS_PAGE_LIMIT = 50
+_MAX_RUNS_PAGE_LIMIT = 200
+_DEFAULT_JOURNAL_PAGE_LIMIT = 100
+_MAX_JOURNAL_PAGE_LIMIT = 1000
+_DEFAULT_PENDING_PAGE_LIMIT = 100
+_MAX_PENDING_PAGE_LIMIT = 500
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Serializes event rows the way the default JSON response does (Z timestamps).
+_EVENT_ROWS_ADAPTER = TypeAdapter(list[dict[str, Any]])
 _event_store: EventStore | None = None
+# Called with the replacement store whenever _reset_event_store swaps it.
+_event_store_reset_listeners: list[Callable[[EventStore], None]] = []
 logger = logging.getLogger(__name__)
 uvicorn_logger = logging.getLogger("uvicorn.error")
 logger.setLevel(logging.INFO)
@@ -81,6 +155,16 @@ class ApprovalDecisionRequest(BaseModel):
     reason: str | None = None
 
 
+class ApprovalDecisionBatchItemRequest(ApprovalDecisionRequest):
+    decision_id: str = Field(min_length=1)
+
+
+class ApprovalDecisionBatchRequest(BaseModel):
+    items: list[ApprovalDecisionBatchItemRequest] = Field(
+        min_length=1, max_length=_MAX_BATCH_APPROVAL_DECISIONS
+    )
+
+
 class ApprovalRequestRegistrationPayload(BaseModel):
     model_config = ConfigDict(str_strip_whitespace=True)
 
@@ -102,6 +186,19 @@ class PurchaseCreateExecutionRequest(BaseModel):
     merchant: str = Field(min_length=1)
 
 
+class RunStatusBatchRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    run_ids: list[str] = Field(min_length=1, max_length=_MAX_BATCH_STATUS_RUN_IDS)
+
+    @field_validator("run_ids")
+    @classmethod
+    def reject_blank_run_ids(cls, value: list[str]) -> list[str]:
+        if any(not run_id.strip() for run_id in value):
+            raise ValueError("run_ids must not contain empty ids")
+        return value
+
+
 class ExecutionTokenMintRequest(BaseModel):
     model_config = ConfigDict(str_strip_whitespace=True)
 
@@ -120,14 +217,23 @@ def get_event_store() -> EventStore:
 def _reset_event_store() -> EventStore:
     global _event_store
     _event_store = _build_event_store()
+    for listener in list(_event_store_reset_listeners):
+        listener(_event_store)
     return _event_store
 
 
+def add_event_store_reset_listener(listener: Callable[[EventStore], None]) -> None:
+    _event_store_reset_listeners.append(listener)
+
+
+def remove_event_store_reset_listener(listener: Callable[[EventStore], None]) -> None:
+    _event_store_reset_listeners.remove(listener)
+
+
 def _build_event_store() -> EventStore:
     backend = os.getenv(_EVENT_STORE_BACKEND_ENV, _DEFAULT_EVENT_STORE_BACKEND).strip().lower()
     if backend == "sqlite":
-        path = os.getenv(_EVENT_STORE_DB_PATH_ENV, _DEFAULT_EVENT_STORE_DB_PATH).strip()
-        return SQLiteAppendOnlyEventStore(path=path or _DEFAULT_EVENT_STORE_DB_PATH)
+        return SQLiteAppendOnlyEventStore(path=configured_event_store_db_path())
     return InMemoryAppendOnlyEventStore()
 
 
@@ -243,6 +349,20 @@ def _log_demo_seed_failure(*, exc: Exception, payloads: list[dict[str, Any]]) ->
     )
 
 
+def _present_approval_resolution_error(exc: ApprovalResolutionError) -> dict[str, Any]:
+    if isinstance(exc, ApprovalNotFoundError):
+        return present_approval_not_found_error(exc)
+    if isinstance(exc, AmbiguousEventIdError):
+        return present_ambiguous_event_id_error(exc)
+    if isinstance(exc, NoPendingApprovalError):
+        return present_no_pending_approval_error(exc)
+    if isinstance(exc, DuplicateApprovalError):
+        return present_duplicate_approval_error(exc)
+    if isinstance(exc, InconsistentRunStateError):
+        return present_inconsistent_run_state_error(exc)
+    return present_storage_write_error(exc)
+
+
 def _log_approval_resolution_requested(
     *,
     event_id: str,
@@ -391,78 +511,278 @@ def ingest_event(
         "integrity_warning": stored.integrity_warning,
     }
 
+@router.get("/v1/runs", status_code=status.HTTP_200_OK)
+def list_runs(
+    status_filter: RunWorkflowStatus | None = Query(default=None, alias="status"),
+    workflow: str | None = None,
+    updated_after: datetime | None = None,
+    limit: int = Query(default=_DEFAULT_RUNS_PAGE_LIMIT, ge=1, le=_MAX_RUNS_PAGE_LIMIT),
+    cursor: str | None = None,
+    store: EventStore = Depends(get_event_store),
+) -> dict[str, Any]:
+    if updated_after is not None:
+        updated_after = _require_timezone(updated_after, path="updated_after")
+    query = RunCatalogQuery(
+        status=status_filter,
+        workflow=workflow,
+        updated_after=updated_after,
+        after=decode_run_catalog_cursor(cursor) if cursor is not None else None,
+        # One extra row tells us whether another page exists.
+        limit=limit + 1,
+    )
+    try:
+        entries = store.list_runs(query)
+    except StorageReadError:
+        raise
+    except Exception as exc:  # pragma: no cover - defensive wrapper
+        raise StorageReadError("storage backend read failed") from exc
+
+    page = entries[:limit]
+    return {
+        "run_count": len(page),
+        "runs": [entry.to_dict() for entry in page],
+        "next_cursor": encode_run_catalog_cursor(page[-1]) if len(entries) > limit else None,
+    }
+
+
 @router.get("/v1/runs/{run_id}/events", status_code=status.HTTP_200_OK)
 def get_run_events(
-    run_id: str, store: EventStore = Depends(get_event_store)
+    run_id: str,
+    response: Response,
+    fields: str | None = None,
+    accept: str | None = Header(default=None),
+    store: EventStore = Depends(get_event_store),
 ) -> dict[str, Any]:
+    selected = (
+        parse_fields(fields, allowed=EVENT_FIELDS, nested=EVENT_NESTED_FIELDS)
+        if fields is not None
+        else None
+    )
     try:
-        events = store.list_by_run_id(run_id)
+        if selected is None:
+            rows = [_event_row(event) for event in store.list_by_run_id(run_id)]
+        else:
+            rows = [
+                nest_fields(flat)
+                for flat in store.list_fields_by_run_id(run_id, selected)
+            ]
     except StorageReadError:
         raise
     except Exception as exc:  # pragma: no cover - defensive wrapper
         raise StorageReadError("storage backend read failed") from exc
 
+    if accepts_columnar(accept):
+        return _columnar_response(
+            header={"run_id": run_id},
+            rows=_EVENT_ROWS_ADAPTER.dump_python(rows, mode="json"),
+            count_key="event_count",
+            extra={},
+        )
+    response.headers["Vary"] = "Accept"
     return {
         "run_id": run_id,
-        "event_count": len(events),
-        "events": [
-            {
-                "id": event.id,
-                "timestamp": event.timestamp,
-                "run_id": event.run_id,
-                "payload": event.payload,
-                "integrity_warning": event.integrity_warning,
-            }
-            for event in events
-        ],
+        "event_count": len(rows),
+        "events": rows,
     }
 
 
 @router.get("/v1/runs/{run_id}/status", status_code=status.HTTP_200_OK)
 def get_run_status(
-    run_id: str, store: EventStore = Depends(get_event_store)
+    run_id: str,
+    as_of_sequence: int | None = Query(default=None, ge=1),
+    as_of: datetime | None = None,
+    store: EventStore = Depends(get_event_store),
 ) -> dict[str, Any]:
+    if as_of is not None:
+        as_of = _require_timezone(as_of, path="as_of")
+    point_in_time = as_of_sequence is not None or as_of is not None
     try:
-        events = store.list_by_run_id(run_id)
-    except StorageReadError:
+        if point_in_time:
+            cached = load_run_status_as_of(
+                store, run_id, as_of_position=as_of_sequence, as_of=as_of
+            )
+        else:
+            cached = load_run_status(store, run_id)
+    except (StorageReadError, InconsistentRunStateError):
         raise
     except Exception as exc:  # pragma: no cover - defensive wrapper
         raise StorageReadError("storage backend read failed") from exc
 
-    if not events:
+    if cached is None:
         raise RunNotFoundError(run_id=run_id)
 
-    projection = project_run_status(events)
-    return {
+    projection = cached.projection
+    response = {
         "run_id": run_id,
         "status": projection.status,
         "pending_approval": projection.pending_approval,
     }
+    if point_in_time:
+        response["as_of_sequence"] = cached.position
+    return response
 
 
-@router.get("/v1/runs/{run_id}/journal", status_code=status.HTTP_200_OK)
-def get_run_journal(
-    run_id: str, store: EventStore = Depends(get_event_store)
+@router.post("/v1/runs/status:batch", status_code=status.HTTP_200_OK)
+def get_run_statuses(
+    payload: RunStatusBatchRequest, store: EventStore = Depends(get_event_store)
 ) -> dict[str, Any]:
+    run_ids = list(dict.fromkeys(payload.run_ids))
     try:
-        events = store.list_by_run_id(run_id)
+        statuses = load_run_statuses(store, run_ids)
     except StorageReadError:
         raise
     except Exception as exc:  # pragma: no cover - defensive wrapper
         raise StorageReadError("storage backend read failed") from exc
 
-    if not events:
+    runs: list[dict[str, Any]] = []
+    for run_id in run_ids:
+        cached = statuses[run_id]
+        if cached is None:
+            runs.append(
+                {
+                    "run_id": run_id,
+                    "found": False,
+                    "error": present_run_not_found_error(RunNotFoundError(run_id=run_id))["error"],
+                }
+            )
+            continue
+        if isinstance(cached, InconsistentRunStateError):
+            runs.append(
+                {
+                    "run_id": run_id,
+                    "found": True,
+                    "error": present_inconsistent_run_state_error(cached)["error"],
+                }
+            )
+            continue
+        projection = cached.projection
+        runs.append(
+            {
+                "run_id": run_id,
+                "found": True,
+                "status": projection.status,
+                "pending_approval": projection.pending_approval,
+            }
+        )
+    return {"run_count": len(runs), "runs": runs}
+
+
+@router.get("/v1/runs/{run_id}/journal", status_code=status.HTTP_200_OK)
+def get_run_journal(
+    run_id: str,
+    limit: int | None = Query(default=None, ge=1, le=_MAX_JOURNAL_PAGE_LIMIT),
+    cursor: str | None = None,
+    since_entry: str | None = None,
+    verify: JournalVerification = "trusted",
+    as_of_sequence: int | None = Query(default=None, ge=1),
+    as_of: datetime | None = None,
+    fields: str | None = None,
+    accept: str | None = Header(default=None),
+    store: EventStore = Depends(get_event_store),
+) -> Response:
+    selected = _journal_fields(fields)
+    if since_entry is not None and cursor is not None:
+        raise InvalidQueryParameterError(
+            path="since_entry",
+            message="since_entry cannot be combined with cursor",
+            code="CONFLICTING_PARAMETERS",
+        )
+    if as_of is not None:
+        as_of = _require_timezone(as_of, path="as_of")
+    after = decode_journal_cursor(cursor) if cursor is not None else None
+    delta = since_entry is not None or (after is not None and after.delta)
+    point_in_time = as_of_sequence is not None or as_of is not None
+    paged = delta or point_in_time or limit is not None or cursor is not None
+    since_index = None
+    if since_entry is not None:
+        since_index = parse_journal_entry_id(run_id=run_id, entry_id=since_entry)
+    try:
+        if paged:
+            projection = load_run_journal_page(
+                store,
+                run_id,
+                after=after,
+                since_index=since_index,
+                limit=limit if limit is not None else _DEFAULT_JOURNAL_PAGE_LIMIT,
+                delta=delta,
+                verification=verify,
+                as_of_position=as_of_sequence,
+                as_of=as_of,
+                fields=selected,
+            )
+        else:
+            projection = load_run_journal(store, run_id, verification=verify, fields=selected)
+    except (StorageReadError, InconsistentRunStateError, InvalidQueryParameterError):
+        raise
+    except Exception as exc:  # pragma: no cover - defensive wrapper
+        raise StorageReadError("storage backend read failed") from exc
+
+    if projection is None:
         raise RunNotFoundError(run_id=run_id)
-    projection = project_run_journal(run_id=run_id, events=events)
-    # Reuse run status projection as an approval-timeline consistency guard.
-    project_run_status(events)
-    return projection.to_dict()
+    return _journal_response(projection, header={"run_id": projection.run_id}, accept=accept)
+
+
+@router.get("/v1/workflows/{workflow}/journal", status_code=status.HTTP_200_OK)
+def get_workflow_journal(
+    workflow: str,
+    limit: int = Query(default=_DEFAULT_JOURNAL_PAGE_LIMIT, ge=1, le=_MAX_JOURNAL_PAGE_LIMIT),
+    cursor: str | None = None,
+    verify: JournalVerification = "trusted",
+    fields: str | None = None,
+    accept: str | None = Header(default=None),
+    store: EventStore = Depends(get_event_store),
+) -> Response:
+    selected = _journal_fields(fields)
+    after = decode_workflow_journal_cursor(cursor) if cursor is not None else None
+    try:
+        # Merged entries always keep the run_id they lead with.
+        projection = load_workflow_journal_page(
+            store, workflow, after=after, limit=limit, verification=verify, fields=selected
+        )
+    except (StorageReadError, InconsistentRunStateError):
+        raise
+    except Exception as exc:  # pragma: no cover - defensive wrapper
+        raise StorageReadError("storage backend read failed") from exc
+
+    return _journal_response(projection, header={"workflow": projection.workflow}, accept=accept)
+
+
+@router.get("/v1/metrics/projection-cache", status_code=status.HTTP_200_OK)
+def get_projection_cache_metrics() -> dict[str, Any]:
+    return projection_cache_metrics()
+
+
+@router.get("/v1/metrics/journal-entry-cache", status_code=status.HTTP_200_OK)
+def get_journal_entry_cache_metrics() -> dict[str, Any]:
+    return journal_entry_cache_metrics()
+
+
+@router.get("/v1/metrics/approval-latency", status_code=status.HTTP_200_OK)
+def get_approval_latency_metrics() -> dict[str, Any]:
+    return approval_latency_metrics()
 
 
 @router.get("/v1/approvals/pending", status_code=status.HTTP_200_OK)
-def get_pending_approvals(store: EventStore = Depends(get_event_store)) -> dict[str, Any]:
+def get_pending_approvals(
+    risk_level: RiskLevel | None = None,
+    requested_by: str | None = None,
+    run_id: str | None = None,
+    limit: int | None = Query(default=None, ge=1, le=_MAX_PENDING_PAGE_LIMIT),
+    cursor: str | None = None,
+    store: EventStore = Depends(get_event_store),
+) -> dict[str, Any]:
+    # Without limit or cursor the whole inbox is returned in one response.
+    if limit is None and cursor is not None:
+        limit = _DEFAULT_PENDING_PAGE_LIMIT
+    query = PendingApprovalQuery(
+        risk_level=risk_level,
+        requested_by=requested_by,
+        run_id=run_id,
+        after=decode_pending_approval_cursor(cursor) if cursor is not None else None,
+        limit=limit,
+    )
     try:
-        return list_pending_approvals(store)
+        return list_pending_approvals(store, query)
     except (StorageReadError, InconsistentRunStateError):
         raise
     except Exception as exc:  # pragma: no cover - defensive wrapper
@@ -491,6 +811,66 @@ def register_approval_request(
         raise StorageWriteError("storage backend append failed") from exc
 
 
+@router.post("/v1/approvals/decisions:batch", status_code=status.HTTP_200_OK)
+def resolve_approvals_by_decision_ids(
+    payload: ApprovalDecisionBatchRequest,
+    store: EventStore = Depends(get_event_store),
+) -> dict[str, Any]:
+    items = [
+        ApprovalDecisionBatchItem(
+            decision_id=item.decision_id,
+            decision=item.decision,
+            approver_id=item.approver_id,
+            reason=item.reason,
+        )
+        for item in payload.items
+    ]
+    for item in items:
+        _log_approval_resolution_requested(
+            event_id=item.decision_id,
+            decision=item.decision,
+            approver_id=item.approver_id,
+        )
+    try:
+        outcomes = resolve_pending_approvals_by_decision_ids(store=store, items=items)
+    except StorageReadError:
+        raise
+    except Exception as exc:  # pragma: no cover - defensive wrapper
+        raise StorageReadError("storage backend read failed") from exc
+
+    results: list[dict[str, Any]] = []
+    for index, item in enumerate(items):
+        # Outcomes come back in request order, one per item.
+        outcome = outcomes[index]
+        if isinstance(outcome, dict):
+            _log_approval_resolution_completed(
+                event_id=item.decision_id,
+                decision=item.decision,
+                approver_id=item.approver_id,
+                result=outcome,
+            )
+            results.append(outcome)
+            continue
+        _log_approval_resolution_failed(
+            event_id=item.decision_id,
+            decision=item.decision,
+            approver_id=item.approver_id,
+            exc=outcome,
+        )
+        results.append(
+            {
+                "decision_id": item.decision_id,
+                "status": "failed",
+                "error": _present_approval_resolution_error(outcome)["error"],
+            }
+        )
+    return {
+        "item_count": len(results),
+        "resolved_count": sum(1 for result in results if result["status"] == "resolved"),
+        "results": results,
+    }
+
+
 @router.post("/v1/approvals/{event_id}", status_code=status.HTTP_200_OK)
 def resolve_approval(
     event_id: str,
@@ -584,12 +964,21 @@ def resolve_approval_by_decision_id(
 
 
 @router.get("/v1/approvals/decisions/{decision_id}", status_code=status.HTTP_200_OK)
-def get_approval_by_decision_id(
+async def get_approval_by_decision_id(
     decision_id: str,
+    wait: float | None = Query(default=None, ge=0),
     store: EventStore = Depends(get_event_store),
 ) -> dict[str, Any]:
+    # Async so a parked long-poll does not pin a threadpool worker that the
+    # resolution it waits for would need.
     try:
-        return get_approval_decision_state(store=store, decision_id=decision_id)
+        if wait is None:
+            return await asyncio.to_thread(get_approval_decision_state, store=store, decision_id=decision_id)
+        return await wait_for_approval_decision_state(
+            store=store,
+            decision_id=decision_id,
+            timeout=min(wait, configured_decision_max_wait_seconds()),
+        )
     except (
         StorageReadError,
         ApprovalNotFoundError,
@@ -602,10 +991,11 @@ def get_approval_by_decision_id(
 @router.get("/v1/approvals/decisions/{decision_id}/audit-export", status_code=status.HTTP_200_OK)
 def get_decision_audit_export(
     decision_id: str,
+    proofs: bool = Query(default=False),
     store: EventStore = Depends(get_event_store),
 ) -> dict[str, Any]:
     try:
-        return export_decision_audit(store=store, decision_id=decision_id)
+        return export_decision_audit(store=store, decision_id=decision_id, include_proofs=proofs)
     except (
         StorageReadError,
         ApprovalNotFoundError,
@@ -616,6 +1006,29 @@ def get_decision_audit_export(
         raise StorageReadError("storage backend read failed") from exc
 
 
+@router.get("/v1/approvals/decisions:audit-export", status_code=status.HTTP_200_OK)
+def stream_decision_audit_export(
+    since: datetime | None = None,
+    until: datetime | None = None,
+    run_id: str | None = None,
+    status_filter: ApprovalStatus | None = Query(default=None, alias="status"),
+    store: EventStore = Depends(get_event_store),
+) -> StreamingResponse:
+    query = DecisionAuditQuery(
+        since=_require_timezone(since, path="since") if since is not None else None,
+        until=_require_timezone(until, path="until") if until is not None else None,
+        run_id=run_id,
+        status=status_filter,
+    )
+    # Records are serialized as the store is walked, so the client sees the
+    # first decisions before later runs are read.
+    lines = (
+        json.dumps(record, separators=(",", ":")) + "\n"
+        for record in iter_decision_audit_records(store=store, query=query)
+    )
+    return StreamingResponse(lines, media_type=_NDJSON_MEDIA_TYPE)
+
+
 @router.post("/v1/executors/purchase.create", status_code=status.HTTP_200_OK)
 def execute_purchase_create(
     payload: PurchaseCreateExecutionRequest,
@@ -767,16 +1180,72 @@ def _build_run_facts(*, store: EventStore, context: AuthorizeActionContext) -> R
     run_id = _context_extra_value(context=context, key="run_id")
     if not isinstance(run_id, str) or run_id.strip() == "":
         return RunFacts(event_count=0, has_pending_approval=False)
-    events = store.list_by_run_id(run_id.strip())
-    if not events:
+    cached = load_run_status(store, run_id.strip())
+    if cached is None:
         return RunFacts(event_count=0, has_pending_approval=False)
-    status = project_run_status(events)
     return RunFacts(
-        event_count=len(events),
-        has_pending_approval=status.pending_approval is not None,
+        event_count=cached.event_count,
+        has_pending_approval=cached.projection.pending_approval is not None,
     )
 
 
+def _journal_response(
+    projection: RenderedRunJournal | RenderedWorkflowJournal,
+    *,
+    header: dict[str, Any],
+    accept: str | None,
+) -> Response:
+    if not accepts_columnar(accept):
+        return Response(
+            content=projection.to_json_bytes(),
+            media_type="application/json",
+            headers={"Vary": "Accept"},
+        )
+    rows = [json.loads(fragment) for fragment in projection.fragments]
+    return _columnar_response(header=header, rows=rows, count_key="entry_count", extra=projection.extra)
+
+
+def _columnar_response(
+    *,
+    header: dict[str, Any],
+    rows: list[dict[str, Any]],
+    count_key: str,
+    extra: dict[str, Any],
+) -> Response:
+    body = present_columnar(header=header, rows=rows, count_key=count_key, extra=extra)
+    return Response(
+        content=encode_json(body),
+        media_type=COLUMNAR_MEDIA_TYPE,
+        headers={"Vary": "Accept"},
+    )
+
+
+def _journal_fields(fields: str | None) -> tuple[str, ...] | None:
+    if fields is None:
+        return None
+    return parse_fields(fields, allowed=JOURNAL_ENTRY_FIELDS, nested=JOURNAL_ENTRY_NESTED_FIELDS)
+
+
+def _event_row(event: StoredEvent) -> dict[str, Any]:
+    return {
+        "id": event.id,
+        "timestamp": event.timestamp,
+        "run_id": event.run_id,
+        "payload": event.payload,
+        "integrity_warning": event.integrity_warning,
+    }
+
+
+def _require_timezone(value: datetime, *, path: str) -> datetime:
+    if value.tzinfo is None or value.utcoffset() is None:
+        raise InvalidQueryParameterError(
+            path=path,
+            message=f"{path} must include timezone information",
+            code="MISSING_TIMEZONE",
+        )
+    return value.astimezone(timezone.utc)
+
+
 def _context_extra_value(*, context: AuthorizeActionContext, key: str) -> Any:
     extras = getattr(context, "model_extra", None)
     if isinstance(extras, dict):
@@ -1,10 +1,18 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI, Request, status
 from fastapi.exception_handlers import request_validation_exception_handler
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from nightledger_api.controllers.events_controller import router as events_router
+from nightledger_api.controllers.events_controller import (
+    add_event_store_reset_listener,
+    get_event_store,
+    remove_event_store_reset_listener,
+    router as events_router,
+)
 from nightledger_api.presenters.error_presenter import (
     present_authorize_action_request_validation_error,
     present_ambiguous_event_id_error,
@@ -13,6 +21,7 @@ from nightledger_api.presenters.error_presenter import (
     present_duplicate_approval_error,
     present_duplicate_event_error,
     present_inconsistent_run_state_error,
+    present_invalid_query_parameter_error,
     present_no_pending_approval_error,
     present_approval_request_validation_error,
     present_run_not_found_error,
@@ -39,6 +48,7 @@ from nightledger_api.services.errors import (
     DuplicateApprovalError,
     DuplicateEventError,
     InconsistentRunStateError,
+    InvalidQueryParameterError,
     NoPendingApprovalError,
     RunNotFoundError,
     SchemaValidationError,
@@ -57,6 +67,7 @@ from nightledger_api.services.errors import (
     RuleInputError,
     PolicyCatalogVersionMismatchError,
 )
+from nightledger_api.services.expiry_scheduler import configured_expiry_scheduler
 
 
 HTTP_422_UNPROCESSABLE = getattr(status, "HTTP_422_UNPROCESSABLE_CONTENT", None)
@@ -65,7 +76,22 @@ if HTTP_422_UNPROCESSABLE is None:
 SCHEMA_VALIDATION_STATUS_CODE = HTTP_422_UNPROCESSABLE
 
 
-app = FastAPI(title="NightLedger API", version="0.1.0")
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    scheduler = configured_expiry_scheduler(get_event_store())
+    if scheduler is not None:
+        scheduler.start()
+        # The demo reset-seed swaps the store; deadlines follow the new one.
+        add_event_store_reset_listener(scheduler.rebind)
+    try:
+        yield
+    finally:
+        if scheduler is not None:
+            remove_event_store_reset_listener(scheduler.rebind)
+            scheduler.stop()
+
+
+app = FastAPI(title="NightLedger API", version="0.1.0", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[
@@ -175,6 +201,17 @@ async def handle_inconsistent_run_state_error(
     )
 
 
+@app.exception_handler(InvalidQueryParameterError)
+async def handle_invalid_query_parameter_error(
+    request: Request, exc: InvalidQueryParameterError
+) -> JSONResponse:
+    _ = request
+    return JSONResponse(
+        status_code=HTTP_422_UNPROCESSABLE,
+        content=present_invalid_query_parameter_error(exc),
+    )
+
+
 @app.exception_handler(ApprovalNotFoundError)
 async def handle_approval_not_found_error(
     request: Request, exc: ApprovalNotFoundError
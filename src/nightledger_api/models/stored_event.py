@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+@dataclass(frozen=True)
+class StoredEvent:
+    id: str
+    timestamp: datetime
+    run_id: str
+    payload: dict[str, Any]
+    integrity_warning: bool = False
+    prev_hash: str | None = None
+    hash: str = ""
+    # Set by the stores for events written from a schema-validated EventPayload;
+    # trusted reads skip per-event checks that this already guarantees.
+    validated: bool = False
+    # Insertion order within the store; each run's hash chain links events in
+    # this order, which differs from timestamp order for integrity_warning
+    # events. 0 when the source does not track it.
+    sequence: int = 0
+
+
+@dataclass(frozen=True)
+class ChainCheckpoint:
+    """A run's hash chain, verified through the event at sequence."""
+
+    run_id: str
+    sequence: int
+    hash: str
@@ -0,0 +1,90 @@
+import os
+from typing import Any
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.nightledger.columnar+json"
+
+
+def accepts_columnar(accept: str | None) -> bool:
+    """Return True when the Accept header asks for the columnar representation."""
+    if not accept:
+        return False
+    for media_range in accept.split(","):
+        media_type, *params = (part.strip() for part in media_range.split(";"))
+        if media_type.lower() != COLUMNAR_MEDIA_TYPE:
+            continue
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q" and _quality(value) == 0:
+                break
+        else:
+            return True
+    return False
+
+
+def present_columnar(
+    *, header: dict[str, Any], rows: list[dict[str, Any]], count_key: str, extra: dict[str, Any]
+) -> dict[str, Any]:
+    """Transpose rows into per-column arrays with interned strings.
+
+    Nested objects are flattened into dotted column names; a key missing from
+    a row reads as null. Columns holding only strings (and nulls) are interned:
+    each value is an index into the shared strings table, after stripping the
+    column prefix common to every value. Decoding a value is
+    prefix + strings[index]. Other columns keep their JSON values.
+    """
+    flat_rows = [_flatten(row) for row in rows]
+    names: dict[str, None] = {}
+    for flat in flat_rows:
+        names.update(dict.fromkeys(flat))
+
+    strings: list[str] = []
+    string_index: dict[str, int] = {}
+    columns: dict[str, dict[str, Any]] = {}
+    for name in names:
+        values = [flat.get(name) for flat in flat_rows]
+        present = [value for value in values if value is not None]
+        if not present or not all(isinstance(value, str) for value in present):
+            columns[name] = {"values": values}
+            continue
+        prefix = os.path.commonprefix(present) if len(present) > 1 else ""
+        indexes: list[int | None] = []
+        for value in values:
+            if value is None:
+                indexes.append(None)
+                continue
+            suffix = value[len(prefix) :]
+            index = string_index.get(suffix)
+            if index is None:
+                index = string_index[suffix] = len(strings)
+                strings.append(suffix)
+            indexes.append(index)
+        column: dict[str, Any] = {"interned": True, "values": indexes}
+        if prefix:
+            column["prefix"] = prefix
+        columns[name] = column
+
+    return {
+        **header,
+        count_key: len(rows),
+        "strings": strings,
+        "columns": columns,
+        **extra,
+    }
+
+
+def _flatten(row: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    flat: dict[str, Any] = {}
+    for key, value in row.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            flat.update(_flatten(value, f"{name}."))
+        else:
+            flat[name] = value
+    return flat
+
+
+def _quality(value: str) -> float:
+    try:
+        return float(value.strip())
+    except ValueError:
+        return 1.0
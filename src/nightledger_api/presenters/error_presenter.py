@@ -9,6 +9,7 @@ from nightledger_api.services.errors import (
     DuplicateApprovalError,
     DuplicateEventError,
     InconsistentRunStateError,
+    InvalidQueryParameterError,
     NoPendingApprovalError,
     RunNotFoundError,
     SchemaValidationError,
@@ -134,6 +135,23 @@ def present_run_not_found_error(exc: RunNotFoundError) -> dict[str, Any]:
     }
 
 
+def present_invalid_query_parameter_error(exc: InvalidQueryParameterError) -> dict[str, Any]:
+    return {
+        "error": {
+            "code": "INVALID_QUERY_PARAMETER",
+            "message": "Query parameter failed validation",
+            "details": [
+                {
+                    "path": exc.path,
+                    "message": str(exc),
+                    "type": "value_error",
+                    "code": exc.code,
+                }
+            ],
+        }
+    }
+
+
 def present_inconsistent_run_state_error(exc: InconsistentRunStateError) -> dict[str, Any]:
     return {
         "error": {
@@ -521,12 +539,14 @@ def present_policy_catalog_version_mismatch_error(
 
 
 def _map_approval_validation_code(*, path: str, error_type: str) -> str:
-    if path == "decision":
+    # Batch items (items.<n>.decision) map like the single-decision body.
+    field = path.rsplit(".", 1)[-1]
+    if field == "decision":
         if error_type == "missing":
             return "MISSING_APPROVAL_DECISION"
         return "INVALID_APPROVAL_DECISION"
 
-    if path == "approver_id":
+    if field == "approver_id":
         if error_type in {"missing", "string_too_short"}:
             return "MISSING_APPROVER_ID"
         return "INVALID_APPROVER_ID"
@@ -1,9 +1,14 @@
+import asyncio
+from collections import Counter, defaultdict
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 from math import ceil
 from time import perf_counter
 from typing import Any, Literal
 from uuid import uuid4
 
+from nightledger_api.models.event_schema import EventPayload
+from nightledger_api.services.decision_waiters import park_decision, watch_decision_store
 from nightledger_api.services.errors import (
     AmbiguousEventIdError,
     ApprovalNotFoundError,
@@ -14,53 +19,71 @@ from nightledger_api.services.errors import (
 )
 from nightledger_api.services.event_ingest_service import validate_event_payload
 from nightledger_api.services.event_store import EventStore, StoredEvent
-from nightledger_api.services.run_status_service import project_run_status
+from nightledger_api.services.latency_metrics import ApprovalLatencyMetrics
+from nightledger_api.services.run_catalog_service import (
+    PendingApprovalQuery,
+    RunCatalogQuery,
+    encode_pending_approval_cursor,
+    inconsistency_error,
+)
+from nightledger_api.services.run_status_service import RunStatusProjection, project_run_status
+from nightledger_api.services.run_write_locks import run_write_lock
 
 ApprovalDecision = Literal["approved", "rejected"]
 _TRIAGE_INBOX_DEMO_RUN_ID = "run_triage_inbox_demo_1"
 _TRIAGE_INBOX_DEMO_APPROVAL_EVENT_ID = "evt_triage_inbox_003"
 _MVP_APPROVAL_TO_STATE_UPDATE_TARGET_MS = 1000
+_APPROVAL_LATENCY = ApprovalLatencyMetrics(target_ms=_MVP_APPROVAL_TO_STATE_UPDATE_TARGET_MS)
+ApprovalResolutionError = (
+    ApprovalNotFoundError
+    | AmbiguousEventIdError
+    | NoPendingApprovalError
+    | DuplicateApprovalError
+    | InconsistentRunStateError
+    | StorageWriteError
+)
 
 
-def list_pending_approvals(store: EventStore) -> dict[str, Any]:
-    all_events = store.list_all()
-    run_ids = sorted({event.run_id for event in all_events})
-    approvals: list[dict[str, Any]] = []
+@dataclass(frozen=True)
+class ApprovalDecisionBatchItem:
+    decision_id: str
+    decision: ApprovalDecision
+    approver_id: str
+    reason: str | None = None
 
-    for run_id in run_ids:
-        run_events = store.list_by_run_id(run_id)
-        projection = project_run_status(run_events)
-        pending_context = projection.pending_approval
-        if projection.status != "paused" or pending_context is None:
-            continue
 
-        pending_event_id = pending_context["event_id"]
-        pending_event = _find_event_by_id(run_events, pending_event_id)
-        if pending_event is None:
-            raise InconsistentRunStateError(
-                detail_path="approval",
-                detail_message="pending approval event not found in run timeline",
-                detail_code="MISSING_PENDING_EVENT",
-                detail_type="state_conflict",
-            )
+def list_pending_approvals(store: EventStore, query: PendingApprovalQuery | None = None) -> dict[str, Any]:
+    query = query if query is not None else PendingApprovalQuery(limit=None)
+    _raise_for_inconsistent_run(store, query)
+    # One extra entry tells us whether another page exists.
+    entries = store.list_pending_approvals(
+        replace(query, limit=query.limit + 1) if query.limit is not None else query
+    )
+    if query.limit is None and query.after is None:
+        pending_count = len(entries)
+    else:
+        pending_count = store.count_pending_approvals(query)
+
+    page = entries if query.limit is None else entries[: query.limit]
+    has_more = query.limit is not None and len(entries) > query.limit
+    return {
+        "pending_count": pending_count,
+        "page_count": len(page),
+        "approvals": [entry.to_dict() for entry in page],
+        "next_cursor": encode_pending_approval_cursor(page[-1]) if has_more else None,
+    }
 
-        payload = pending_event.payload
-        approvals.append(
-            {
-                "event_id": pending_event.id,
-                "decision_id": payload.get("approval", {}).get("decision_id"),
-                "run_id": pending_event.run_id,
-                "requested_at": pending_context["requested_at"],
-                "requested_by": pending_context["requested_by"],
-                "title": payload.get("title"),
-                "details": payload.get("details"),
-                "reason": pending_context["reason"],
-                "risk_level": payload.get("risk_level"),
-            }
-        )
 
-    approvals.sort(key=lambda item: (item["requested_at"], item["event_id"]))
-    return {"pending_count": len(approvals), "approvals": approvals}
+def _raise_for_inconsistent_run(store: EventStore, query: PendingApprovalQuery) -> None:
+    # An inconsistent run may hide a pending request, so the inbox keeps
+    # failing loudly for it; the catalog records the first conflict.
+    inconsistent = store.list_runs(
+        RunCatalogQuery(inconsistent_only=True, limit=None if query.run_id is not None else 1)
+    )
+    for entry in inconsistent:
+        if query.run_id is None or entry.run_id == query.run_id:
+            assert entry.inconsistency is not None  # pragma: no cover - set whenever the fold stops
+            raise inconsistency_error(entry.inconsistency)
 
 
 def register_pending_approval_request(
@@ -163,31 +186,20 @@ def resolve_pending_approval(
         raise AmbiguousEventIdError(event_id=event_id)
 
     target_event = matches[0]
-    run_events = store.list_by_run_id(target_event.run_id)
-
-    if not _is_pending_signal(target_event):
-        raise NoPendingApprovalError(event_id=event_id)
-
-    if _was_event_resolved(run_events, event_id):
-        raise DuplicateApprovalError(event_id=event_id)
-
-    projection = project_run_status(run_events)
-
-    pending_context = projection.pending_approval
-    if projection.status == "paused" and pending_context is not None:
-        if pending_context.get("event_id") == event_id:
-            return _append_resolution_event(
-                store=store,
-                target_event=target_event,
-                run_events=run_events,
-                initial_run_status=projection.status,
-                decision=decision,
-                approver_id=approver_id,
-                reason=reason,
-            )
-        raise NoPendingApprovalError(event_id=event_id)
-
-    raise NoPendingApprovalError(event_id=event_id)
+    # The expiry scheduler settles pending approvals too; the run's lock keeps
+    # the pending check and the resolution append together.
+    with run_write_lock(target_event.run_id):
+        run_events = store.list_by_run_id(target_event.run_id)
+        initial_run_status = _require_pending_target(run_events=run_events, target_event=target_event)
+        return _append_resolution_event(
+            store=store,
+            target_event=target_event,
+            run_events=run_events,
+            initial_run_status=initial_run_status,
+            decision=decision,
+            approver_id=approver_id,
+            reason=reason,
+        )
 
 
 def resolve_pending_approval_by_decision_id(
@@ -204,16 +216,7 @@ def resolve_pending_approval_by_decision_id(
         for event in all_events
         if event.payload.get("approval", {}).get("decision_id") == decision_id
     ]
-    if not decision_events:
-        raise ApprovalNotFoundError(event_id=decision_id, detail_path="decision_id")
-
-    pending_events = [event for event in decision_events if _is_pending_signal(event)]
-    if len(pending_events) > 1:
-        raise AmbiguousEventIdError(event_id=decision_id)
-    if not pending_events:
-        raise NoPendingApprovalError(event_id=decision_id)
-
-    target_event = pending_events[0]
+    target_event = _decision_target(decision_id=decision_id, decision_events=decision_events)
     result = resolve_pending_approval(
         store=store,
         event_id=target_event.id,
@@ -225,6 +228,143 @@ def resolve_pending_approval_by_decision_id(
     return result
 
 
+def resolve_pending_approvals_by_decision_ids(
+    *, store: EventStore, items: list[ApprovalDecisionBatchItem]
+) -> list[dict[str, Any] | ApprovalResolutionError]:
+    """Resolve several approvals by decision_id.
+
+    Items are matched against one read of the history, and each run's
+    resolutions are appended with a single append_batch, so a failed write
+    only fails the items of that run. Every item gets either the result
+    resolve_pending_approval_by_decision_id would return or the error it
+    would raise, in request order.
+    """
+    wanted = {item.decision_id for item in items}
+    decision_events: dict[str, list[StoredEvent]] = defaultdict(list)
+    event_id_counts: Counter[str] = Counter()
+    for event in store.list_all():
+        event_id_counts[event.id] += 1
+        decision_id = event.payload.get("approval", {}).get("decision_id")
+        if decision_id in wanted:
+            decision_events[decision_id].append(event)
+
+    results: list[dict[str, Any] | ApprovalResolutionError | None] = [None] * len(items)
+    targets_by_run: dict[str, list[tuple[int, StoredEvent]]] = defaultdict(list)
+    for index, item in enumerate(items):
+        try:
+            target_event = _decision_target(
+                decision_id=item.decision_id,
+                decision_events=decision_events.get(item.decision_id, []),
+            )
+            if event_id_counts[target_event.id] > 1:
+                raise AmbiguousEventIdError(event_id=target_event.id)
+        except (ApprovalNotFoundError, AmbiguousEventIdError, NoPendingApprovalError) as exc:
+            results[index] = exc
+            continue
+        targets_by_run[target_event.run_id].append((index, target_event))
+
+    with run_write_lock(*targets_by_run):
+        events_by_run = store.list_by_run_ids(list(targets_by_run))
+        for run_id, targets in targets_by_run.items():
+            _resolve_run_targets(
+                store=store,
+                run_events=events_by_run.get(run_id, []),
+                targets=targets,
+                items=items,
+                results=results,
+            )
+    return [result for result in results if result is not None]
+
+
+def _resolve_run_targets(
+    *,
+    store: EventStore,
+    run_events: list[StoredEvent],
+    targets: list[tuple[int, StoredEvent]],
+    items: list[ApprovalDecisionBatchItem],
+    results: list[dict[str, Any] | ApprovalResolutionError | None],
+) -> None:
+    started_at = perf_counter()
+    # Later items of the same run are checked against the resolutions staged
+    # before them, exactly as if they had been sent one request at a time.
+    timeline = list(run_events)
+    staged: list[tuple[int, StoredEvent, str, EventPayload]] = []
+    for index, target_event in targets:
+        item = items[index]
+        try:
+            initial_run_status = _require_pending_target(run_events=timeline, target_event=target_event)
+        except (DuplicateApprovalError, NoPendingApprovalError, InconsistentRunStateError) as exc:
+            results[index] = exc
+            continue
+        payload = _build_resolution_payload(
+            target_event=target_event,
+            run_events=timeline,
+            decision=item.decision,
+            approver_id=item.approver_id,
+            reason=item.reason,
+        )
+        timeline.append(
+            StoredEvent(
+                id=payload.id,
+                timestamp=payload.timestamp,
+                run_id=payload.run_id,
+                payload=payload.model_dump(mode="json"),
+            )
+        )
+        staged.append((index, target_event, initial_run_status, payload))
+    if not staged:
+        return
+
+    try:
+        stored_events = store.append_batch([payload for _, _, _, payload in staged])
+    except StorageWriteError as exc:
+        for index, _, _, _ in staged:
+            results[index] = exc
+        return
+    except Exception as exc:  # pragma: no cover - defensive wrapper
+        failure = StorageWriteError("storage backend append failed")
+        failure.__cause__ = exc
+        for index, _, _, _ in staged:
+            results[index] = failure
+        return
+
+    orchestration: dict[int, list[str]] = {}
+    for (index, target_event, _, _), stored in zip(staged, stored_events):
+        try:
+            orchestration[index] = _apply_resolution_orchestration(
+                store=store,
+                target_event=target_event,
+                decision=items[index].decision,
+                resolved_at=stored.timestamp,
+            )
+        except StorageWriteError as exc:
+            results[index] = exc
+
+    run_events = store.list_by_run_id(staged[0][1].run_id)
+    try:
+        projection = project_run_status(run_events)
+    except InconsistentRunStateError as exc:
+        for index, _, _, _ in staged:
+            results[index] = exc
+        return
+    approval_to_state_update_ms = _elapsed_ms_ceiling(started_at, perf_counter())
+    for (index, target_event, initial_run_status, _), stored in zip(staged, stored_events):
+        if index not in orchestration:
+            continue
+        result = _resolution_result(
+            stored=stored,
+            target_event=target_event,
+            run_events=run_events,
+            projection=projection,
+            initial_run_status=initial_run_status,
+            decision=items[index].decision,
+            orchestration_event_ids=orchestration[index],
+            approval_to_state_update_ms=approval_to_state_update_ms,
+        )
+        result["decision_id"] = items[index].decision_id
+        results[index] = result
+
+
 def get_approval_decision_state(*, store: EventStore, decision_id: str) -> dict[str, Any]:
     decision_events = [
         event
@@ -250,9 +390,15 @@ def get_approval_decision_state(*, store: EventStore, decision_id: str) -> dict[
         if _is_resolution_signal(event):
             resolved_event = event
 
+    expired = False
+    if resolved_event is None:
+        # An approval closed by the expiry scheduler reads as expired.
+        resolved_event = next((event for event in decision_events if _is_expiry_signal(event)), None)
+        expired = resolved_event is not None
+
     anchor_event = resolved_event or requested_event or lifecycle_events[-1]
     approval_payload = anchor_event.payload.get("approval", {})
-    status = approval_payload.get("status")
+    status = "expired" if expired else approval_payload.get("status")
 
     return {
         "decision_id": decision_id,
@@ -261,7 +407,9 @@ def get_approval_decision_state(*, store: EventStore, decision_id: str) -> dict[
         "requested_event_id": requested_event.id if requested_event is not None else None,
         "resolved_event_id": resolved_event.id if resolved_event is not None else None,
         "requested_at": _format_timestamp(requested_event.timestamp) if requested_event is not None else None,
-        "resolved_at": approval_payload.get("resolved_at"),
+        "resolved_at": (
+            _format_timestamp(anchor_event.timestamp) if expired else approval_payload.get("resolved_at")
+        ),
         "requested_by": (
             requested_event.payload.get("approval", {}).get("requested_by")
             if requested_event is not None
@@ -272,6 +420,30 @@ def get_approval_decision_state(*, store: EventStore, decision_id: str) -> dict[
     }
 
 
+def approval_latency_metrics() -> dict[str, Any]:
+    return _APPROVAL_LATENCY.metrics()
+
+
+async def wait_for_approval_decision_state(
+    *, store: EventStore, decision_id: str, timeout: float
+) -> dict[str, Any]:
+    """Long-poll variant of get_approval_decision_state.
+
+    While the decision is pending, park for up to timeout seconds until an
+    append to store in this process touches the decision, then return the
+    state as of then. Store reads run in worker threads; the wait itself
+    holds none.
+    """
+    watch_decision_store(store)
+    with park_decision(decision_id) as ticket:
+        state = await asyncio.to_thread(get_approval_decision_state, store=store, decision_id=decision_id)
+        if state["status"] != "pending" or timeout <= 0:
+            return state
+        if not await ticket.wait(timeout):
+            return state
+    return await asyncio.to_thread(get_approval_decision_state, store=store, decision_id=decision_id)
+
+
 def _append_resolution_event(
     *,
     store: EventStore,
@@ -283,6 +455,81 @@ def _append_resolution_event(
     reason: str | None,
 ) -> dict[str, Any]:
     started_at = perf_counter()
+    payload = _build_resolution_payload(
+        target_event=target_event,
+        run_events=run_events,
+        decision=decision,
+        approver_id=approver_id,
+        reason=reason,
+    )
+    try:
+        stored = store.append(payload)
+    except StorageWriteError:
+        raise
+    except Exception as exc:  # pragma: no cover - defensive wrapper
+        raise StorageWriteError("storage backend append failed") from exc
+
+    orchestration_event_ids = _apply_resolution_orchestration(
+        store=store,
+        target_event=target_event,
+        decision=decision,
+        resolved_at=stored.timestamp,
+    )
+    run_events = store.list_by_run_id(target_event.run_id)
+    projection = project_run_status(run_events)
+    return _resolution_result(
+        stored=stored,
+        target_event=target_event,
+        run_events=run_events,
+        projection=projection,
+        initial_run_status=initial_run_status,
+        decision=decision,
+        orchestration_event_ids=orchestration_event_ids,
+        approval_to_state_update_ms=_elapsed_ms_ceiling(started_at, perf_counter()),
+    )
+
+
+def _decision_target(*, decision_id: str, decision_events: list[StoredEvent]) -> StoredEvent:
+    if not decision_events:
+        raise ApprovalNotFoundError(event_id=decision_id, detail_path="decision_id")
+
+    pending_events = [event for event in decision_events if _is_pending_signal(event)]
+    if len(pending_events) > 1:
+        raise AmbiguousEventIdError(event_id=decision_id)
+    if not pending_events:
+        raise NoPendingApprovalError(event_id=decision_id)
+    return pending_events[0]
+
+
+def _require_pending_target(*, run_events: list[StoredEvent], target_event: StoredEvent) -> str:
+    """Return the run status before resolving target_event, or raise why it cannot be resolved."""
+    event_id = target_event.id
+    if not _is_pending_signal(target_event):
+        raise NoPendingApprovalError(event_id=event_id)
+
+    if _was_event_resolved(run_events, event_id):
+        raise DuplicateApprovalError(event_id=event_id)
+
+    projection = project_run_status(run_events)
+
+    pending_context = projection.pending_approval
+    if (
+        projection.status != "paused"
+        or pending_context is None
+        or pending_context.get("event_id") != event_id
+    ):
+        raise NoPendingApprovalError(event_id=event_id)
+    return projection.status
+
+
+def _build_resolution_payload(
+    *,
+    target_event: StoredEvent,
+    run_events: list[StoredEvent],
+    decision: ApprovalDecision,
+    approver_id: str,
+    reason: str | None,
+) -> EventPayload:
     now = datetime.now(timezone.utc)
     latest_run_timestamp = max(event.timestamp for event in run_events)
     min_resolution_time = latest_run_timestamp + timedelta(milliseconds=1)
@@ -319,44 +566,63 @@ def _append_resolution_event(
         "evidence": [],
         "meta": {"workflow": "approval_gate", "step": meta_step},
     }
+    return validate_event_payload(payload_dict)
 
-    payload = validate_event_payload(payload_dict)
-    try:
-        stored = store.append(payload)
-    except StorageWriteError:
-        raise
-    except Exception as exc:  # pragma: no cover - defensive wrapper
-        raise StorageWriteError("storage backend append failed") from exc
 
-    orchestration_event_ids: list[str] = []
-    if (
+def _apply_resolution_orchestration(
+    *,
+    store: EventStore,
+    target_event: StoredEvent,
+    decision: ApprovalDecision,
+    resolved_at: datetime,
+) -> list[str]:
+    if not (
         decision == "approved"
         and target_event.run_id == _TRIAGE_INBOX_DEMO_RUN_ID
         and target_event.id == _TRIAGE_INBOX_DEMO_APPROVAL_EVENT_ID
     ):
-        try:
-            orchestration_event_ids = _append_triage_inbox_completion_events(
-                store=store,
-                run_id=target_event.run_id,
-                resolved_at=stored.timestamp,
-                confidence=target_event.payload.get("confidence"),
-            )
-        except StorageWriteError as exc:
-            _append_triage_inbox_orchestration_error_event(
-                store=store,
-                run_id=target_event.run_id,
-                resolved_at=stored.timestamp,
-                details=str(exc),
-            )
-            raise
-    run_events = store.list_by_run_id(target_event.run_id)
-    projection = project_run_status(run_events)
-    approval_to_state_update_ms = _elapsed_ms_ceiling(started_at, perf_counter())
+        return []
+    try:
+        return _append_triage_inbox_completion_events(
+            store=store,
+            run_id=target_event.run_id,
+            resolved_at=resolved_at,
+            confidence=target_event.payload.get("confidence"),
+        )
+    except StorageWriteError as exc:
+        _append_triage_inbox_orchestration_error_event(
+            store=store,
+            run_id=target_event.run_id,
+            resolved_at=resolved_at,
+            details=str(exc),
+        )
+        raise
+
+
+def _resolution_result(
+    *,
+    stored: StoredEvent,
+    target_event: StoredEvent,
+    run_events: list[StoredEvent],
+    projection: RunStatusProjection,
+    initial_run_status: str,
+    decision: ApprovalDecision,
+    orchestration_event_ids: list[str],
+    approval_to_state_update_ms: int,
+) -> dict[str, Any]:
     orchestration_receipt_gap_ms = _orchestration_receipt_gap_ms(
         run_events=run_events,
         resolution_event_id=stored.id,
         orchestration_event_ids=orchestration_event_ids,
     )
+    _APPROVAL_LATENCY.record_resolution(
+        approval_to_state_update_ms=approval_to_state_update_ms,
+        orchestration_receipt_gap_ms=orchestration_receipt_gap_ms,
+        request_to_resolution_ms=_elapsed_ms_ceiling(
+            target_event.timestamp.timestamp(), stored.timestamp.timestamp()
+        ),
+        risk_level=target_event.payload.get("risk_level"),
+    )
 
     return {
         "status": "resolved",
@@ -364,7 +630,7 @@ def _append_resolution_event(
         "target_event_id": target_event.id,
         "run_id": target_event.run_id,
         "decision": decision,
-        "resolved_at": resolved_at,
+        "resolved_at": _format_timestamp(stored.timestamp),
         "run_status": projection.status,
         "orchestration": {
             "applied": bool(orchestration_event_ids),
@@ -567,11 +833,9 @@ def _is_resolution_signal(event: StoredEvent) -> bool:
     )
 
 
-def _find_event_by_id(events: list[StoredEvent], event_id: str) -> StoredEvent | None:
-    for event in events:
-        if event.id == event_id:
-            return event
-    return None
+def _is_expiry_signal(event: StoredEvent) -> bool:
+    meta = event.payload.get("meta")
+    return isinstance(meta, dict) and meta.get("step") == "approval_expired"
 
 
 def _build_resolution_event_id(
@@ -1,11 +1,41 @@
+import logging
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterator
 
+from nightledger_api.services.chain_verification import list_run_chain, verify_run_chain
 from nightledger_api.services.errors import ApprovalNotFoundError, InconsistentRunStateError
-from nightledger_api.services.event_store import EventStore, StoredEvent, _build_event_hash
+from nightledger_api.services.event_store import EventStore, StoredEvent
+from nightledger_api.services.merkle_tree import MerkleFrontier, MerkleSnapshot, build_frontier
+from nightledger_api.services.run_catalog_service import RunCatalogQuery
 
+logger = logging.getLogger(__name__)
 
-def export_decision_audit(*, store: EventStore, decision_id: str) -> dict[str, Any]:
+_AUDIT_RUN_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class DecisionAuditQuery:
+    # Decisions whose first event falls in [since, until).
+    since: datetime | None = None
+    until: datetime | None = None
+    run_id: str | None = None
+    # Approval status of the decision's latest event.
+    status: str | None = None
+
+    def matches(self, *, started_at: datetime, status: str | None) -> bool:
+        if self.since is not None and started_at < self.since:
+            return False
+        if self.until is not None and started_at >= self.until:
+            return False
+        if self.status is not None and status != self.status:
+            return False
+        return True
+
+
+def export_decision_audit(
+    *, store: EventStore, decision_id: str, include_proofs: bool = False
+) -> dict[str, Any]:
     matching_events = [
         event
         for event in store.list_all()
@@ -24,53 +54,163 @@ def export_decision_audit(*, store: EventStore, decision_id: str) -> dict[str, A
         )
 
     run_id = run_ids[0]
-    run_events = store.list_by_run_id(run_id)
-    _verify_hash_chain(events=run_events)
+    verify_run_chain(store=store, run_id=run_id)
+    leaf_index_by_event_id: dict[str, int] = {}
+    snapshot: MerkleSnapshot | None = None
+    if include_proofs:
+        # The chain is read after the stored tree head and cut to its size,
+        # so the proofs are against that head even while the run keeps growing.
+        tree = store.merkle_head(run_id)
+        chain = list_run_chain(store=store, run_id=run_id)
+        if tree is not None:
+            chain = chain[: tree.size]
+        snapshot = MerkleSnapshot([event.hash for event in chain])
+        if tree is None:
+            tree = build_frontier(run_id=run_id, event_hashes=[event.hash for event in chain])
+        elif snapshot.size != tree.size or snapshot.root != tree.root:
+            raise InconsistentRunStateError(
+                detail_path="merkle.root",
+                detail_message="stored merkle root does not match the run's hash chain",
+                detail_code="MERKLE_ROOT_MISMATCH",
+                detail_type="state_conflict",
+            )
+        leaf_index_by_event_id = {event.id: index for index, event in enumerate(chain)}
+        run_events = sorted(chain, key=lambda event: (event.timestamp, event.sequence))
+    else:
+        tree = store.merkle_head(run_id)
+        run_events = store.list_by_run_id(run_id)
     ordered = [event for event in run_events if _decision_id(event) == decision_id]
 
+    exported_events = []
+    for event in ordered:
+        exported = _export_event(event, decision_id=decision_id)
+        if snapshot is not None:
+            leaf_index = leaf_index_by_event_id[event.id]
+            exported["inclusion_proof"] = {
+                "leaf_index": leaf_index,
+                "audit_path": snapshot.inclusion_proof(leaf_index),
+            }
+        exported_events.append(exported)
+
     return {
         "decision_id": decision_id,
         "run_id": run_id,
         "event_count": len(ordered),
-        "events": [
-            {
-                "event_id": event.id,
+        "merkle": _merkle_summary(tree),
+        "events": exported_events,
+    }
+
+
+def iter_decision_audit_records(*, store: EventStore, query: DecisionAuditQuery) -> Iterator[dict[str, Any]]:
+    """Yield one audit record per matching decision, walking the store run by run.
+
+    Runs come from the run catalog in run_id order, and only one run's events
+    are held at a time. The stream is pinned to the events stored when it
+    starts, so runs taking appends mid-walk are neither skipped nor exported
+    past that point. Each run's hash chain is verified before its decisions
+    are yielded; a broken run yields a single error record instead, so the
+    stream can continue past it.
+
+    A complete stream ends with an end record. The response status is sent
+    before the walk, so a storage failure ends the stream with a
+    stream_error record instead; a stream missing both was cut off.
+    """
+    decision_count = 0
+    try:
+        for record in _iter_decision_records(store=store, query=query):
+            if record["record_type"] == "decision":
+                decision_count += 1
+            yield record
+    except Exception:
+        logger.exception("decision audit export stream failed")
+        yield {
+            "record_type": "stream_error",
+            "error": {"code": "STORAGE_READ_ERROR", "message": "storage backend read failed"},
+        }
+        return
+    yield {"record_type": "end", "decision_count": decision_count}
+
+
+def _iter_decision_records(*, store: EventStore, query: DecisionAuditQuery) -> Iterator[dict[str, Any]]:
+    last_sequence = store.last_sequence()
+    for run_id in _iter_audit_run_ids(store=store, query=query):
+        try:
+            verify_run_chain(store=store, run_id=run_id)
+        except InconsistentRunStateError as exc:
+            yield {
+                "record_type": "run_error",
+                "run_id": run_id,
+                "error": {"code": exc.detail_code, "message": exc.detail_message},
+            }
+            continue
+        chain = [event for event in list_run_chain(store=store, run_id=run_id) if event.sequence <= last_sequence]
+        events_by_decision: dict[str, list[StoredEvent]] = {}
+        for event in sorted(chain, key=lambda event: (event.timestamp, event.sequence)):
+            decision_id = _decision_id(event)
+            if decision_id is not None:
+                events_by_decision.setdefault(decision_id, []).append(event)
+        if not events_by_decision:
+            continue
+        tree = store.merkle_head(run_id)
+        if tree is None or tree.size != len(chain):
+            # The run grew after the stream started; report the pinned prefix.
+            tree = build_frontier(run_id=run_id, event_hashes=[event.hash for event in chain])
+        merkle = _merkle_summary(tree)
+        for decision_id, events in events_by_decision.items():
+            status = events[-1].payload.get("approval", {}).get("status")
+            if not query.matches(started_at=events[0].timestamp, status=status):
+                continue
+            yield {
+                "record_type": "decision",
                 "decision_id": decision_id,
-                "action_type": str(event.payload.get("type", "")),
-                "actor": str(event.payload.get("actor", "")),
-                "timestamp": _format_timestamp(event.timestamp),
-                "reason": str(event.payload.get("details", "")),
-                "prev_hash": event.prev_hash,
-                "hash": event.hash,
+                "run_id": run_id,
+                "status": status,
+                "event_count": len(events),
+                "merkle": merkle,
+                "events": [_export_event(event, decision_id=decision_id) for event in events],
             }
-            for event in ordered
-        ],
-    }
 
 
-def _verify_hash_chain(*, events: list[StoredEvent]) -> None:
-    previous_hash: str | None = None
-    for event in events:
-        expected_hash = _build_event_hash(
-            run_id=event.run_id,
-            event_id=event.id,
-            timestamp=event.timestamp.isoformat(),
-            payload=event.payload,
-            integrity_warning=event.integrity_warning,
-            prev_hash=previous_hash,
+def _iter_audit_run_ids(*, store: EventStore, query: DecisionAuditQuery) -> Iterator[str]:
+    if query.run_id is not None:
+        yield query.run_id
+        return
+    after_run_id: str | None = None
+    while True:
+        entries = store.list_runs(
+            RunCatalogQuery(order="run_id", after_run_id=after_run_id, limit=_AUDIT_RUN_PAGE_SIZE)
         )
-        if (
-            event.prev_hash != previous_hash
-            or not event.hash
-            or event.hash != expected_hash
-        ):
-            raise InconsistentRunStateError(
-                detail_path="hash",
-                detail_message="stored hash chain integrity validation failed",
-                detail_code="HASH_CHAIN_BROKEN",
-                detail_type="state_conflict",
-            )
-        previous_hash = event.hash
+        for entry in entries:
+            # A decision starting in [since, until) needs a run event at or
+            # after since, in a run that started before until.
+            if query.since is not None and entry.last_event_at < query.since:
+                continue
+            if query.until is not None and entry.first_event_at >= query.until:
+                continue
+            yield entry.run_id
+        if len(entries) < _AUDIT_RUN_PAGE_SIZE:
+            return
+        after_run_id = entries[-1].run_id
+
+
+def _export_event(event: StoredEvent, *, decision_id: str) -> dict[str, Any]:
+    return {
+        "event_id": event.id,
+        "decision_id": decision_id,
+        "action_type": str(event.payload.get("type", "")),
+        "actor": str(event.payload.get("actor", "")),
+        "timestamp": _format_timestamp(event.timestamp),
+        "reason": str(event.payload.get("details", "")),
+        "prev_hash": event.prev_hash,
+        "hash": event.hash,
+    }
+
+
+def _merkle_summary(tree: MerkleFrontier | None) -> dict[str, Any]:
+    return {
+        "tree_size": tree.size if tree is not None else 0,
+        "root": tree.root if tree is not None else None,
+    }
 
 
 def _decision_id(event: StoredEvent) -> str | None:
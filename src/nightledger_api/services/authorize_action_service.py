@@ -1,10 +1,11 @@
 import ast
 import json
+import operator
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from hashlib import sha256
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 
 import yaml
 from pydantic import BaseModel, ConfigDict, Field
@@ -22,6 +23,18 @@ RuleAction = Literal["allow", "require_approval", "deny"]
 _USER_RULES_FILE_ENV = "NIGHTLEDGER_USER_RULES_FILE"
 AUTHORIZE_ACTION_CONTRACT_VERSION = "2.0.0"
 _POLICY_SET = "nightledger-v2-user-local"
+# Compiled `when` expression: (context, run) -> value.
+RulePredicate = Callable[[dict[str, Any], dict[str, Any]], Any]
+_COMPARE_OPERATORS: dict[type[ast.cmpop], Callable[[Any, Any], bool]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+}
 
 
 class AuthorizeActionIntent(BaseModel):
@@ -61,6 +74,9 @@ class RuleDefinition:
     when: str
     action: RuleAction
     reason: str
+    # `when`, compiled once when the catalog loads. Rules built elsewhere
+    # leave it unset and are compiled by RuleEvaluator on use.
+    predicate: RulePredicate | None = field(default=None, compare=False, repr=False)
 
 
 @dataclass(frozen=True)
@@ -140,37 +156,35 @@ class UserRulesRepository:
 
 
 class RuleEvaluator:
-    _ALLOWED_COMPARE_OPS = (
-        ast.Eq,
-        ast.NotEq,
-        ast.Gt,
-        ast.GtE,
-        ast.Lt,
-        ast.LtE,
-        ast.In,
-        ast.NotIn,
-    )
+    def compile(self, *, rule_id: str, expression: str) -> RulePredicate:
+        """Parse and validate a `when` expression into a closure tree.
 
-    def evaluate(
-        self,
-        *,
-        rule: RuleDefinition,
-        context: dict[str, Any],
-        run: dict[str, Any],
-    ) -> bool:
+        Raises:
+            RuleExpressionError: If the expression is not valid syntax or uses
+                anything outside the supported subset.
+        """
         try:
-            node = ast.parse(rule.when, mode="eval")
+            node = ast.parse(expression, mode="eval")
         except SyntaxError as exc:
             raise RuleExpressionError(
-                rule_id=rule.id,
-                expression=rule.when,
+                rule_id=rule_id,
+                expression=expression,
                 message=f"Invalid rule expression syntax: {exc.msg}",
             ) from exc
 
-        self._validate_node(node, rule=rule)
+        self._validate_node(node, rule_id=rule_id)
+        return self._compile(node.body, rule_id=rule_id)
 
+    def evaluate(
+        self,
+        *,
+        rule: RuleDefinition,
+        context: dict[str, Any],
+        run: dict[str, Any],
+    ) -> bool:
+        predicate = rule.predicate or self.compile(rule_id=rule.id, expression=rule.when)
         try:
-            value = self._eval(node.body, context=context, run=run)
+            value = predicate(context, run)
         except RuleInputError:
             raise
         except Exception as exc:
@@ -188,7 +202,7 @@ class RuleEvaluator:
             )
         return value
 
-    def _validate_node(self, node: ast.AST, *, rule: RuleDefinition) -> None:
+    def _validate_node(self, node: ast.AST, *, rule_id: str) -> None:
         allowed_nodes = (
             ast.Expression,
             ast.BoolOp,
@@ -207,9 +221,9 @@ class RuleEvaluator:
         for child in ast.walk(node):
             if isinstance(child, ast.Compare):
                 for op in child.ops:
-                    if not isinstance(op, self._ALLOWED_COMPARE_OPS):
+                    if type(op) not in _COMPARE_OPERATORS:
                         raise RuleExpressionError(
-                            rule_id=rule.id,
+                            rule_id=rule_id,
                             expression=ast.unparse(node) if hasattr(ast, "unparse") else "<expression>",
                             message="Rule expression uses unsupported comparison operator",
                         )
@@ -217,71 +231,81 @@ class RuleEvaluator:
                 continue
             elif not isinstance(child, allowed_nodes):
                 raise RuleExpressionError(
-                    rule_id=rule.id,
+                    rule_id=rule_id,
                     expression=ast.unparse(node) if hasattr(ast, "unparse") else "<expression>",
                     message=f"Rule expression uses unsupported syntax: {child.__class__.__name__}",
                 )
 
-    def _eval(self, node: ast.AST, *, context: dict[str, Any], run: dict[str, Any]) -> Any:
+    def _compile(self, node: ast.AST, *, rule_id: str) -> RulePredicate:
         if isinstance(node, ast.Constant):
-            return node.value
+            value = node.value
+            return lambda context, run: value
 
         if isinstance(node, ast.Name):
             if node.id == "context":
-                return context
+                return lambda context, run: context
             if node.id == "run":
-                return run
-            if node.id == "True":
-                return True
-            if node.id == "False":
-                return False
-            if node.id == "None":
-                return None
+                return lambda context, run: run
             raise RuleExpressionError(
-                rule_id="unknown",
+                rule_id=rule_id,
                 expression=node.id,
                 message=f"Unknown rule symbol '{node.id}'",
             )
 
         if isinstance(node, ast.Attribute):
-            base = self._eval(node.value, context=context, run=run)
-            if not isinstance(base, dict):
-                raise RuleExpressionError(
-                    rule_id="unknown",
-                    expression=node.attr,
-                    message="Rule attribute access is only supported on context and run objects",
-                )
-            if node.attr not in base:
-                path = _attribute_path(node)
-                raise RuleInputError(path=path, message=f"Missing rule input '{path}'")
-            return base[node.attr]
+            base = self._compile(node.value, rule_id=rule_id)
+            attr = node.attr
+            path = _attribute_path(node)
+
+            def _attribute(context: dict[str, Any], run: dict[str, Any]) -> Any:
+                value = base(context, run)
+                if not isinstance(value, dict):
+                    raise RuleExpressionError(
+                        rule_id=rule_id,
+                        expression=attr,
+                        message="Rule attribute access is only supported on context and run objects",
+                    )
+                if attr not in value:
+                    raise RuleInputError(path=path, message=f"Missing rule input '{path}'")
+                return value[attr]
 
-        if isinstance(node, ast.List):
-            return [self._eval(item, context=context, run=run) for item in node.elts]
+            return _attribute
 
-        if isinstance(node, ast.Tuple):
-            return tuple(self._eval(item, context=context, run=run) for item in node.elts)
+        if isinstance(node, (ast.List, ast.Tuple)):
+            items = [self._compile(item, rule_id=rule_id) for item in node.elts]
+            container = list if isinstance(node, ast.List) else tuple
+            return lambda context, run: container(item(context, run) for item in items)
 
         if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
-            return not bool(self._eval(node.operand, context=context, run=run))
+            operand = self._compile(node.operand, rule_id=rule_id)
+            return lambda context, run: not bool(operand(context, run))
 
         if isinstance(node, ast.BoolOp):
+            values = [self._compile(value, rule_id=rule_id) for value in node.values]
             if isinstance(node.op, ast.And):
-                return all(bool(self._eval(value, context=context, run=run)) for value in node.values)
-            if isinstance(node.op, ast.Or):
-                return any(bool(self._eval(value, context=context, run=run)) for value in node.values)
+                return lambda context, run: all(bool(value(context, run)) for value in values)
+            return lambda context, run: any(bool(value(context, run)) for value in values)
 
         if isinstance(node, ast.Compare):
-            left = self._eval(node.left, context=context, run=run)
-            for op, comparator in zip(node.ops, node.comparators, strict=False):
-                right = self._eval(comparator, context=context, run=run)
-                if not _compare_values(left=left, op=op, right=right):
-                    return False
-                left = right
-            return True
+            left_operand = self._compile(node.left, rule_id=rule_id)
+            links = [
+                (_COMPARE_OPERATORS[type(op)], self._compile(comparator, rule_id=rule_id))
+                for op, comparator in zip(node.ops, node.comparators, strict=False)
+            ]
+
+            def _compare(context: dict[str, Any], run: dict[str, Any]) -> bool:
+                left = left_operand(context, run)
+                for compare, right_operand in links:
+                    right = right_operand(context, run)
+                    if not compare(left, right):
+                        return False
+                    left = right
+                return True
+
+            return _compare
 
         raise RuleExpressionError(
-            rule_id="unknown",
+            rule_id=rule_id,
             expression=node.__class__.__name__,
             message="Unsupported rule expression",
         )
@@ -510,6 +534,7 @@ def _parse_rule_definition(*, user_id: str, index: int, rule: dict[str, Any]) ->
         when=when.strip(),
         action=action,
         reason=reason.strip(),
+        predicate=_RULE_EVALUATOR.compile(rule_id=rule_id.strip(), expression=when.strip()),
     )
 
 
@@ -525,26 +550,6 @@ def _attribute_path(node: ast.Attribute) -> str:
     return ".".join(parts)
 
 
-def _compare_values(*, left: Any, op: ast.cmpop, right: Any) -> bool:
-    if isinstance(op, ast.Eq):
-        return left == right
-    if isinstance(op, ast.NotEq):
-        return left != right
-    if isinstance(op, ast.Gt):
-        return left > right
-    if isinstance(op, ast.GtE):
-        return left >= right
-    if isinstance(op, ast.Lt):
-        return left < right
-    if isinstance(op, ast.LtE):
-        return left <= right
-    if isinstance(op, ast.In):
-        return left in right
-    if isinstance(op, ast.NotIn):
-        return left not in right
-    raise RuleExpressionError(rule_id="unknown", expression="compare", message="Unsupported compare")
-
-
 def _extract_context_paths(expression: str) -> set[str]:
     try:
         node = ast.parse(expression, mode="eval")
@@ -0,0 +1,55 @@
+from nightledger_api.models.stored_event import ChainCheckpoint, StoredEvent
+from nightledger_api.services.errors import InconsistentRunStateError
+from nightledger_api.services.event_store import EventStore, _build_event_hash, event_hash_algorithm
+
+
+def verify_run_chain(*, store: EventStore, run_id: str) -> None:
+    """Verify a run's hash chain from its last verified checkpoint onward.
+
+    Events are checked in insertion order, the order the chain links them in.
+    On success the checkpoint advances to the run's last event, so the next
+    call only hashes events appended since.
+
+    Raises:
+        InconsistentRunStateError: HASH_CHAIN_BROKEN if any checked event's
+            prev_hash or hash does not match the recomputed chain.
+    """
+    checkpoint = store.chain_checkpoint(run_id)
+    events = store.list_chain(run_id, after_sequence=checkpoint.sequence if checkpoint else 0)
+    if not events:
+        return
+    _verify_chain_segment(events=events, previous_hash=checkpoint.hash if checkpoint else None)
+    last_event = events[-1]
+    store.save_chain_checkpoint(
+        ChainCheckpoint(run_id=run_id, sequence=last_event.sequence, hash=last_event.hash)
+    )
+
+
+def list_run_chain(*, store: EventStore, run_id: str) -> list[StoredEvent]:
+    """List a run's events in insertion order, the order its hash chain links."""
+    return store.list_chain(run_id)
+
+
+def _verify_chain_segment(*, events: list[StoredEvent], previous_hash: str | None) -> None:
+    for event in events:
+        expected_hash = _build_event_hash(
+            run_id=event.run_id,
+            event_id=event.id,
+            timestamp=event.timestamp.isoformat(),
+            payload=event.payload,
+            integrity_warning=event.integrity_warning,
+            prev_hash=previous_hash,
+            algorithm=event_hash_algorithm(event.hash),
+        )
+        if (
+            event.prev_hash != previous_hash
+            or not event.hash
+            or event.hash != expected_hash
+        ):
+            raise InconsistentRunStateError(
+                detail_path="hash",
+                detail_message="stored hash chain integrity validation failed",
+                detail_code="HASH_CHAIN_BROKEN",
+                detail_type="state_conflict",
+            )
+        previous_hash = event.hash
@@ -0,0 +1,31 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from nightledger_api.services.errors import InvalidQueryParameterError
+
+
+def encode_cursor(fields: dict[str, Any]) -> str:
+    """Encode a keyset position as an opaque, URL-safe cursor."""
+    raw = json.dumps(fields, sort_keys=True, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *, path: str = "cursor") -> dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        decoded = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise invalid_cursor_error(path=path) from exc
+    if not isinstance(decoded, dict):
+        raise invalid_cursor_error(path=path)
+    return decoded
+
+
+def invalid_cursor_error(*, path: str = "cursor") -> InvalidQueryParameterError:
+    return InvalidQueryParameterError(
+        path=path,
+        message=f"{path} is not a valid pagination cursor",
+        code="INVALID_CURSOR",
+    )
@@ -0,0 +1,117 @@
+import asyncio
+import os
+import threading
+import weakref
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from nightledger_api.models.stored_event import StoredEvent
+
+_DECISION_MAX_WAIT_ENV = "NIGHTLEDGER_APPROVAL_MAX_WAIT_SECONDS"
+_DEFAULT_DECISION_MAX_WAIT_SECONDS = 30.0
+
+
+@dataclass(frozen=True, eq=False)
+class DecisionTicket:
+    """A parked request's view of one decision_id, taken before its state read."""
+
+    loop: asyncio.AbstractEventLoop
+    notified: asyncio.Event
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait until the decision is notified after the ticket was taken.
+
+        Returns False when timeout (seconds) passes first.
+        """
+        try:
+            await asyncio.wait_for(self.notified.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+
+class DecisionWaiters:
+    """In-process rendezvous between long-polling readers and resolutions.
+
+    Readers park an asyncio event on their own loop, so a waiting request
+    holds no worker thread. notify may be called from any thread and wakes
+    every reader parked on that decision_id. Entries only exist while someone
+    is parked, so notifying a decision nobody waits for is a dictionary miss.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._parked: dict[str, list[DecisionTicket]] = {}
+        self._watched_stores: weakref.WeakSet[Any] = weakref.WeakSet()
+
+    def watch(self, store: Any) -> None:
+        """Notify from every append to store that carries an approval.decision_id.
+
+        Covers resolutions from any path, including expiry and POST /v1/events.
+        Idempotent per store.
+        """
+        with self._lock:
+            if store in self._watched_stores:
+                return
+            self._watched_stores.add(store)
+        store.add_append_listener(self.observe)
+
+    def observe(self, events: list[StoredEvent]) -> None:
+        """Append listener: notify each decision_id the appended events carry."""
+        for decision_id in dict.fromkeys(
+            event.payload.get("approval", {}).get("decision_id") for event in events
+        ):
+            if isinstance(decision_id, str):
+                self.notify(decision_id)
+
+    @contextmanager
+    def park(self, decision_id: str) -> Iterator[DecisionTicket]:
+        # Take the ticket before the caller reads state, so a resolution
+        # landing between that read and wait() still wakes it.
+        ticket = DecisionTicket(loop=asyncio.get_running_loop(), notified=asyncio.Event())
+        with self._lock:
+            self._parked.setdefault(decision_id, []).append(ticket)
+        try:
+            yield ticket
+        finally:
+            with self._lock:
+                tickets = self._parked[decision_id]
+                tickets.remove(ticket)
+                if not tickets:
+                    del self._parked[decision_id]
+
+    def notify(self, decision_id: str) -> None:
+        with self._lock:
+            tickets = list(self._parked.get(decision_id, ()))
+        for ticket in tickets:
+            ticket.loop.call_soon_threadsafe(ticket.notified.set)
+
+    def parked_count(self) -> int:
+        with self._lock:
+            return sum(len(tickets) for tickets in self._parked.values())
+
+
+_DECISION_WAITERS = DecisionWaiters()
+
+
+def watch_decision_store(store: Any) -> None:
+    _DECISION_WAITERS.watch(store)
+
+
+def park_decision(decision_id: str) -> AbstractContextManager[DecisionTicket]:
+    return _DECISION_WAITERS.park(decision_id)
+
+
+def parked_decision_count() -> int:
+    return _DECISION_WAITERS.parked_count()
+
+
+def configured_decision_max_wait_seconds() -> float:
+    configured = os.getenv(_DECISION_MAX_WAIT_ENV)
+    if configured is None or configured.strip() == "":
+        return _DEFAULT_DECISION_MAX_WAIT_SECONDS
+    try:
+        return max(0.0, float(configured.strip()))
+    except ValueError:
+        return _DEFAULT_DECISION_MAX_WAIT_SECONDS
@@ -165,11 +165,20 @@ class ExecutionTokenMisconfiguredError(ExecutionTokenError):
         super().__init__(message)
 
 
+class InvalidQueryParameterError(Exception):
+    def __init__(self, *, path: str, message: str, code: str) -> None:
+        self.path = path
+        self.code = code
+        super().__init__(message)
+
+
 class RuleConfigurationError(Exception):
     pass
 
 
-class RuleExpressionError(Exception):
+# Syntax and safety problems surface while the rule catalog loads, so callers
+# handling RuleConfigurationError see them too.
+class RuleExpressionError(RuleConfigurationError):
     def __init__(self, *, rule_id: str, expression: str, message: str) -> None:
         self.rule_id = rule_id
         self.expression = expression
@@ -1,26 +1,67 @@
 from collections import defaultdict
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
+import bisect
 import hashlib
 import json
 import os
 import sqlite3
-from typing import Any, Protocol
+from typing import Any, Callable, Protocol
 
 from nightledger_api.models.event_schema import EventPayload
+from nightledger_api.models.stored_event import ChainCheckpoint, StoredEvent
 from nightledger_api.services.errors import DuplicateEventError
+from nightledger_api.services.field_selection import select_fields
+from nightledger_api.services.merkle_tree import MerkleFrontier, append_leaf, build_frontier
+from nightledger_api.services.run_catalog_service import (
+    PendingApprovalEntry,
+    PendingApprovalQuery,
+    RunCatalogEntry,
+    RunCatalogQuery,
+    RunProjectionSnapshot,
+    advance_run_catalog_entry,
+    build_pending_approval_entry,
+    pending_approval_context,
+    replay_run_catalog,
+    snapshot_run_catalog_entry,
+)
 
-
-@dataclass(frozen=True)
-class StoredEvent:
-    id: str
-    timestamp: datetime
-    run_id: str
-    payload: dict[str, Any]
-    integrity_warning: bool = False
-    prev_hash: str | None = None
-    hash: str = ""
+AppendListener = Callable[[list[StoredEvent]], None]
+_EVENT_STORE_DB_PATH_ENV = "NIGHTLEDGER_EVENT_STORE_DB_PATH"
+_DEFAULT_EVENT_STORE_DB_PATH = "/tmp/nightledger_events.db"
+_PROJECTION_SNAPSHOT_INTERVAL_ENV = "NIGHTLEDGER_PROJECTION_SNAPSHOT_INTERVAL"
+_DEFAULT_PROJECTION_SNAPSHOT_INTERVAL = 100
+_EVENT_HASH_ALGORITHM_ENV = "NIGHTLEDGER_EVENT_HASH_ALGORITHM"
+_DEFAULT_EVENT_HASH_ALGORITHM = "sha256"
+# Each hash carries its algorithm as a prefix, so chains stay verifiable when
+# the configured algorithm changes, including runs that mix both.
+EVENT_HASH_ALGORITHMS = ("sha256", "blake2b")
+_COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+_SORTED_COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), sort_keys=True)
+_RUN_CATALOG_COLUMNS = (
+    "run_id, workflow, status, first_event_at, last_event_at, event_count, "
+    "fold_state_json, inconsistency_json"
+)
+_PENDING_APPROVAL_COLUMNS = (
+    "event_id, decision_id, run_id, requested_at, requested_by, title, details, reason, risk_level"
+)
+_EVENT_FIELD_COLUMNS = {
+    "id": "event_id",
+    "timestamp": "timestamp",
+    "run_id": "run_id",
+    "payload": "payload_json",
+    "integrity_warning": "integrity_warning",
+}
+# json_extract returns JSON booleans as SQL integers, so json_type is checked
+# first to keep true/false distinct from 1/0. Missing paths quote as null.
+_PAYLOAD_PATH_JSON = (
+    "CASE json_type(payload_json, ?) WHEN 'true' THEN 'true' WHEN 'false' THEN 'false' "
+    "ELSE json_quote(json_extract(payload_json, ?)) END"
+)
+# Paths running through a non-object value read as SQL NULL and are left out
+# of the row, as field_selection.select_fields does.
+_PAYLOAD_ANCESTOR_IS_SCALAR = "json_type(payload_json, ?) <> 'object'"
 
 
 class EventStore(Protocol):
@@ -32,6 +73,15 @@ class EventStore(Protocol):
         """
         raise NotImplementedError
 
+    def append_batch(self, events: list[EventPayload]) -> list[StoredEvent]:
+        """Append several events atomically, preserving their order.
+
+        Raises:
+            DuplicateEventError: If any event.id already exists for its run_id
+                (including duplicates within the batch); nothing is appended.
+        """
+        raise NotImplementedError
+
     def list_by_run_id(self, run_id: str) -> list[StoredEvent]:
         """List all events for a given run_id, ordered by timestamp (ascending).
         
@@ -40,10 +90,154 @@ class EventStore(Protocol):
         """
         raise NotImplementedError
 
+    def list_by_run_id_window(self, run_id: str, *, offset: int, limit: int) -> list[StoredEvent]:
+        """List a slice of a run's timeline, ordered as in list_by_run_id.
+
+        offset is the 0-based timeline position of the first returned event.
+        """
+        raise NotImplementedError
+
+    def count_by_run_id_before(self, run_id: str, timestamp: datetime, *, inclusive: bool = False) -> int:
+        """Count a run's events timestamped before timestamp, or at it when inclusive.
+
+        The count is the timeline offset of the run's first event after that
+        point, for use with list_by_run_id_window.
+        """
+        raise NotImplementedError
+
+    def list_by_run_id_after(
+        self, run_id: str, *, timestamp: datetime, sequence: int, limit: int
+    ) -> list[StoredEvent]:
+        """List up to limit of a run's events sorting after (timestamp, sequence).
+
+        Events are ordered as in list_by_run_id, which sorts by that key, so
+        paging on it never repeats or skips an event that was already stored.
+        """
+        raise NotImplementedError
+
+    def count_by_run_id_through(self, run_id: str, *, timestamp: datetime, sequence: int) -> int:
+        """Count a run's events sorting at or before (timestamp, sequence).
+
+        For a stored event's key this is its 1-based timeline position.
+        """
+        raise NotImplementedError
+
+    def list_fields_by_run_id(self, run_id: str, fields: tuple[str, ...]) -> list[dict[str, Any]]:
+        """List only the selected fields of a run's events, ordered as in list_by_run_id.
+
+        fields are normalized dotted paths (see field_selection.parse_fields);
+        each row maps every path to its value, or None where the path is missing,
+        and leaves out paths that run through a non-object value.
+        """
+        raise NotImplementedError
+
+    def list_by_run_ids(self, run_ids: list[str]) -> dict[str, list[StoredEvent]]:
+        """List events for several runs in one read, keyed by run_id.
+
+        Each run's events are ordered as in list_by_run_id. Runs without
+        events are omitted from the result.
+        """
+        raise NotImplementedError
+
     def list_all(self) -> list[StoredEvent]:
         """List all events across runs, ordered by timestamp (ascending)."""
         raise NotImplementedError
 
+    def list_runs(self, query: RunCatalogQuery) -> list[RunCatalogEntry]:
+        """List runs from the catalog maintained on append.
+
+        Entries matching every filter in query are ordered by last_event_at
+        then run_id, both descending (or by run_id ascending when query.order
+        is "run_id"), and capped at query.limit.
+        """
+        raise NotImplementedError
+
+    def list_pending_approvals(self, query: PendingApprovalQuery) -> list[PendingApprovalEntry]:
+        """List open approval requests from the index maintained on append.
+
+        Runs enter the index when they pause on a pending approval and leave it
+        on resolution, terminal events or an inconsistent timeline. Entries
+        matching query are ordered by requested_at then event_id, ascending.
+        """
+        raise NotImplementedError
+
+    def count_pending_approvals(self, query: PendingApprovalQuery) -> int:
+        """Count open approval requests matching query's filters.
+
+        The keyset position and limit are ignored, so the count is the total
+        across all pages.
+        """
+        raise NotImplementedError
+
+    def latest_snapshot(
+        self,
+        run_id: str,
+        *,
+        max_position: int | None = None,
+        max_timestamp: datetime | None = None,
+    ) -> RunProjectionSnapshot | None:
+        """Return the run's latest projection snapshot within the given bounds.
+
+        Returns None if no snapshot is at or before max_position and
+        max_timestamp (the bounds are optional).
+        """
+        raise NotImplementedError
+
+    def run_head(self, run_id: str) -> str | None:
+        """Return the hash of the most recently appended event of a run.
+
+        Returns None if the run_id has no events. The head changes on every
+        append, so it identifies an unchanged run for projection caching.
+        """
+        raise NotImplementedError
+
+    def run_heads(self, run_ids: list[str]) -> dict[str, str]:
+        """Return the heads of several runs in one read, keyed by run_id.
+
+        Runs without events are omitted from the result.
+        """
+        raise NotImplementedError
+
+    def last_sequence(self) -> int:
+        """Return the sequence of the most recently appended event, or 0.
+
+        Sequences only grow, so reads filtered to sequence <= this value see
+        the store as of the call.
+        """
+        raise NotImplementedError
+
+    def list_chain(self, run_id: str, *, after_sequence: int = 0) -> list[StoredEvent]:
+        """List a run's events in insertion order, the order its hash chain links.
+
+        Only events with a sequence greater than after_sequence are returned.
+        """
+        raise NotImplementedError
+
+    def chain_checkpoint(self, run_id: str) -> ChainCheckpoint | None:
+        """Return the run's latest verified hash-chain checkpoint, if any."""
+        raise NotImplementedError
+
+    def save_chain_checkpoint(self, checkpoint: ChainCheckpoint) -> None:
+        """Persist a verified checkpoint; one behind the stored checkpoint is ignored."""
+        raise NotImplementedError
+
+    def merkle_head(self, run_id: str) -> MerkleFrontier | None:
+        """Return the run's Merkle tree over its event hashes, maintained on append.
+
+        Leaves are in insertion order, as in list_chain. Returns None if the
+        run_id has no events.
+        """
+        raise NotImplementedError
+
+    def add_append_listener(self, listener: AppendListener) -> None:
+        """Register a callback for events appended through this store instance.
+
+        The listener runs after the write is committed, once per append or
+        append_batch call, with the stored events in append order. It must not
+        raise or block.
+        """
+        raise NotImplementedError
+
 
 @dataclass(frozen=True)
 class _StoredRecord:
@@ -58,14 +252,33 @@ class _StoredRecord:
 
 
 class InMemoryAppendOnlyEventStore:
-    def __init__(self) -> None:
+    def __init__(self, *, snapshot_interval: int | None = None, hash_algorithm: str | None = None) -> None:
+        self._snapshot_interval = (
+            configured_projection_snapshot_interval() if snapshot_interval is None else snapshot_interval
+        )
+        self._hash_algorithm = configured_event_hash_algorithm() if hash_algorithm is None else hash_algorithm
         self._sequence = 0
         self._event_id_index: dict[str, set[str]] = defaultdict(set)
         self._run_records_index: dict[str, list[_StoredRecord]] = defaultdict(list)
+        # The same records in timeline order, (timestamp, sequence).
+        self._run_timeline_index: dict[str, list[_StoredRecord]] = defaultdict(list)
         self._last_timestamp_by_run: dict[str, datetime] = {}
         self._last_hash_by_run: dict[str, str] = {}
+        self._run_catalog: dict[str, RunCatalogEntry] = {}
+        self._runs_by_status: dict[str | None, set[str]] = defaultdict(set)
+        self._runs_by_workflow: dict[str | None, set[str]] = defaultdict(set)
+        self._snapshots_by_run: dict[str, list[RunProjectionSnapshot]] = defaultdict(list)
+        self._pending_approvals: dict[str, PendingApprovalEntry] = {}
+        self._chain_checkpoints: dict[str, ChainCheckpoint] = {}
+        self._merkle_by_run: dict[str, MerkleFrontier] = {}
+        self._append_listeners: list[AppendListener] = []
 
     def append(self, event: EventPayload) -> StoredEvent:
+        stored_event = self._append_event(event)
+        _notify_append_listeners(self._append_listeners, [stored_event])
+        return stored_event
+
+    def _append_event(self, event: EventPayload) -> StoredEvent:
         # RULE-CORE-003: Duplicate Event Prevention (O(1) lookup)
         if event.id in self._event_id_index[event.run_id]:
             raise DuplicateEventError(event_id=event.id, run_id=event.run_id)
@@ -84,13 +297,14 @@ class InMemoryAppendOnlyEventStore:
 
         payload = event.model_dump(mode="json")
         prev_hash = self._last_hash_by_run.get(event.run_id)
-        current_hash = _build_event_hash(
+        current_hash = _hash_payload_json(
             run_id=event.run_id,
             event_id=event.id,
             timestamp=event.timestamp.isoformat(),
-            payload=payload,
+            payload_json=_canonical_payload_json(payload),
             integrity_warning=integrity_warning,
             prev_hash=prev_hash,
+            algorithm=self._hash_algorithm,
         )
 
         self._sequence += 1
@@ -106,15 +320,94 @@ class InMemoryAppendOnlyEventStore:
         )
         self._event_id_index[event.run_id].add(event.id)
         self._run_records_index[event.run_id].append(record)
+        if integrity_warning:
+            bisect.insort(self._run_timeline_index[event.run_id], record, key=_timeline_key)
+        else:
+            self._run_timeline_index[event.run_id].append(record)
         self._last_hash_by_run[event.run_id] = current_hash
-        return self._to_stored_event(record)
+        self._merkle_by_run[event.run_id] = append_leaf(
+            self._merkle_by_run.get(event.run_id), run_id=event.run_id, event_hash=current_hash
+        )
+        stored_event = self._to_stored_event(record)
+        if integrity_warning:
+            # The event lands mid-timeline, so the run's fold and snapshots are
+            # replayed.
+            entry, snapshots = replay_run_catalog(
+                event.run_id,
+                self.list_by_run_id(event.run_id),
+                snapshot_interval=self._snapshot_interval,
+            )
+            self._snapshots_by_run[event.run_id] = snapshots
+        else:
+            entry = advance_run_catalog_entry(self._run_catalog.get(event.run_id), stored_event)
+            snapshot = snapshot_run_catalog_entry(entry, snapshot_interval=self._snapshot_interval)
+            if snapshot is not None:
+                self._snapshots_by_run[event.run_id].append(snapshot)
+        assert entry is not None  # pragma: no cover - the run has at least this event
+        self._index_run(entry)
+        return stored_event
+
+    def append_batch(self, events: list[EventPayload]) -> list[StoredEvent]:
+        # Check every id up front so a rejected batch leaves no partial writes.
+        batch_ids: set[tuple[str, str]] = set()
+        for event in events:
+            key = (event.run_id, event.id)
+            if event.id in self._event_id_index[event.run_id] or key in batch_ids:
+                raise DuplicateEventError(event_id=event.id, run_id=event.run_id)
+            batch_ids.add(key)
+        stored_events = [self._append_event(event) for event in events]
+        _notify_append_listeners(self._append_listeners, stored_events)
+        return stored_events
 
     def list_by_run_id(self, run_id: str) -> list[StoredEvent]:
-        # O(1) lookup via index, then O(k log k) sort where k = events in this run
-        records = self._run_records_index.get(run_id, [])
-        ordered = sorted(records, key=lambda record: (record.timestamp, record.sequence))
+        # O(1) lookup of the run's timeline, kept in order on append.
+        ordered = self._run_timeline_index.get(run_id, [])
         return [self._to_stored_event(record) for record in ordered]
 
+    def list_by_run_id_window(self, run_id: str, *, offset: int, limit: int) -> list[StoredEvent]:
+        ordered = self._run_timeline_index.get(run_id, [])
+        return [self._to_stored_event(record) for record in ordered[offset : offset + limit]]
+
+    def count_by_run_id_before(self, run_id: str, timestamp: datetime, *, inclusive: bool = False) -> int:
+        ordered = self._run_timeline_index.get(run_id, [])
+        search = bisect.bisect_right if inclusive else bisect.bisect_left
+        return search(ordered, timestamp, key=lambda record: record.timestamp)
+
+    def list_by_run_id_after(
+        self, run_id: str, *, timestamp: datetime, sequence: int, limit: int
+    ) -> list[StoredEvent]:
+        ordered = self._run_timeline_index.get(run_id, [])
+        offset = bisect.bisect_right(ordered, (timestamp, sequence), key=_timeline_key)
+        return [self._to_stored_event(record) for record in ordered[offset : offset + limit]]
+
+    def count_by_run_id_through(self, run_id: str, *, timestamp: datetime, sequence: int) -> int:
+        ordered = self._run_timeline_index.get(run_id, [])
+        return bisect.bisect_right(ordered, (timestamp, sequence), key=_timeline_key)
+
+    def list_fields_by_run_id(self, run_id: str, fields: tuple[str, ...]) -> list[dict[str, Any]]:
+        ordered = self._run_timeline_index.get(run_id, [])
+        # Only the selected values are copied out of the records.
+        return [
+            select_fields(
+                {
+                    "id": record.id,
+                    "timestamp": record.timestamp,
+                    "run_id": record.run_id,
+                    "payload": record.payload,
+                    "integrity_warning": record.integrity_warning,
+                },
+                fields,
+            )
+            for record in ordered
+        ]
+
+    def list_by_run_ids(self, run_ids: list[str]) -> dict[str, list[StoredEvent]]:
+        return {
+            run_id: self.list_by_run_id(run_id)
+            for run_id in dict.fromkeys(run_ids)
+            if self._run_records_index.get(run_id)
+        }
+
     def list_all(self) -> list[StoredEvent]:
         records = [
             record
@@ -124,6 +417,117 @@ class InMemoryAppendOnlyEventStore:
         ordered = sorted(records, key=lambda record: (record.timestamp, record.sequence))
         return [self._to_stored_event(record) for record in ordered]
 
+    def list_runs(self, query: RunCatalogQuery) -> list[RunCatalogEntry]:
+        candidates: set[str] | None = None
+        if query.status is not None:
+            candidates = set(self._runs_by_status.get(query.status, ()))
+        if query.inconsistent_only:
+            inconsistent = self._runs_by_status.get(None, set())
+            candidates = set(inconsistent) if candidates is None else candidates & inconsistent
+        if query.workflow is not None:
+            by_workflow = self._runs_by_workflow.get(query.workflow, set())
+            candidates = set(by_workflow) if candidates is None else candidates & by_workflow
+        run_ids = self._run_catalog.keys() if candidates is None else candidates
+        entries = [
+            entry
+            for entry in (self._run_catalog[run_id] for run_id in run_ids)
+            if query.matches(entry)
+        ]
+        if query.order == "run_id":
+            entries.sort(key=lambda entry: entry.run_id)
+        else:
+            entries.sort(key=lambda entry: (entry.last_event_at, entry.run_id), reverse=True)
+        return entries if query.limit is None else entries[: query.limit]
+
+    def list_pending_approvals(self, query: PendingApprovalQuery) -> list[PendingApprovalEntry]:
+        if query.run_id is not None:
+            candidates = [self._pending_approvals[query.run_id]] if query.run_id in self._pending_approvals else []
+        else:
+            candidates = list(self._pending_approvals.values())
+        entries = sorted(
+            (entry for entry in candidates if query.matches(entry)),
+            key=lambda entry: (entry.requested_at, entry.event_id),
+        )
+        return entries if query.limit is None else entries[: query.limit]
+
+    def count_pending_approvals(self, query: PendingApprovalQuery) -> int:
+        unpaged = replace(query, after=None, limit=None)
+        if query.run_id is not None:
+            entry = self._pending_approvals.get(query.run_id)
+            return int(entry is not None and unpaged.matches(entry))
+        return sum(1 for entry in self._pending_approvals.values() if unpaged.matches(entry))
+
+    def latest_snapshot(
+        self,
+        run_id: str,
+        *,
+        max_position: int | None = None,
+        max_timestamp: datetime | None = None,
+    ) -> RunProjectionSnapshot | None:
+        for snapshot in reversed(self._snapshots_by_run.get(run_id, [])):
+            if max_position is not None and snapshot.position > max_position:
+                continue
+            if max_timestamp is not None and snapshot.last_event_at > max_timestamp:
+                continue
+            return snapshot
+        return None
+
+    def run_head(self, run_id: str) -> str | None:
+        return self._last_hash_by_run.get(run_id)
+
+    def run_heads(self, run_ids: list[str]) -> dict[str, str]:
+        return {
+            run_id: self._last_hash_by_run[run_id]
+            for run_id in dict.fromkeys(run_ids)
+            if run_id in self._last_hash_by_run
+        }
+
+    def last_sequence(self) -> int:
+        return self._sequence
+
+    def list_chain(self, run_id: str, *, after_sequence: int = 0) -> list[StoredEvent]:
+        # The run index is already in insertion order.
+        records = self._run_records_index.get(run_id, [])
+        return [self._to_stored_event(record) for record in records if record.sequence > after_sequence]
+
+    def chain_checkpoint(self, run_id: str) -> ChainCheckpoint | None:
+        return self._chain_checkpoints.get(run_id)
+
+    def save_chain_checkpoint(self, checkpoint: ChainCheckpoint) -> None:
+        current = self._chain_checkpoints.get(checkpoint.run_id)
+        if current is None or checkpoint.sequence > current.sequence:
+            self._chain_checkpoints[checkpoint.run_id] = checkpoint
+
+    def merkle_head(self, run_id: str) -> MerkleFrontier | None:
+        return self._merkle_by_run.get(run_id)
+
+    def add_append_listener(self, listener: AppendListener) -> None:
+        self._append_listeners.append(listener)
+
+    def _index_run(self, entry: RunCatalogEntry) -> None:
+        previous = self._run_catalog.get(entry.run_id)
+        if previous is not None:
+            self._runs_by_status[previous.status].discard(entry.run_id)
+            self._runs_by_workflow[previous.workflow].discard(entry.run_id)
+        self._run_catalog[entry.run_id] = entry
+        self._runs_by_status[entry.status].add(entry.run_id)
+        self._runs_by_workflow[entry.workflow].add(entry.run_id)
+
+        pending = pending_approval_context(entry)
+        indexed = self._pending_approvals.get(entry.run_id)
+        if pending is None:
+            self._pending_approvals.pop(entry.run_id, None)
+        elif indexed is None or indexed.event_id != pending["event_id"]:
+            # The pending request is usually the event just appended.
+            record = next(
+                record
+                for record in reversed(self._run_records_index[entry.run_id])
+                if record.id == pending["event_id"]
+            )
+            self._pending_approvals[entry.run_id] = build_pending_approval_entry(
+                pending=pending, event=self._to_stored_event(record)
+            )
+
     def _to_stored_event(self, record: _StoredRecord) -> StoredEvent:
         return StoredEvent(
             id=record.id,
@@ -133,108 +537,488 @@ class InMemoryAppendOnlyEventStore:
             integrity_warning=record.integrity_warning,
             prev_hash=record.prev_hash,
             hash=record.hash,
+            validated=True,
+            sequence=record.sequence,
         )
 
 
 class SQLiteAppendOnlyEventStore:
-    def __init__(self, *, path: str) -> None:
+    def __init__(
+        self,
+        *,
+        path: str,
+        snapshot_interval: int | None = None,
+        hash_algorithm: str | None = None,
+    ) -> None:
         self._path = path
+        self._snapshot_interval = (
+            configured_projection_snapshot_interval() if snapshot_interval is None else snapshot_interval
+        )
+        self._hash_algorithm = configured_event_hash_algorithm() if hash_algorithm is None else hash_algorithm
+        self._append_listeners: list[AppendListener] = []
         self._ensure_schema()
 
     def append(self, event: EventPayload) -> StoredEvent:
-        integrity_warning = False
+        return self.append_batch([event])[0]
+
+    def add_append_listener(self, listener: AppendListener) -> None:
+        self._append_listeners.append(listener)
+
+    def append_batch(self, events: list[EventPayload]) -> list[StoredEvent]:
+        # One connection and one transaction for the whole batch; any failure
+        # (including a duplicate id) rolls back every row in it.
         with sqlite3.connect(self._path) as conn:
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA synchronous=NORMAL")
-            last_row = conn.execute(
+            stored_events = [self._insert_event(conn, event) for event in events]
+        _notify_append_listeners(self._append_listeners, stored_events)
+        return stored_events
+
+    def _insert_event(self, conn: sqlite3.Connection, event: EventPayload) -> StoredEvent:
+        integrity_warning = False
+        last_row = conn.execute(
+            """
+            SELECT timestamp, hash
+            FROM events
+            WHERE run_id = ?
+            ORDER BY sequence DESC
+            LIMIT 1
+            """,
+            (event.run_id,),
+        ).fetchone()
+        prev_hash: str | None = None
+        if last_row is not None:
+            last_timestamp = datetime.fromisoformat(str(last_row[0]))
+            if event.timestamp < last_timestamp:
+                integrity_warning = True
+            prev_hash = str(last_row[1]) if last_row[1] is not None else None
+
+        payload = event.model_dump(mode="json")
+        timestamp = event.timestamp.isoformat()
+        # Serialized once: these bytes are both the stored row and the hash input.
+        payload_json = _canonical_payload_json(payload)
+        current_hash = _hash_payload_json(
+            run_id=event.run_id,
+            event_id=event.id,
+            timestamp=timestamp,
+            payload_json=payload_json,
+            integrity_warning=integrity_warning,
+            prev_hash=prev_hash,
+            algorithm=self._hash_algorithm,
+        )
+
+        try:
+            cursor = conn.execute(
                 """
-                SELECT timestamp, hash
-                FROM events
-                WHERE run_id = ?
-                ORDER BY sequence DESC
-                LIMIT 1
+                INSERT INTO events (
+                    run_id,
+                    event_id,
+                    timestamp,
+                    payload_json,
+                    integrity_warning,
+                    prev_hash,
+                    hash,
+                    validated
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, 1)
                 """,
-                (event.run_id,),
-            ).fetchone()
-            prev_hash: str | None = None
-            if last_row is not None:
-                last_timestamp = datetime.fromisoformat(str(last_row[0]))
-                if event.timestamp < last_timestamp:
-                    integrity_warning = True
-                prev_hash = str(last_row[1]) if last_row[1] is not None else None
-
-            payload = event.model_dump(mode="json")
-            current_hash = _build_event_hash(
-                run_id=event.run_id,
-                event_id=event.id,
-                timestamp=event.timestamp.isoformat(),
-                payload=payload,
-                integrity_warning=integrity_warning,
-                prev_hash=prev_hash,
+                (
+                    event.run_id,
+                    event.id,
+                    timestamp,
+                    payload_json,
+                    1 if integrity_warning else 0,
+                    prev_hash,
+                    current_hash,
+                ),
             )
+        except sqlite3.IntegrityError as exc:
+            raise DuplicateEventError(event_id=event.id, run_id=event.run_id) from exc
 
-            try:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO events (
-                        run_id,
-                        event_id,
-                        timestamp,
-                        payload_json,
-                        integrity_warning,
-                        prev_hash,
-                        hash
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        event.run_id,
-                        event.id,
-                        event.timestamp.isoformat(),
-                        json.dumps(payload, separators=(",", ":")),
-                        1 if integrity_warning else 0,
-                        prev_hash,
-                        current_hash,
-                    ),
-                )
-            except sqlite3.IntegrityError as exc:
-                raise DuplicateEventError(event_id=event.id, run_id=event.run_id) from exc
+        # Built from what was just written rather than read back and re-parsed.
+        assert cursor.lastrowid is not None  # pragma: no cover - sqlite insert contract
+        stored_event = StoredEvent(
+            id=event.id,
+            timestamp=event.timestamp,
+            run_id=event.run_id,
+            payload=payload,
+            integrity_warning=integrity_warning,
+            prev_hash=prev_hash,
+            hash=current_hash,
+            validated=True,
+            sequence=cursor.lastrowid,
+        )
+        self._write_merkle_head(
+            conn,
+            append_leaf(self._read_merkle_head(conn, event.run_id), run_id=event.run_id, event_hash=current_hash),
+        )
+        entry = self._read_run_entry(conn, event.run_id)
+        # integrity_warning only compares against the previous row, so the
+        # run's latest timestamp decides whether the event lands mid-timeline
+        # and the run's fold and snapshots must be replayed.
+        if entry is not None and event.timestamp < entry.last_event_at:
+            self._replay_run_catalog(conn, event.run_id)
+        else:
+            entry = advance_run_catalog_entry(entry, stored_event)
+            self._write_run_entry(conn, entry)
+            snapshot = snapshot_run_catalog_entry(entry, snapshot_interval=self._snapshot_interval)
+            if snapshot is not None:
+                self._write_snapshot(conn, snapshot)
+        return stored_event
 
-            row = conn.execute(
+    def list_by_run_id(self, run_id: str) -> list[StoredEvent]:
+        with sqlite3.connect(self._path) as conn:
+            return self._list_run_events(conn, run_id)
+
+    def _list_run_events(self, conn: sqlite3.Connection, run_id: str) -> list[StoredEvent]:
+        rows = conn.execute(
+            """
+            SELECT sequence, run_id, event_id, timestamp, payload_json, integrity_warning, prev_hash, hash, validated
+            FROM events
+            WHERE run_id = ?
+            ORDER BY timestamp ASC, sequence ASC
+            """,
+            (run_id,),
+        ).fetchall()
+        return [self._to_stored_event(row) for row in rows]
+
+    def list_fields_by_run_id(self, run_id: str, fields: tuple[str, ...]) -> list[dict[str, Any]]:
+        # Payload paths are read with json_extract so unselected payload data is
+        # never decoded; every extracted value comes back as JSON text.
+        expressions: list[str] = []
+        params: list[Any] = []
+        for field in fields:
+            if field.startswith("payload."):
+                segments = field.split(".")[1:]
+                ancestors = ["$." + ".".join(segments[:depth]) for depth in range(1, len(segments))]
+                if ancestors:
+                    guard = " OR ".join([_PAYLOAD_ANCESTOR_IS_SCALAR] * len(ancestors))
+                    expressions.append(f"CASE WHEN {guard} THEN NULL ELSE {_PAYLOAD_PATH_JSON} END")
+                    params.extend(ancestors)
+                else:
+                    expressions.append(_PAYLOAD_PATH_JSON)
+                params.extend(["$." + ".".join(segments)] * 2)
+            else:
+                expressions.append(_EVENT_FIELD_COLUMNS[field])
+        with sqlite3.connect(self._path) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {', '.join(expressions)}
+                FROM events
+                WHERE run_id = ?
+                ORDER BY timestamp ASC, sequence ASC
+                """,
+                (*params, run_id),
+            ).fetchall()
+        return [
+            {
+                field: _decode_event_field(field, value)
+                for field, value in zip(fields, row)
+                if value is not None
+            }
+            for row in rows
+        ]
+
+    def list_by_run_id_window(self, run_id: str, *, offset: int, limit: int) -> list[StoredEvent]:
+        with sqlite3.connect(self._path) as conn:
+            rows = conn.execute(
                 """
-                SELECT sequence, run_id, event_id, timestamp, payload_json, integrity_warning, prev_hash, hash
+                SELECT sequence, run_id, event_id, timestamp, payload_json, integrity_warning, prev_hash, hash, validated
                 FROM events
-                WHERE sequence = ?
+                WHERE run_id = ?
+                ORDER BY timestamp ASC, sequence ASC
+                LIMIT ? OFFSET ?
                 """,
-                (cursor.lastrowid,),
+                (run_id, limit, offset),
+            ).fetchall()
+        return [self._to_stored_event(row) for row in rows]
+
+    def count_by_run_id_before(self, run_id: str, timestamp: datetime, *, inclusive: bool = False) -> int:
+        operator = "<=" if inclusive else "<"
+        with sqlite3.connect(self._path) as conn:
+            (count,) = conn.execute(
+                f"SELECT COUNT(*) FROM events WHERE run_id = ? AND timestamp {operator} ?",
+                (run_id, timestamp.isoformat()),
             ).fetchone()
-            assert row is not None  # pragma: no cover - sqlite insert/read contract
-            return self._to_stored_event(row)
+        return int(count)
 
-    def list_by_run_id(self, run_id: str) -> list[StoredEvent]:
+    def list_by_run_id_after(
+        self, run_id: str, *, timestamp: datetime, sequence: int, limit: int
+    ) -> list[StoredEvent]:
+        key = timestamp.isoformat()
         with sqlite3.connect(self._path) as conn:
             rows = conn.execute(
                 """
-                SELECT sequence, run_id, event_id, timestamp, payload_json, integrity_warning, prev_hash, hash
+                SELECT sequence, run_id, event_id, timestamp, payload_json, integrity_warning, prev_hash, hash, validated
                 FROM events
-                WHERE run_id = ?
+                WHERE run_id = ? AND (timestamp > ? OR (timestamp = ? AND sequence > ?))
                 ORDER BY timestamp ASC, sequence ASC
+                LIMIT ?
                 """,
-                (run_id,),
+                (run_id, key, key, sequence, limit),
             ).fetchall()
         return [self._to_stored_event(row) for row in rows]
 
+    def count_by_run_id_through(self, run_id: str, *, timestamp: datetime, sequence: int) -> int:
+        key = timestamp.isoformat()
+        with sqlite3.connect(self._path) as conn:
+            (count,) = conn.execute(
+                """
+                SELECT COUNT(*)
+                FROM events
+                WHERE run_id = ? AND (timestamp < ? OR (timestamp = ? AND sequence <= ?))
+                """,
+                (run_id, key, key, sequence),
+            ).fetchone()
+        return int(count)
+
+    def list_by_run_ids(self, run_ids: list[str]) -> dict[str, list[StoredEvent]]:
+        unique_run_ids = list(dict.fromkeys(run_ids))
+        if not unique_run_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in unique_run_ids)
+        with sqlite3.connect(self._path) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT sequence, run_id, event_id, timestamp, payload_json, integrity_warning, prev_hash, hash, validated
+                FROM events
+                WHERE run_id IN ({placeholders})
+                ORDER BY run_id ASC, timestamp ASC, sequence ASC
+                """,
+                unique_run_ids,
+            ).fetchall()
+        events_by_run: dict[str, list[StoredEvent]] = {}
+        for row in rows:
+            event = self._to_stored_event(row)
+            events_by_run.setdefault(event.run_id, []).append(event)
+        return events_by_run
+
     def list_all(self) -> list[StoredEvent]:
         with sqlite3.connect(self._path) as conn:
             rows = conn.execute(
                 """
-                SELECT sequence, run_id, event_id, timestamp, payload_json, integrity_warning, prev_hash, hash
+                SELECT sequence, run_id, event_id, timestamp, payload_json, integrity_warning, prev_hash, hash, validated
                 FROM events
                 ORDER BY timestamp ASC, sequence ASC
                 """
             ).fetchall()
         return [self._to_stored_event(row) for row in rows]
 
+    def list_runs(self, query: RunCatalogQuery) -> list[RunCatalogEntry]:
+        clauses: list[str] = []
+        params: list[Any] = []
+        if query.status is not None:
+            clauses.append("status = ?")
+            params.append(query.status)
+        if query.inconsistent_only:
+            clauses.append("status IS NULL")
+        if query.workflow is not None:
+            clauses.append("workflow = ?")
+            params.append(query.workflow)
+        if query.updated_after is not None:
+            clauses.append("last_event_at > ?")
+            params.append(query.updated_after.isoformat())
+        if query.after is not None:
+            after_timestamp, after_run_id = query.after
+            clauses.append("(last_event_at < ? OR (last_event_at = ? AND run_id < ?))")
+            params.extend([after_timestamp.isoformat(), after_timestamp.isoformat(), after_run_id])
+        if query.after_run_id is not None:
+            clauses.append("run_id > ?")
+            params.append(query.after_run_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "run_id ASC" if query.order == "run_id" else "last_event_at DESC, run_id DESC"
+        limit = ""
+        if query.limit is not None:
+            limit = "LIMIT ?"
+            params.append(query.limit)
+        with sqlite3.connect(self._path) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {_RUN_CATALOG_COLUMNS}
+                FROM runs
+                {where}
+                ORDER BY {order}
+                {limit}
+                """,
+                params,
+            ).fetchall()
+        return [_to_run_catalog_entry(row) for row in rows]
+
+    def list_pending_approvals(self, query: PendingApprovalQuery) -> list[PendingApprovalEntry]:
+        clauses, params = _pending_approval_filters(query)
+        if query.after is not None:
+            after_requested_at, after_event_id = query.after
+            clauses.append("(requested_at > ? OR (requested_at = ? AND event_id > ?))")
+            params.extend([after_requested_at, after_requested_at, after_event_id])
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        limit = ""
+        if query.limit is not None:
+            limit = "LIMIT ?"
+            params.append(query.limit)
+        with sqlite3.connect(self._path) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT {_PENDING_APPROVAL_COLUMNS}
+                FROM pending_approvals
+                {where}
+                ORDER BY requested_at ASC, event_id ASC
+                {limit}
+                """,
+                params,
+            ).fetchall()
+        return [PendingApprovalEntry(*row) for row in rows]
+
+    def count_pending_approvals(self, query: PendingApprovalQuery) -> int:
+        clauses, params = _pending_approval_filters(query)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with sqlite3.connect(self._path) as conn:
+            (count,) = conn.execute(f"SELECT COUNT(*) FROM pending_approvals {where}", params).fetchone()
+        return int(count)
+
+    def latest_snapshot(
+        self,
+        run_id: str,
+        *,
+        max_position: int | None = None,
+        max_timestamp: datetime | None = None,
+    ) -> RunProjectionSnapshot | None:
+        clauses = ["run_id = ?"]
+        params: list[Any] = [run_id]
+        if max_position is not None:
+            clauses.append("position <= ?")
+            params.append(max_position)
+        if max_timestamp is not None:
+            clauses.append("last_event_at <= ?")
+            params.append(max_timestamp.isoformat())
+        with sqlite3.connect(self._path) as conn:
+            row = conn.execute(
+                f"""
+                SELECT run_id, position, last_event_at, fold_state_json, inconsistency_json
+                FROM run_snapshots
+                WHERE {' AND '.join(clauses)}
+                ORDER BY position DESC
+                LIMIT 1
+                """,
+                params,
+            ).fetchone()
+        if row is None:
+            return None
+        run_id_value, position, last_event_at, fold_state_json, inconsistency_json = row
+        return RunProjectionSnapshot(
+            run_id=str(run_id_value),
+            position=int(position),
+            last_event_at=datetime.fromisoformat(str(last_event_at)),
+            fold_state=json.loads(str(fold_state_json)) if fold_state_json is not None else None,
+            inconsistency=json.loads(str(inconsistency_json)) if inconsistency_json is not None else None,
+        )
+
+    def run_head(self, run_id: str) -> str | None:
+        with sqlite3.connect(self._path) as conn:
+            row = conn.execute(
+                """
+                SELECT hash
+                FROM events
+                WHERE run_id = ?
+                ORDER BY sequence DESC
+                LIMIT 1
+                """,
+                (run_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return str(row[0]) if row[0] is not None else ""
+
+    def run_heads(self, run_ids: list[str]) -> dict[str, str]:
+        unique_run_ids = list(dict.fromkeys(run_ids))
+        if not unique_run_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in unique_run_ids)
+        with sqlite3.connect(self._path) as conn:
+            rows = conn.execute(
+                f"""
+                SELECT run_id, hash
+                FROM events
+                WHERE sequence IN (
+                    SELECT MAX(sequence)
+                    FROM events
+                    WHERE run_id IN ({placeholders})
+                    GROUP BY run_id
+                )
+                """,
+                unique_run_ids,
+            ).fetchall()
+        return {str(run_id): str(head) if head is not None else "" for run_id, head in rows}
+
+    def last_sequence(self) -> int:
+        with sqlite3.connect(self._path) as conn:
+            (sequence,) = conn.execute("SELECT COALESCE(MAX(sequence), 0) FROM events").fetchone()
+        return int(sequence)
+
+    def list_chain(self, run_id: str, *, after_sequence: int = 0) -> list[StoredEvent]:
+        with sqlite3.connect(self._path) as conn:
+            rows = conn.execute(
+                """
+                SELECT sequence, run_id, event_id, timestamp, payload_json, integrity_warning, prev_hash, hash, validated
+                FROM events
+                WHERE run_id = ? AND sequence > ?
+                ORDER BY sequence ASC
+                """,
+                (run_id, after_sequence),
+            ).fetchall()
+        return [self._to_stored_event(row) for row in rows]
+
+    def chain_checkpoint(self, run_id: str) -> ChainCheckpoint | None:
+        with sqlite3.connect(self._path) as conn:
+            row = conn.execute(
+                "SELECT sequence, hash FROM chain_checkpoints WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return ChainCheckpoint(run_id=run_id, sequence=int(row[0]), hash=str(row[1]))
+
+    def save_chain_checkpoint(self, checkpoint: ChainCheckpoint) -> None:
+        with sqlite3.connect(self._path) as conn:
+            conn.execute(
+                """
+                INSERT INTO chain_checkpoints (run_id, sequence, hash)
+                VALUES (?, ?, ?)
+                ON CONFLICT(run_id) DO UPDATE SET
+                    sequence = excluded.sequence,
+                    hash = excluded.hash
+                WHERE excluded.sequence > chain_checkpoints.sequence
+                """,
+                (checkpoint.run_id, checkpoint.sequence, checkpoint.hash),
+            )
+
+    def merkle_head(self, run_id: str) -> MerkleFrontier | None:
+        with sqlite3.connect(self._path) as conn:
+            return self._read_merkle_head(conn, run_id)
+
+    def _read_merkle_head(self, conn: sqlite3.Connection, run_id: str) -> MerkleFrontier | None:
+        row = conn.execute(
+            "SELECT size, frontier_json, root FROM run_merkle WHERE run_id = ?",
+            (run_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        size, frontier_json, root = row
+        return MerkleFrontier(
+            run_id=run_id,
+            size=int(size),
+            frontier=tuple(json.loads(str(frontier_json))),
+            root=str(root),
+        )
+
+    def _write_merkle_head(self, conn: sqlite3.Connection, tree: MerkleFrontier) -> None:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO run_merkle (run_id, size, frontier_json, root)
+            VALUES (?, ?, ?, ?)
+            """,
+            (tree.run_id, tree.size, json.dumps(list(tree.frontier)), tree.root),
+        )
+
     def _ensure_schema(self) -> None:
         directory = os.path.dirname(self._path)
         if directory:
@@ -251,6 +1035,7 @@ class SQLiteAppendOnlyEventStore:
                     integrity_warning INTEGER NOT NULL DEFAULT 0,
                     prev_hash TEXT,
                     hash TEXT,
+                    validated INTEGER NOT NULL DEFAULT 0,
                     UNIQUE(run_id, event_id)
                 )
                 """
@@ -263,16 +1048,269 @@ class SQLiteAppendOnlyEventStore:
                 conn.execute("ALTER TABLE events ADD COLUMN prev_hash TEXT")
             if "hash" not in columns:
                 conn.execute("ALTER TABLE events ADD COLUMN hash TEXT")
+            if "validated" not in columns:
+                # Rows written before the marker existed keep full read checks.
+                conn.execute("ALTER TABLE events ADD COLUMN validated INTEGER NOT NULL DEFAULT 0")
             conn.execute(
                 """
                 CREATE INDEX IF NOT EXISTS idx_events_run_time
                 ON events(run_id, timestamp, sequence)
                 """
             )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_events_run_sequence
+                ON events(run_id, sequence)
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_id TEXT PRIMARY KEY,
+                    workflow TEXT,
+                    status TEXT,
+                    first_event_at TEXT NOT NULL,
+                    last_event_at TEXT NOT NULL,
+                    event_count INTEGER NOT NULL,
+                    fold_state_json TEXT,
+                    inconsistency_json TEXT
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_runs_last_event
+                ON runs(last_event_at, run_id)
+                """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_runs_status_last_event
+                ON runs(status, last_event_at, run_id)
+                """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_runs_workflow_last_event
+                ON runs(workflow, last_event_at, run_id)
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS run_snapshots (
+                    run_id TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    last_event_at TEXT NOT NULL,
+                    fold_state_json TEXT,
+                    inconsistency_json TEXT,
+                    PRIMARY KEY (run_id, position)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pending_approvals (
+                    run_id TEXT PRIMARY KEY,
+                    event_id TEXT NOT NULL,
+                    decision_id TEXT,
+                    requested_at TEXT NOT NULL,
+                    requested_by TEXT,
+                    title TEXT,
+                    details TEXT,
+                    reason TEXT,
+                    risk_level TEXT
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_pending_approvals_requested
+                ON pending_approvals(requested_at, event_id)
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS chain_checkpoints (
+                    run_id TEXT PRIMARY KEY,
+                    sequence INTEGER NOT NULL,
+                    hash TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS run_merkle (
+                    run_id TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    frontier_json TEXT NOT NULL,
+                    root TEXT NOT NULL
+                )
+                """
+            )
+            # Databases written before the catalog existed are backfilled once.
+            missing_run_ids = conn.execute(
+                """
+                SELECT DISTINCT run_id
+                FROM events
+                WHERE run_id NOT IN (SELECT run_id FROM runs)
+                """
+            ).fetchall()
+            for (run_id,) in missing_run_ids:
+                self._replay_run_catalog(conn, str(run_id))
+            # Likewise paused runs cataloged before the pending index existed.
+            unindexed_run_ids = conn.execute(
+                """
+                SELECT run_id
+                FROM runs
+                WHERE status = 'paused'
+                AND run_id NOT IN (SELECT run_id FROM pending_approvals)
+                """
+            ).fetchall()
+            for (run_id,) in unindexed_run_ids:
+                entry = self._read_run_entry(conn, str(run_id))
+                assert entry is not None  # pragma: no cover - selected from runs
+                self._write_pending_approval(conn, entry)
+            # And runs appended before Merkle heads were maintained.
+            untreed_run_ids = conn.execute(
+                """
+                SELECT DISTINCT run_id
+                FROM events
+                WHERE run_id NOT IN (SELECT run_id FROM run_merkle)
+                """
+            ).fetchall()
+            for (run_id,) in untreed_run_ids:
+                rows = conn.execute(
+                    "SELECT hash FROM events WHERE run_id = ? ORDER BY sequence ASC",
+                    (run_id,),
+                ).fetchall()
+                tree = build_frontier(
+                    run_id=str(run_id),
+                    event_hashes=[str(row[0]) if row[0] is not None else "" for row in rows],
+                )
+                assert tree is not None  # pragma: no cover - selected from events
+                self._write_merkle_head(conn, tree)
             conn.commit()
 
+    def _replay_run_catalog(self, conn: sqlite3.Connection, run_id: str) -> None:
+        entry, snapshots = replay_run_catalog(
+            run_id,
+            self._list_run_events(conn, run_id),
+            snapshot_interval=self._snapshot_interval,
+        )
+        conn.execute("DELETE FROM run_snapshots WHERE run_id = ?", (run_id,))
+        if entry is not None:
+            self._write_run_entry(conn, entry)
+        for snapshot in snapshots:
+            self._write_snapshot(conn, snapshot)
+
+    def _write_snapshot(self, conn: sqlite3.Connection, snapshot: RunProjectionSnapshot) -> None:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO run_snapshots (
+                run_id,
+                position,
+                last_event_at,
+                fold_state_json,
+                inconsistency_json
+            )
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                snapshot.run_id,
+                snapshot.position,
+                snapshot.last_event_at.isoformat(),
+                json.dumps(snapshot.fold_state, separators=(",", ":"))
+                if snapshot.fold_state is not None
+                else None,
+                json.dumps(snapshot.inconsistency, separators=(",", ":"))
+                if snapshot.inconsistency is not None
+                else None,
+            ),
+        )
+
+    def _read_run_entry(self, conn: sqlite3.Connection, run_id: str) -> RunCatalogEntry | None:
+        row = conn.execute(
+            f"""
+            SELECT {_RUN_CATALOG_COLUMNS}
+            FROM runs
+            WHERE run_id = ?
+            """,
+            (run_id,),
+        ).fetchone()
+        return _to_run_catalog_entry(row) if row is not None else None
+
+    def _write_run_entry(self, conn: sqlite3.Connection, entry: RunCatalogEntry) -> None:
+        conn.execute(
+            f"""
+            INSERT OR REPLACE INTO runs ({_RUN_CATALOG_COLUMNS})
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                entry.run_id,
+                entry.workflow,
+                entry.status,
+                entry.first_event_at.isoformat(),
+                entry.last_event_at.isoformat(),
+                entry.event_count,
+                json.dumps(entry.fold_state, separators=(",", ":"))
+                if entry.fold_state is not None
+                else None,
+                json.dumps(entry.inconsistency, separators=(",", ":"))
+                if entry.inconsistency is not None
+                else None,
+            ),
+        )
+        self._write_pending_approval(conn, entry)
+
+    def _write_pending_approval(self, conn: sqlite3.Connection, entry: RunCatalogEntry) -> None:
+        pending = pending_approval_context(entry)
+        if pending is None:
+            conn.execute("DELETE FROM pending_approvals WHERE run_id = ?", (entry.run_id,))
+            return
+        indexed = conn.execute(
+            "SELECT event_id FROM pending_approvals WHERE run_id = ?", (entry.run_id,)
+        ).fetchone()
+        if indexed is not None and indexed[0] == pending["event_id"]:
+            return
+        row = conn.execute(
+            """
+            SELECT sequence, run_id, event_id, timestamp, payload_json, integrity_warning, prev_hash, hash, validated
+            FROM events
+            WHERE run_id = ? AND event_id = ?
+            """,
+            (entry.run_id, pending["event_id"]),
+        ).fetchone()
+        approval = build_pending_approval_entry(pending=pending, event=self._to_stored_event(row))
+        conn.execute(
+            f"""
+            INSERT OR REPLACE INTO pending_approvals ({_PENDING_APPROVAL_COLUMNS})
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                approval.event_id,
+                approval.decision_id,
+                approval.run_id,
+                approval.requested_at,
+                approval.requested_by,
+                approval.title,
+                approval.details,
+                approval.reason,
+                approval.risk_level,
+            ),
+        )
+
     def _to_stored_event(self, row: tuple[Any, ...]) -> StoredEvent:
-        _sequence, run_id, event_id, timestamp, payload_json, integrity_warning, prev_hash, current_hash = row
+        (
+            sequence,
+            run_id,
+            event_id,
+            timestamp,
+            payload_json,
+            integrity_warning,
+            prev_hash,
+            current_hash,
+            validated,
+        ) = row
         return StoredEvent(
             id=str(event_id),
             timestamp=datetime.fromisoformat(str(timestamp)),
@@ -281,9 +1319,108 @@ class SQLiteAppendOnlyEventStore:
             integrity_warning=bool(integrity_warning),
             prev_hash=str(prev_hash) if prev_hash is not None else None,
             hash=str(current_hash) if current_hash is not None else "",
+            validated=bool(validated),
+            sequence=int(sequence),
         )
 
 
+def _decode_event_field(field: str, value: Any) -> Any:
+    if field in ("id", "run_id"):
+        return str(value)
+    if field == "timestamp":
+        return datetime.fromisoformat(str(value))
+    if field == "integrity_warning":
+        return bool(value)
+    return json.loads(str(value))
+
+
+def _timeline_key(record: _StoredRecord) -> tuple[datetime, int]:
+    return record.timestamp, record.sequence
+
+
+def _pending_approval_filters(query: PendingApprovalQuery) -> tuple[list[str], list[Any]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    if query.risk_level is not None:
+        clauses.append("risk_level = ?")
+        params.append(query.risk_level)
+    if query.requested_by is not None:
+        clauses.append("requested_by = ?")
+        params.append(query.requested_by)
+    if query.run_id is not None:
+        clauses.append("run_id = ?")
+        params.append(query.run_id)
+    return clauses, params
+
+
+def _to_run_catalog_entry(row: tuple[Any, ...]) -> RunCatalogEntry:
+    (
+        run_id,
+        workflow,
+        status,
+        first_event_at,
+        last_event_at,
+        event_count,
+        fold_state_json,
+        inconsistency_json,
+    ) = row
+    return RunCatalogEntry(
+        run_id=str(run_id),
+        workflow=str(workflow) if workflow is not None else None,
+        status=status,
+        first_event_at=datetime.fromisoformat(str(first_event_at)),
+        last_event_at=datetime.fromisoformat(str(last_event_at)),
+        event_count=int(event_count),
+        fold_state=json.loads(str(fold_state_json)) if fold_state_json is not None else None,
+        inconsistency=json.loads(str(inconsistency_json)) if inconsistency_json is not None else None,
+    )
+
+
+def _notify_append_listeners(listeners: list[AppendListener], events: list[StoredEvent]) -> None:
+    for listener in listeners:
+        listener(events)
+
+
+def configured_event_store_db_path() -> str:
+    configured = os.getenv(_EVENT_STORE_DB_PATH_ENV)
+    if configured is None:
+        return _DEFAULT_EVENT_STORE_DB_PATH
+    value = configured.strip()
+    if value == "":
+        return _DEFAULT_EVENT_STORE_DB_PATH
+    return value
+
+
+def configured_projection_snapshot_interval() -> int:
+    configured = os.getenv(_PROJECTION_SNAPSHOT_INTERVAL_ENV)
+    if configured is None or configured.strip() == "":
+        return _DEFAULT_PROJECTION_SNAPSHOT_INTERVAL
+    try:
+        return max(0, int(configured.strip()))
+    except ValueError:
+        return _DEFAULT_PROJECTION_SNAPSHOT_INTERVAL
+
+
+def configured_event_hash_algorithm() -> str:
+    configured = os.getenv(_EVENT_HASH_ALGORITHM_ENV)
+    if configured is None:
+        return _DEFAULT_EVENT_HASH_ALGORITHM
+    value = configured.strip().lower()
+    if value not in EVENT_HASH_ALGORITHMS:
+        return _DEFAULT_EVENT_HASH_ALGORITHM
+    return value
+
+
+def event_hash_algorithm(event_hash: str) -> str:
+    """Return the algorithm an event hash was built with, from its prefix.
+
+    Unknown prefixes fall back to sha256, so they fail verification as a
+    mismatch rather than an error.
+    """
+    prefix, _, _ = event_hash.partition(":")
+    return prefix if prefix in EVENT_HASH_ALGORITHMS else _DEFAULT_EVENT_HASH_ALGORITHM
+
+
 def _build_event_hash(
     *,
     run_id: str,
@@ -292,18 +1429,53 @@ def _build_event_hash(
     payload: dict[str, Any],
     integrity_warning: bool,
     prev_hash: str | None,
+    algorithm: str = _DEFAULT_EVENT_HASH_ALGORITHM,
+) -> str:
+    return _hash_payload_json(
+        run_id=run_id,
+        event_id=event_id,
+        timestamp=timestamp,
+        payload_json=_canonical_payload_json(payload),
+        integrity_warning=integrity_warning,
+        prev_hash=prev_hash,
+        algorithm=algorithm,
+    )
+
+
+def _canonical_payload_json(payload: dict[str, Any]) -> str:
+    """Serialize a payload the way every hash scheme embeds it: compact and key-sorted.
+
+    Key order is canonical, so a payload re-serialized in any key order still
+    verifies. The SQLite store persists exactly this string, so an append
+    serializes once.
+    """
+    return _SORTED_COMPACT_JSON_ENCODER.encode(payload)
+
+
+def _hash_payload_json(
+    *,
+    run_id: str,
+    event_id: str,
+    timestamp: str,
+    payload_json: str,
+    integrity_warning: bool,
+    prev_hash: str | None,
+    algorithm: str,
 ) -> str:
-    canonical = json.dumps(
-        {
-            "run_id": run_id,
-            "event_id": event_id,
-            "timestamp": timestamp,
-            "payload": payload,
-            "integrity_warning": integrity_warning,
-            "prev_hash": prev_hash,
-        },
-        sort_keys=True,
-        separators=(",", ":"),
+    encode = _COMPACT_JSON_ENCODER.encode
+    if algorithm == "blake2b":
+        # One flat array in a fixed field order around the key-sorted payload,
+        # so the wrapper needs no key sort of its own.
+        header = encode([run_id, event_id, timestamp, integrity_warning, prev_hash])
+        canonical = f"{header[:-1]},{payload_json}]"
+        digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=32).hexdigest()
+        return f"blake2b:{digest}"
+    # Byte-for-byte the key-sorted compact JSON object
+    # {event_id, integrity_warning, payload, prev_hash, run_id, timestamp}.
+    canonical = (
+        f'{{"event_id":{encode(event_id)},"integrity_warning":{encode(integrity_warning)},'
+        f'"payload":{payload_json},"prev_hash":{encode(prev_hash)},'
+        f'"run_id":{encode(run_id)},"timestamp":{encode(timestamp)}}}'
     )
     digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
     return f"sha256:{digest}"
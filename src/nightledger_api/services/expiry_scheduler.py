@@ -0,0 +1,359 @@
+import heapq
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Literal
+from uuid import uuid4
+
+from nightledger_api.services.business_rules_service import validate_event_business_rules
+from nightledger_api.services.event_ingest_service import validate_event_payload
+from nightledger_api.services.event_store import EventStore, StoredEvent
+from nightledger_api.services.run_catalog_service import PendingApprovalQuery, RunCatalogQuery
+from nightledger_api.services.run_status_service import project_run_status, terminal_status_of
+from nightledger_api.services.run_write_locks import run_write_lock
+
+_APPROVAL_TTL_ENV = "NIGHTLEDGER_APPROVAL_TTL_SECONDS"
+_RUN_TTL_ENV = "NIGHTLEDGER_RUN_TTL_SECONDS"
+# Statuses a run can still leave; everything else is terminal.
+_ACTIVE_RUN_STATUSES = ("running", "paused", "approved", "rejected")
+logger = logging.getLogger(__name__)
+
+ExpiryKind = Literal["approval", "run"]
+# (deadline, kind, run_id, pending approval event_id or "" for run deadlines)
+_Deadline = tuple[datetime, ExpiryKind, str, str]
+
+
+class ExpiryScheduler:
+    """Appends approval_expired and run_expired events when deadlines pass.
+
+    Deadlines live in a min-heap fed by the store's append listener, so the
+    worker sleeps until the earliest one and never scans the store. Heap
+    entries are lazy: a resolved approval or a run touched since its deadline
+    was pushed is dropped or pushed back when it pops. Due entries are checked
+    against the run's events once more before the expiry event goes through
+    the same validation as POST /v1/events.
+
+    start() rebuilds the heap from the pending approvals index and the run
+    catalog, so deadlines survive a restart.
+    """
+
+    def __init__(
+        self,
+        store: EventStore,
+        *,
+        approval_ttl: timedelta | None,
+        run_ttl: timedelta | None,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._store = store
+        self._approval_ttl = approval_ttl
+        self._run_ttl = run_ttl
+        self._clock = clock if clock is not None else _utc_now
+        self._condition = threading.Condition()
+        self._heap: list[_Deadline] = []
+        # Latest pending approval event per run, as seen on append.
+        self._pending_by_run: dict[str, str] = {}
+        # Latest event time of active runs, and the runs with a heap entry.
+        self._last_event_at_by_run: dict[str, datetime] = {}
+        self._scheduled_runs: set[str] = set()
+        self._listening = False
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if not self._listening:
+            self._listen(self._store)
+            self._listening = True
+        self.rebuild()
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="nightledger-expiry", daemon=True)
+        self._thread.start()
+
+    def rebind(self, store: EventStore) -> None:
+        """Track store instead, as when the demo reset-seed replaces the store.
+
+        Deadlines are rebuilt from the new store; appends to the old one are
+        ignored from here on.
+        """
+        with self._condition:
+            self._store = store
+        if self._listening:
+            self._listen(store)
+        self.rebuild()
+
+    def _listen(self, store: EventStore) -> None:
+        def _observe_if_current(events: list[StoredEvent]) -> None:
+            if store is self._store:
+                self.observe(events)
+
+        store.add_append_listener(_observe_if_current)
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def rebuild(self) -> None:
+        with self._condition:
+            self._heap.clear()
+            self._pending_by_run.clear()
+            self._last_event_at_by_run.clear()
+            self._scheduled_runs.clear()
+            if self._approval_ttl is not None:
+                for approval in self._store.list_pending_approvals(PendingApprovalQuery(limit=None)):
+                    self._track_approval(
+                        run_id=approval.run_id,
+                        event_id=approval.event_id,
+                        requested_at=datetime.fromisoformat(approval.requested_at),
+                    )
+            if self._run_ttl is not None:
+                for status in _ACTIVE_RUN_STATUSES:
+                    for entry in self._store.list_runs(RunCatalogQuery(status=status, limit=None)):
+                        self._track_run(run_id=entry.run_id, last_event_at=entry.last_event_at)
+            self._condition.notify_all()
+
+    def observe(self, events: list[StoredEvent]) -> None:
+        """Append listener: track deadlines for newly stored events."""
+        with self._condition:
+            earliest = self._heap[0][0] if self._heap else None
+            for event in events:
+                if terminal_status_of(event.payload) is not None:
+                    self._pending_by_run.pop(event.run_id, None)
+                    self._last_event_at_by_run.pop(event.run_id, None)
+                    continue
+                if self._run_ttl is not None:
+                    self._track_run(run_id=event.run_id, last_event_at=event.timestamp)
+                if _requests_approval(event.payload):
+                    if self._approval_ttl is not None:
+                        self._track_approval(
+                            run_id=event.run_id, event_id=event.id, requested_at=event.timestamp
+                        )
+                elif _resolves_approval(event.payload):
+                    self._pending_by_run.pop(event.run_id, None)
+            if self._heap and (earliest is None or self._heap[0][0] < earliest):
+                self._condition.notify_all()
+
+    def next_deadline(self) -> datetime | None:
+        with self._condition:
+            return self._heap[0][0] if self._heap else None
+
+    def run_due(self, now: datetime | None = None) -> list[StoredEvent]:
+        """Expire everything due at now and return the appended expiry events."""
+        now = now if now is not None else self._clock()
+        appended: list[StoredEvent] = []
+        for kind, run_id, event_id in self._pop_due(now):
+            try:
+                stored = self._expire(kind=kind, run_id=run_id, event_id=event_id, now=now)
+            except Exception:
+                logger.exception("expiry of %s deadline for run %s failed", kind, run_id)
+                continue
+            if stored is not None:
+                appended.append(stored)
+        return appended
+
+    def _pop_due(self, now: datetime) -> list[tuple[ExpiryKind, str, str]]:
+        due: list[tuple[ExpiryKind, str, str]] = []
+        with self._condition:
+            while self._heap and self._heap[0][0] <= now:
+                _, kind, run_id, event_id = heapq.heappop(self._heap)
+                if kind == "approval":
+                    if self._pending_by_run.get(run_id) == event_id:
+                        due.append((kind, run_id, event_id))
+                    continue
+                self._scheduled_runs.discard(run_id)
+                last_event_at = self._last_event_at_by_run.get(run_id)
+                if last_event_at is None:
+                    continue
+                assert self._run_ttl is not None  # pragma: no cover - run deadlines need a TTL
+                if last_event_at + self._run_ttl > now:
+                    self._track_run(run_id=run_id, last_event_at=last_event_at)
+                    continue
+                due.append((kind, run_id, event_id))
+        return due
+
+    def _expire(
+        self, *, kind: ExpiryKind, run_id: str, event_id: str, now: datetime
+    ) -> StoredEvent | None:
+        # Approval resolution holds the same lock between its pending check
+        # and its append, so the two never settle one request twice.
+        with run_write_lock(run_id):
+            return self._expire_locked(kind=kind, run_id=run_id, event_id=event_id, now=now)
+
+    def _expire_locked(
+        self, *, kind: ExpiryKind, run_id: str, event_id: str, now: datetime
+    ) -> StoredEvent | None:
+        # Re-check against the stored run: other writers (or processes sharing
+        # a SQLite file) may have moved it on since the deadline was tracked.
+        run_events = self._store.list_by_run_id(run_id)
+        if not run_events:
+            return None
+        projection = project_run_status(run_events)
+        if projection.status not in _ACTIVE_RUN_STATUSES:
+            return None
+        if kind == "approval":
+            pending = projection.pending_approval
+            if pending is None or pending.get("event_id") != event_id:
+                return None
+            target = next(event for event in reversed(run_events) if event.id == event_id)
+            payload = _approval_expired_payload(target=target, run_events=run_events, now=now)
+        else:
+            assert self._run_ttl is not None  # pragma: no cover - run deadlines need a TTL
+            last_event_at = run_events[-1].timestamp
+            if last_event_at + self._run_ttl > now:
+                with self._condition:
+                    self._track_run(run_id=run_id, last_event_at=last_event_at)
+                return None
+            payload = _run_expired_payload(run_events=run_events, ttl=self._run_ttl, now=now)
+
+        event = validate_event_payload(payload)
+        validate_event_business_rules(event=event, existing_events=run_events)
+        return self._store.append(event)
+
+    def _track_approval(self, *, run_id: str, event_id: str, requested_at: datetime) -> None:
+        assert self._approval_ttl is not None  # pragma: no cover - callers check the TTL
+        self._pending_by_run[run_id] = event_id
+        heapq.heappush(self._heap, (requested_at + self._approval_ttl, "approval", run_id, event_id))
+
+    def _track_run(self, *, run_id: str, last_event_at: datetime) -> None:
+        assert self._run_ttl is not None  # pragma: no cover - callers check the TTL
+        previous = self._last_event_at_by_run.get(run_id)
+        if previous is None or last_event_at > previous:
+            self._last_event_at_by_run[run_id] = last_event_at
+        # One heap entry per run; later activity only moves the tracked time,
+        # and the entry is pushed back when it pops early.
+        if run_id not in self._scheduled_runs:
+            self._scheduled_runs.add(run_id)
+            deadline = self._last_event_at_by_run[run_id] + self._run_ttl
+            heapq.heappush(self._heap, (deadline, "run", run_id, ""))
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopping:
+                    timeout = self._seconds_until_next_deadline()
+                    if timeout is not None and timeout <= 0:
+                        break
+                    self._condition.wait(timeout)
+                if self._stopping:
+                    return
+            self.run_due()
+
+    def _seconds_until_next_deadline(self) -> float | None:
+        if not self._heap:
+            return None
+        return (self._heap[0][0] - self._clock()).total_seconds()
+
+
+def configured_expiry_scheduler(store: EventStore) -> ExpiryScheduler | None:
+    """Build the scheduler from env TTLs; None when both expiries are disabled."""
+    approval_ttl = _configured_ttl(_APPROVAL_TTL_ENV)
+    run_ttl = _configured_ttl(_RUN_TTL_ENV)
+    if approval_ttl is None and run_ttl is None:
+        return None
+    return ExpiryScheduler(store, approval_ttl=approval_ttl, run_ttl=run_ttl)
+
+
+def _configured_ttl(env: str) -> timedelta | None:
+    configured = os.getenv(env)
+    if configured is None or configured.strip() == "":
+        return None
+    try:
+        seconds = float(configured.strip())
+    except ValueError:
+        return None
+    return timedelta(seconds=seconds) if seconds > 0 else None
+
+
+def _approval_expired_payload(
+    *, target: StoredEvent, run_events: list[StoredEvent], now: datetime
+) -> dict[str, Any]:
+    approval = target.payload.get("approval", {})
+    return _expiry_payload(
+        run_events=run_events,
+        now=now,
+        step="approval_expired",
+        title="Approval expired",
+        details=f"Approval request {target.id} was not resolved before its deadline.",
+        decision_id=approval.get("decision_id"),
+        risk_level=target.payload.get("risk_level"),
+    )
+
+
+def _run_expired_payload(
+    *, run_events: list[StoredEvent], ttl: timedelta, now: datetime
+) -> dict[str, Any]:
+    return _expiry_payload(
+        run_events=run_events,
+        now=now,
+        step="run_expired",
+        title="Run expired",
+        details=f"Run had no events for {ttl.total_seconds():g} seconds.",
+        decision_id=None,
+        risk_level="low",
+    )
+
+
+def _expiry_payload(
+    *,
+    run_events: list[StoredEvent],
+    now: datetime,
+    step: str,
+    title: str,
+    details: str,
+    decision_id: str | None,
+    risk_level: Any,
+) -> dict[str, Any]:
+    latest = run_events[-1]
+    min_expiry_time = latest.timestamp + timedelta(milliseconds=1)
+    expired_at = _format_timestamp(now if now > min_expiry_time else min_expiry_time)
+    meta = latest.payload.get("meta")
+    workflow = meta.get("workflow") if isinstance(meta, dict) else None
+    return {
+        "id": f"evt_{step}_{uuid4().hex[:16]}",
+        "run_id": latest.run_id,
+        "timestamp": expired_at,
+        "type": "error",
+        "actor": "system",
+        "title": title,
+        "details": details,
+        "confidence": 1.0,
+        "risk_level": risk_level,
+        "requires_approval": False,
+        "approval": {
+            "status": "not_required",
+            "decision_id": decision_id,
+            "requested_by": None,
+            "resolved_by": None,
+            "resolved_at": None,
+            "reason": None,
+        },
+        "evidence": [],
+        "meta": {"workflow": workflow if isinstance(workflow, str) else "approval_gate", "step": step},
+    }
+
+
+def _requests_approval(payload: dict[str, Any]) -> bool:
+    approval = payload.get("approval", {})
+    return payload.get("type") == "approval_requested" or (
+        bool(payload.get("requires_approval", False)) and approval.get("status") == "pending"
+    )
+
+
+def _resolves_approval(payload: dict[str, Any]) -> bool:
+    approval = payload.get("approval", {})
+    return payload.get("type") == "approval_resolved" or (
+        bool(payload.get("requires_approval", False))
+        and approval.get("status") in {"approved", "rejected"}
+    )
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _format_timestamp(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -0,0 +1,102 @@
+import re
+from copy import deepcopy
+from typing import Any
+
+from nightledger_api.services.errors import InvalidQueryParameterError
+
+_FIELD_SEGMENT = re.compile(r"^[A-Za-z0-9_]+$")
+_MISSING = object()
+
+EVENT_FIELDS = frozenset({"id", "timestamp", "run_id", "payload", "integrity_warning"})
+# Only the payload object may be addressed with dotted paths on events.
+EVENT_NESTED_FIELDS = frozenset({"payload"})
+JOURNAL_ENTRY_FIELDS = frozenset(
+    {
+        "entry_id",
+        "event_id",
+        "timestamp",
+        "event_type",
+        "title",
+        "details",
+        "payload_ref",
+        "approval_context",
+        "metadata",
+        "evidence_refs",
+        "approval_indicator",
+    }
+)
+JOURNAL_ENTRY_NESTED_FIELDS = frozenset({"payload_ref", "approval_context", "metadata", "approval_indicator"})
+
+
+def parse_fields(
+    raw: str, *, allowed: frozenset[str], nested: frozenset[str], path: str = "fields"
+) -> tuple[str, ...]:
+    """Parse a comma-separated sparse fieldset into normalized dotted paths.
+
+    Duplicates are dropped, and so are paths already covered by a selected
+    ancestor (payload makes payload.type redundant).
+    """
+    requested: list[str] = []
+    for item in raw.split(","):
+        field = item.strip()
+        if not field:
+            continue
+        segments = field.split(".")
+        if (
+            segments[0] not in allowed
+            or (len(segments) > 1 and segments[0] not in nested)
+            or not all(_FIELD_SEGMENT.match(segment) for segment in segments)
+        ):
+            raise InvalidQueryParameterError(
+                path=path,
+                message=f"unknown field '{field}'",
+                code="INVALID_FIELD",
+            )
+        requested.append(field)
+    if not requested:
+        raise InvalidQueryParameterError(
+            path=path,
+            message="fields must name at least one field",
+            code="INVALID_FIELD",
+        )
+
+    selected: list[str] = []
+    for field in sorted(set(requested), key=lambda item: (item.count("."), item)):
+        if not any(field.startswith(f"{parent}.") for parent in selected):
+            selected.append(field)
+    order = {field: position for position, field in enumerate(dict.fromkeys(requested))}
+    return tuple(sorted(selected, key=order.__getitem__))
+
+
+def select_fields(row: dict[str, Any], fields: tuple[str, ...]) -> dict[str, Any]:
+    """Return {path: value} for each selected path; missing paths read as None.
+
+    Paths running through a non-object value (payload.title.x) are left out,
+    so the selection never nests objects where the row holds a scalar.
+    """
+    selected: dict[str, Any] = {}
+    for field in fields:
+        value: Any = row
+        through_scalar = False
+        for segment in field.split("."):
+            if value is _MISSING:
+                break
+            if not isinstance(value, dict):
+                through_scalar = True
+                break
+            value = value.get(segment, _MISSING)
+        if not through_scalar:
+            selected[field] = None if value is _MISSING else deepcopy(value)
+    return selected
+
+
+def nest_fields(flat: dict[str, Any]) -> dict[str, Any]:
+    """Expand {dotted path: value} into nested objects."""
+    nested: dict[str, Any] = {}
+    for field, value in flat.items():
+        *parents, leaf = field.split(".")
+        target = nested
+        for segment in parents:
+            target = target.setdefault(segment, {})
+        target[leaf] = value
+    return nested
@@ -1,10 +1,14 @@
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterable, Iterator, Literal
 
-from nightledger_api.services.errors import InconsistentRunStateError
+from nightledger_api.services.cursor import decode_cursor, encode_cursor, invalid_cursor_error
+from nightledger_api.services.errors import InconsistentRunStateError, InvalidQueryParameterError
 from nightledger_api.services.event_store import StoredEvent
 
+JournalVerification = Literal["trusted", "full"]
+
 
 @dataclass(frozen=True)
 class PayloadRef:
@@ -86,11 +90,72 @@ class RunJournalProjection:
         }
 
 
-def project_run_journal(*, run_id: str, events: list[StoredEvent]) -> RunJournalProjection:
-    entries: list[JournalEntry] = []
+@dataclass(frozen=True)
+class RenderedRunJournal:
+    """Journal response assembled from pre-encoded entry fragments.
+
+    extra holds trailing top-level fields (for example next_cursor).
+    """
+
+    run_id: str
+    fragments: list[bytes]
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def to_json_bytes(self) -> bytes:
+        return _render_journal_body(key="run_id", value=self.run_id, fragments=self.fragments, extra=self.extra)
+
+
+@dataclass(frozen=True)
+class RenderedWorkflowJournal:
+    """Merged journal of a workflow's runs; every entry carries its run_id."""
+
+    workflow: str
+    fragments: list[bytes]
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def to_json_bytes(self) -> bytes:
+        return _render_journal_body(
+            key="workflow", value=self.workflow, fragments=self.fragments, extra=self.extra
+        )
+
+
+def project_run_journal(
+    *,
+    run_id: str,
+    events: list[StoredEvent],
+    verification: JournalVerification = "trusted",
+) -> RunJournalProjection:
+    return RunJournalProjection(
+        run_id=run_id,
+        entries=list(iter_run_journal(run_id=run_id, events=events, verification=verification)),
+    )
+
+
+def iter_run_journal(
+    *,
+    run_id: str,
+    events: Iterable[StoredEvent],
+    start_index: int = 1,
+    verification: JournalVerification = "trusted",
+) -> Iterator[JournalEntry]:
+    """Lazily project journal entries.
+
+    events may be a window of the run's timeline; start_index is the 1-based
+    timeline position of its first event, which keeps entry ids stable across
+    pages. Trusted verification skips per-event checks already enforced for
+    events the store marked as validated; "full" re-checks every event.
+    """
+    for index, event in iter_journal_positions(run_id=run_id, events=events, start_index=start_index):
+        yield build_journal_entry(run_id=run_id, event=event, index=index, verification=verification)
+
+
+def iter_journal_positions(
+    *, run_id: str, events: Iterable[StoredEvent], start_index: int = 1
+) -> Iterator[tuple[int, StoredEvent]]:
+    """Yield (timeline position, event) pairs after the stream-level checks."""
     last_timestamp: datetime | None = None
 
-    for index, event in enumerate(events, start=1):
+    for index, event in enumerate(events, start=start_index):
         if event.run_id != run_id:
             raise InconsistentRunStateError(
                 detail_path="run_id",
@@ -115,8 +180,122 @@ def project_run_journal(*, run_id: str, events: list[StoredEvent]) -> RunJournal
                 detail_type="state_conflict",
             )
         last_timestamp = event.timestamp
+        yield index, event
 
-        payload = event.payload
+
+def journal_entry_id(*, run_id: str, index: int) -> str:
+    return f"jrnl_{run_id}_{index:04d}"
+
+
+def parse_journal_entry_id(*, run_id: str, entry_id: str) -> int:
+    """Return the 1-based timeline position encoded in a run's entry id."""
+    prefix = f"jrnl_{run_id}_"
+    position = entry_id[len(prefix) :] if entry_id.startswith(prefix) else ""
+    if not position.isdigit() or int(position) < 1:
+        raise invalid_entry_id_error(run_id=run_id)
+    return int(position)
+
+
+def invalid_entry_id_error(*, run_id: str) -> InvalidQueryParameterError:
+    return InvalidQueryParameterError(
+        path="since_entry",
+        message=f"since_entry must be a journal entry id of run '{run_id}'",
+        code="INVALID_ENTRY_ID",
+    )
+
+
+@dataclass(frozen=True)
+class JournalCursor:
+    """Timeline key (timestamp, sequence) of the last journal entry served.
+
+    index is that entry's timeline position when it was served; a different
+    position on resume means appends have landed at or before the key since.
+    delta marks cursors issued by delta reads, which resume as delta reads.
+    """
+
+    timestamp: datetime
+    sequence: int
+    index: int
+    delta: bool = False
+
+
+def encode_journal_cursor(*, timestamp: datetime, sequence: int, index: int, delta: bool = False) -> str:
+    fields: dict[str, Any] = {"ts": timestamp.isoformat(), "seq": sequence, "pos": index}
+    if delta:
+        fields["delta"] = True
+    return encode_cursor(fields)
+
+
+def decode_journal_cursor(cursor: str) -> JournalCursor:
+    fields = decode_cursor(cursor)
+    raw_timestamp, sequence, index = fields.get("ts"), fields.get("seq"), fields.get("pos")
+    delta = fields.get("delta", False)
+    if (
+        not isinstance(raw_timestamp, str)
+        or not _is_int_at_least(sequence, 0)
+        or not _is_int_at_least(index, 1)
+        or not isinstance(delta, bool)
+    ):
+        raise invalid_cursor_error()
+    try:
+        timestamp = datetime.fromisoformat(raw_timestamp)
+    except ValueError as exc:
+        raise invalid_cursor_error() from exc
+    if timestamp.tzinfo is None:
+        raise invalid_cursor_error()
+    return JournalCursor(timestamp=timestamp, sequence=sequence, index=index, delta=delta)
+
+
+def _is_int_at_least(value: Any, minimum: int) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value >= minimum
+
+
+def encode_workflow_journal_cursor(*, timestamp: datetime, run_id: str, index: int) -> str:
+    # Merge key (timestamp, run_id, timeline position) of the last entry served.
+    return encode_cursor({"ts": timestamp.isoformat(), "run": run_id, "pos": index})
+
+
+def decode_workflow_journal_cursor(cursor: str) -> tuple[datetime, str, int]:
+    fields = decode_cursor(cursor)
+    raw_timestamp, run_id, index = fields.get("ts"), fields.get("run"), fields.get("pos")
+    if (
+        not isinstance(raw_timestamp, str)
+        or not isinstance(run_id, str)
+        or not isinstance(index, int)
+        or isinstance(index, bool)
+        or index < 1
+    ):
+        raise invalid_cursor_error()
+    try:
+        timestamp = datetime.fromisoformat(raw_timestamp)
+    except ValueError as exc:
+        raise invalid_cursor_error() from exc
+    if timestamp.tzinfo is None:
+        raise invalid_cursor_error()
+    return timestamp, run_id, index
+
+
+def with_entry_run_id(*, run_id: str, fragment: bytes) -> bytes:
+    """Prefix an encoded journal entry object with its run_id."""
+    separator = b"" if fragment == b"{}" else b","
+    return b'{"run_id":' + encode_json(run_id) + separator + fragment[1:]
+
+
+def build_journal_entry(
+    *,
+    run_id: str,
+    event: StoredEvent,
+    index: int,
+    verification: JournalVerification = "trusted",
+) -> JournalEntry:
+    payload = event.payload
+    if verification == "trusted" and event.validated:
+        # Schema validation at write time already guarantees the payload shape,
+        # traceability identity and non-empty readable fields.
+        event_type = payload["type"]
+        title = payload["title"]
+        details = payload["details"]
+    else:
         if not isinstance(payload, dict):
             raise InconsistentRunStateError(
                 detail_path="payload",
@@ -128,48 +307,77 @@ def project_run_journal(*, run_id: str, events: list[StoredEvent]) -> RunJournal
         event_type = _required_readable_field(payload, "type")
         title = _required_readable_field(payload, "title")
         details = _required_readable_field(payload, "details")
-        evidence_refs = _evidence_refs(payload.get("evidence"))
-        _assert_risky_action_has_evidence(
-            event_type=event_type,
-            payload=payload,
-            evidence_refs=evidence_refs,
-        )
-        approval_raw = payload.get("approval", {})
-        approval = approval_raw if isinstance(approval_raw, dict) else {}
-
-        entries.append(
-            JournalEntry(
-                entry_id=f"jrnl_{run_id}_{index:04d}",
-                event_id=event.id,
-                timestamp=_format_timestamp(event.timestamp),
-                event_type=event_type,
-                title=title,
-                details=details,
-                payload_ref=PayloadRef(
-                    run_id=run_id,
-                    event_id=event.id,
-                    path=f"/v1/runs/{run_id}/events#{event.id}",
-                ),
-                approval_context=ApprovalContext(
-                    requires_approval=bool(payload.get("requires_approval", False)),
-                    status=_approval_status(approval),
-                    requested_by=_optional_string(approval.get("requested_by")),
-                    resolved_by=_optional_string(approval.get("resolved_by")),
-                    resolved_at=_optional_timestamp_string(approval.get("resolved_at")),
-                    reason=_optional_string(approval.get("reason")),
-                ),
-                metadata={
-                    "actor": _string(payload.get("actor")),
-                    "confidence": payload.get("confidence"),
-                    "risk_level": _optional_string(payload.get("risk_level")),
-                    "integrity_warning": event.integrity_warning,
-                },
-                evidence_refs=evidence_refs,
-                approval_indicator=_approval_indicator(payload, approval),
-            )
-        )
+    evidence_refs = _evidence_refs(payload.get("evidence"))
+    _assert_risky_action_has_evidence(
+        event_type=event_type,
+        payload=payload,
+        evidence_refs=evidence_refs,
+    )
+    approval_raw = payload.get("approval", {})
+    approval = approval_raw if isinstance(approval_raw, dict) else {}
+
+    return JournalEntry(
+        entry_id=journal_entry_id(run_id=run_id, index=index),
+        event_id=event.id,
+        timestamp=_format_timestamp(event.timestamp),
+        event_type=event_type,
+        title=title,
+        details=details,
+        payload_ref=PayloadRef(
+            run_id=run_id,
+            event_id=event.id,
+            path=f"/v1/runs/{run_id}/events#{event.id}",
+        ),
+        approval_context=ApprovalContext(
+            requires_approval=bool(payload.get("requires_approval", False)),
+            status=_approval_status(approval),
+            requested_by=_optional_string(approval.get("requested_by")),
+            resolved_by=_optional_string(approval.get("resolved_by")),
+            resolved_at=_optional_timestamp_string(approval.get("resolved_at")),
+            reason=_optional_string(approval.get("reason")),
+        ),
+        metadata={
+            "actor": _string(payload.get("actor")),
+            "confidence": payload.get("confidence"),
+            "risk_level": _optional_string(payload.get("risk_level")),
+            "integrity_warning": event.integrity_warning,
+        },
+        evidence_refs=evidence_refs,
+        approval_indicator=_approval_indicator(payload, approval),
+    )
+
 
-    return RunJournalProjection(run_id=run_id, entries=entries)
+def encode_journal_entry(entry: JournalEntry) -> bytes:
+    return encode_json(entry.to_dict())
+
+
+def encode_json(value: Any) -> bytes:
+    # Same encoding as FastAPI's JSONResponse, so assembled bodies match it.
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _render_journal_body(*, key: str, value: str, fragments: list[bytes], extra: dict[str, Any]) -> bytes:
+    parts = [
+        b"{",
+        encode_json(key),
+        b":",
+        encode_json(value),
+        b',"entry_count":',
+        str(len(fragments)).encode("ascii"),
+        b',"entries":[',
+        b",".join(fragments),
+        b"]",
+    ]
+    for extra_key, extra_value in extra.items():
+        parts.extend([b",", encode_json(extra_key), b":", encode_json(extra_value)])
+    parts.append(b"}")
+    return b"".join(parts)
 
 
 def _string(value: Any) -> str:
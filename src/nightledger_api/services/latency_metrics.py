@@ -0,0 +1,99 @@
+from bisect import bisect_left
+from math import ceil
+from threading import Lock
+from typing import Any
+
+# Bucket upper bounds in ms, four per doubling up to 2**30 ms (~12 days), so a
+# reported percentile is at most ~19% above the true value (and never above
+# the observed max). Values beyond the last bound share an overflow bucket.
+_BUCKET_BOUNDS_MS: tuple[int, ...] = tuple(sorted({ceil(2 ** (step / 4)) for step in range(0, 121)}))
+_PERCENTILES = (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+_RISK_LEVELS = ("low", "medium", "high")
+
+
+class LatencyHistogram:
+    """Thread-safe fixed-bucket histogram of millisecond latencies."""
+
+    def __init__(self, *, target_ms: int | None = None) -> None:
+        self._target_ms = target_ms
+        self._lock = Lock()
+        self._counts = [0] * (len(_BUCKET_BOUNDS_MS) + 1)
+        self._count = 0
+        self._total = 0
+        self._min: int | None = None
+        self._max: int | None = None
+        self._within_target = 0
+
+    def record(self, value_ms: int) -> None:
+        value_ms = max(0, value_ms)
+        with self._lock:
+            self._counts[bisect_left(_BUCKET_BOUNDS_MS, value_ms)] += 1
+            self._count += 1
+            self._total += value_ms
+            self._min = value_ms if self._min is None else min(self._min, value_ms)
+            self._max = value_ms if self._max is None else max(self._max, value_ms)
+            if self._target_ms is not None and value_ms <= self._target_ms:
+                self._within_target += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            summary: dict[str, Any] = {
+                "count": self._count,
+                "min": self._min,
+                "max": self._max,
+                "mean": round(self._total / self._count, 2) if self._count else None,
+            }
+            for name, quantile in _PERCENTILES:
+                summary[name] = self._percentile(quantile)
+            if self._target_ms is not None:
+                summary["target_ms"] = self._target_ms
+                summary["within_target_ratio"] = (
+                    round(self._within_target / self._count, 4) if self._count else None
+                )
+            return summary
+
+    def _percentile(self, quantile: float) -> int | None:
+        if not self._count:
+            return None
+        assert self._max is not None  # pragma: no cover - set with the first record
+        rank = ceil(quantile * self._count)
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                bound = _BUCKET_BOUNDS_MS[index] if index < len(_BUCKET_BOUNDS_MS) else self._max
+                return min(bound, self._max)
+        return self._max  # pragma: no cover - rank never exceeds count
+
+
+class ApprovalLatencyMetrics:
+    """Histograms fed by every approval resolution in this process."""
+
+    def __init__(self, *, target_ms: int) -> None:
+        self._state_update = LatencyHistogram(target_ms=target_ms)
+        self._orchestration_gap = LatencyHistogram()
+        self._wait_by_risk = {risk_level: LatencyHistogram() for risk_level in _RISK_LEVELS}
+
+    def record_resolution(
+        self,
+        *,
+        approval_to_state_update_ms: int,
+        orchestration_receipt_gap_ms: int | None,
+        request_to_resolution_ms: int,
+        risk_level: str | None,
+    ) -> None:
+        self._state_update.record(approval_to_state_update_ms)
+        if orchestration_receipt_gap_ms is not None:
+            self._orchestration_gap.record(orchestration_receipt_gap_ms)
+        wait = self._wait_by_risk.get(risk_level or "")
+        if wait is not None:
+            wait.record(request_to_resolution_ms)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "approval_to_state_update_ms": self._state_update.snapshot(),
+            "orchestration_receipt_gap_ms": self._orchestration_gap.snapshot(),
+            "request_to_resolution_ms": {
+                risk_level: histogram.snapshot() for risk_level, histogram in self._wait_by_risk.items()
+            },
+        }
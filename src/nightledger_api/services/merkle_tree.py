@@ -0,0 +1,164 @@
+from dataclasses import dataclass
+import hashlib
+
+# Leaves and interior nodes are domain-separated as in RFC 9162 (section
+# 2.1.1), so an interior node can never be passed off as a leaf.
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+_HASH_PREFIX = "sha256:"
+
+
+@dataclass(frozen=True)
+class MerkleFrontier:
+    """Incremental Merkle tree over a run's event hashes, in insertion order.
+
+    frontier holds the roots of the tree's complete subtrees, largest first
+    (one per set bit of size), which is all an append needs. root is the
+    RFC 9162 tree head over all size leaves.
+    """
+
+    run_id: str
+    size: int
+    frontier: tuple[str, ...]
+    root: str
+
+
+def leaf_hash(event_hash: str) -> str:
+    return _format(hashlib.sha256(_LEAF_PREFIX + event_hash.encode("utf-8")).digest())
+
+
+def append_leaf(current: MerkleFrontier | None, *, run_id: str, event_hash: str) -> MerkleFrontier:
+    """Return the tree with event_hash appended; O(log n) node hashes."""
+    size = current.size if current is not None else 0
+    frontier = list(current.frontier) if current is not None else []
+    node = leaf_hash(event_hash)
+    # Appending is binary increment: each trailing set bit of size is a
+    # complete subtree of equal height that merges with the new one.
+    merged = size
+    while merged & 1:
+        node = _node_hash(frontier.pop(), node)
+        merged >>= 1
+    frontier.append(node)
+    return MerkleFrontier(
+        run_id=run_id,
+        size=size + 1,
+        frontier=tuple(frontier),
+        root=_fold_frontier(frontier),
+    )
+
+
+def build_frontier(*, run_id: str, event_hashes: list[str]) -> MerkleFrontier | None:
+    tree: MerkleFrontier | None = None
+    for event_hash in event_hashes:
+        tree = append_leaf(tree, run_id=run_id, event_hash=event_hash)
+    return tree
+
+
+class MerkleSnapshot:
+    """The Merkle tree over a fixed list of event hashes, for proof serving.
+
+    Leaf hashes and subtree roots are computed at most once and shared, so
+    the root plus k audit paths cost O(n + k log n) rather than O(n) per path.
+    """
+
+    def __init__(self, event_hashes: list[str]) -> None:
+        self._leaves = [leaf_hash(event_hash) for event_hash in event_hashes]
+        self._roots: dict[tuple[int, int], str] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self._leaves)
+
+    @property
+    def root(self) -> str | None:
+        return self._range_root(0, self.size) if self._leaves else None
+
+    def inclusion_proof(self, index: int) -> list[str]:
+        """Return the audit path for leaf index, sibling first."""
+        if not 0 <= index < self.size:
+            raise IndexError("leaf index out of range")
+        path: list[str] = []
+        start, end = 0, self.size
+        # Walk down from the root, then reverse to order the path leaf-up.
+        while end - start > 1:
+            split = start + _largest_power_of_two_below(end - start)
+            if index < split:
+                path.append(self._range_root(split, end))
+                end = split
+            else:
+                path.append(self._range_root(start, split))
+                start = split
+        path.reverse()
+        return path
+
+    def _range_root(self, start: int, end: int) -> str:
+        root = self._roots.get((start, end))
+        if root is None:
+            if end - start == 1:
+                root = self._leaves[start]
+            else:
+                split = start + _largest_power_of_two_below(end - start)
+                root = _node_hash(self._range_root(start, split), self._range_root(split, end))
+            self._roots[(start, end)] = root
+        return root
+
+
+def inclusion_proof(event_hashes: list[str], index: int) -> list[str]:
+    """Return the audit path for leaf index in the tree over event_hashes.
+
+    The path has at most ceil(log2(n)) entries, ordered from the leaf's
+    sibling up to the root's child.
+    """
+    return MerkleSnapshot(event_hashes).inclusion_proof(index)
+
+
+def verify_inclusion(
+    *,
+    event_hash: str,
+    index: int,
+    tree_size: int,
+    audit_path: list[str],
+    root: str,
+) -> bool:
+    """Check an audit path against a tree head (RFC 9162 section 2.1.3.2)."""
+    if not 0 <= index < tree_size:
+        return False
+    position = index
+    last = tree_size - 1
+    node = leaf_hash(event_hash)
+    for sibling in audit_path:
+        if last == 0:
+            return False
+        if position & 1 or position == last:
+            node = _node_hash(sibling, node)
+            while not position & 1 and position != 0:
+                position >>= 1
+                last >>= 1
+        else:
+            node = _node_hash(node, sibling)
+        position >>= 1
+        last >>= 1
+    return last == 0 and node == root
+
+
+def _fold_frontier(frontier: list[str]) -> str:
+    root = frontier[-1]
+    for subtree in reversed(frontier[:-1]):
+        root = _node_hash(subtree, root)
+    return root
+
+
+def _largest_power_of_two_below(value: int) -> int:
+    return 1 << ((value - 1).bit_length() - 1)
+
+
+def _node_hash(left: str, right: str) -> str:
+    return _format(hashlib.sha256(_NODE_PREFIX + _digest(left) + _digest(right)).digest())
+
+
+def _digest(value: str) -> bytes:
+    return bytes.fromhex(value.removeprefix(_HASH_PREFIX))
+
+
+def _format(digest: bytes) -> str:
+    return f"{_HASH_PREFIX}{digest.hex()}"
@@ -0,0 +1,595 @@
+import heapq
+import os
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import datetime
+from itertools import islice
+from threading import Lock
+from typing import Any, Hashable, Iterator
+
+from nightledger_api.services.errors import InconsistentRunStateError
+from nightledger_api.services.event_store import EventStore, StoredEvent
+from nightledger_api.services.field_selection import nest_fields, select_fields
+from nightledger_api.services.journal_projection_service import (
+    JournalCursor,
+    JournalVerification,
+    RenderedRunJournal,
+    RenderedWorkflowJournal,
+    build_journal_entry,
+    encode_journal_cursor,
+    encode_journal_entry,
+    encode_json,
+    encode_workflow_journal_cursor,
+    invalid_entry_id_error,
+    iter_journal_positions,
+    with_entry_run_id,
+)
+from nightledger_api.services.run_catalog_service import (
+    RunCatalogEntry,
+    RunCatalogQuery,
+    RunProjectionSnapshot,
+    inconsistency_error,
+)
+from nightledger_api.services.run_status_service import (
+    RunStatusFold,
+    RunStatusProjection,
+    project_run_status,
+)
+
+_PROJECTION_CACHE_MAX_ENTRIES_ENV = "NIGHTLEDGER_PROJECTION_CACHE_MAX_ENTRIES"
+_PROJECTION_CACHE_MAX_BYTES_ENV = "NIGHTLEDGER_PROJECTION_CACHE_MAX_BYTES"
+_DEFAULT_PROJECTION_CACHE_MAX_ENTRIES = 1024
+_DEFAULT_PROJECTION_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_JOURNAL_ENTRY_CACHE_MAX_ENTRIES_ENV = "NIGHTLEDGER_JOURNAL_ENTRY_CACHE_MAX_ENTRIES"
+_JOURNAL_ENTRY_CACHE_MAX_BYTES_ENV = "NIGHTLEDGER_JOURNAL_ENTRY_CACHE_MAX_BYTES"
+_DEFAULT_JOURNAL_ENTRY_CACHE_MAX_ENTRIES = 100_000
+_DEFAULT_JOURNAL_ENTRY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_AS_OF_REPLAY_CHUNK = 500
+_WORKFLOW_MERGE_CHUNK = 64
+
+
+@dataclass(frozen=True)
+class CachedRunStatus:
+    event_count: int
+    projection: RunStatusProjection
+
+
+@dataclass(frozen=True)
+class AsOfRunStatus:
+    # Number of timeline events folded into the projection.
+    position: int
+    projection: RunStatusProjection
+
+
+class BoundedLRUCache:
+    """Thread-safe LRU bounded by both entry count and approximate byte size.
+
+    Entries may carry a version; a lookup with a different version invalidates
+    the entry and counts as a miss.
+    """
+
+    def __init__(self, *, max_entries: int, max_bytes: int) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int, Hashable]] = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, *, version: Hashable = None) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] != version:
+                self._discard(key)
+                self.invalidations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, *, size: int, version: Hashable = None) -> None:
+        if self._max_entries <= 0 or size > self._max_bytes:
+            return
+        with self._lock:
+            self._discard(key)
+            self._entries[key] = (value, size, version)
+            self._bytes += size
+            while len(self._entries) > self._max_entries or self._bytes > self._max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+            }
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+
+class ProjectionCache:
+    """Run projections keyed by (kind, run_id) and versioned by the chain head.
+
+    Every append moves a run's chain head, so a cached projection is only served
+    while the run is unchanged; the first lookup after an append invalidates it.
+    """
+
+    def __init__(self, *, max_entries: int, max_bytes: int) -> None:
+        self._lru = BoundedLRUCache(max_entries=max_entries, max_bytes=max_bytes)
+
+    def get(self, *, kind: str, run_id: str, head: str) -> Any | None:
+        return self._lru.get((kind, run_id), version=head)
+
+    def put(self, *, kind: str, run_id: str, head: str, value: Any) -> None:
+        self._lru.put((kind, run_id), value, size=_approximate_size(value), version=head)
+
+    def metrics(self) -> dict[str, Any]:
+        return self._lru.metrics()
+
+
+def load_run_status(store: EventStore, run_id: str) -> CachedRunStatus | None:
+    head = store.run_head(run_id)
+    if head:
+        cached = _PROJECTION_CACHE.get(kind="status", run_id=run_id, head=head)
+        if cached is not None:
+            return cached
+
+    events = store.list_by_run_id(run_id)
+    if not events:
+        return None
+    status = CachedRunStatus(event_count=len(events), projection=project_run_status(events))
+    if head:
+        _PROJECTION_CACHE.put(kind="status", run_id=run_id, head=head, value=status)
+    return status
+
+
+def load_run_statuses(
+    store: EventStore, run_ids: list[str]
+) -> dict[str, CachedRunStatus | InconsistentRunStateError | None]:
+    """Load the status projections of several runs.
+
+    Unchanged runs are served from the projection cache and the rest are read
+    together in one store call. Unknown runs map to None and inconsistent runs
+    to the error load_run_status would raise for them.
+    """
+    heads = store.run_heads(run_ids)
+    statuses: dict[str, CachedRunStatus | InconsistentRunStateError | None] = {}
+    misses: list[str] = []
+    for run_id in dict.fromkeys(run_ids):
+        head = heads.get(run_id)
+        cached = _PROJECTION_CACHE.get(kind="status", run_id=run_id, head=head) if head else None
+        if cached is None:
+            misses.append(run_id)
+        else:
+            statuses[run_id] = cached
+
+    events_by_run = store.list_by_run_ids(misses) if misses else {}
+    for run_id in misses:
+        events = events_by_run.get(run_id, [])
+        if not events:
+            statuses[run_id] = None
+            continue
+        try:
+            status = CachedRunStatus(event_count=len(events), projection=project_run_status(events))
+        except InconsistentRunStateError as exc:
+            statuses[run_id] = exc
+            continue
+        head = heads.get(run_id)
+        if head:
+            _PROJECTION_CACHE.put(kind="status", run_id=run_id, head=head, value=status)
+        statuses[run_id] = status
+    return statuses
+
+
+def load_run_status_as_of(
+    store: EventStore,
+    run_id: str,
+    *,
+    as_of_position: int | None = None,
+    as_of: datetime | None = None,
+) -> AsOfRunStatus | None:
+    """Fold a run's status over the timeline prefix ending at a position or time.
+
+    Replay starts from the latest projection snapshot inside the bounds, so only
+    the events after it are read. Returns None when no event falls inside them.
+    """
+    fold = RunStatusFold()
+    position = 0
+    snapshot = store.latest_snapshot(run_id, max_position=as_of_position, max_timestamp=as_of)
+    if snapshot is not None:
+        if snapshot.fold_state is None:
+            # The run was already inconsistent at the snapshot; the fold stops
+            # at the first conflict, so later events cannot change that.
+            assert snapshot.inconsistency is not None  # pragma: no cover - set whenever the fold stops
+            raise inconsistency_error(snapshot.inconsistency)
+        fold = RunStatusFold.from_state(snapshot.fold_state)
+        position = snapshot.position
+
+    while as_of_position is None or position < as_of_position:
+        chunk = _AS_OF_REPLAY_CHUNK
+        if as_of_position is not None:
+            chunk = min(chunk, as_of_position - position)
+        events = store.list_by_run_id_window(run_id, offset=position, limit=chunk)
+        for event in events:
+            if as_of is not None and event.timestamp > as_of:
+                break
+            fold.apply(event)
+            position += 1
+        else:
+            if len(events) == chunk:
+                continue
+        break
+
+    if position == 0:
+        return None
+    return AsOfRunStatus(position=position, projection=fold.projection())
+
+
+def load_run_journal(
+    store: EventStore,
+    run_id: str,
+    *,
+    verification: JournalVerification = "trusted",
+    fields: tuple[str, ...] | None = None,
+) -> RenderedRunJournal | None:
+    head = store.run_head(run_id)
+    # Each sparse fieldset is cached as its own render.
+    kind = "journal" if fields is None else f"journal:{','.join(fields)}"
+    # Full verification is for audits, so it never serves a cached render.
+    if head and verification == "trusted":
+        cached = _PROJECTION_CACHE.get(kind=kind, run_id=run_id, head=head)
+        if cached is not None:
+            fragments, projection = cached
+            return _rendered_journal(run_id=run_id, fragments=list(fragments), status=projection)
+
+    events = store.list_by_run_id(run_id)
+    if not events:
+        return None
+    # One pass renders the entries and folds the run status, which doubles as
+    # the approval-timeline consistency guard.
+    fold = RunStatusFold()
+    fragments = _encode_journal_entries(
+        run_id=run_id,
+        events=events,
+        start_index=1,
+        fold=fold,
+        verification=verification,
+        fields=fields,
+    )
+    projection = fold.projection()
+    if head:
+        _PROJECTION_CACHE.put(kind=kind, run_id=run_id, head=head, value=(tuple(fragments), projection))
+        _PROJECTION_CACHE.put(
+            kind="status",
+            run_id=run_id,
+            head=head,
+            value=CachedRunStatus(event_count=len(events), projection=projection),
+        )
+    return _rendered_journal(run_id=run_id, fragments=fragments, status=projection)
+
+
+def load_run_journal_page(
+    store: EventStore,
+    run_id: str,
+    *,
+    after: JournalCursor | None = None,
+    since_index: int | None = None,
+    limit: int,
+    delta: bool = False,
+    verification: JournalVerification = "trusted",
+    as_of_position: int | None = None,
+    as_of: datetime | None = None,
+    fields: tuple[str, ...] | None = None,
+) -> RenderedRunJournal | None:
+    """Project only the requested window of a run's journal.
+
+    Pages resume after the timeline key in after, or after the entry at
+    since_index, so appends between reads never repeat or skip stored events;
+    resync_required reports appends that landed at or before the key since
+    the cursor was issued. The whole-run consistency guard comes from the
+    cached status projection; journal entry checks apply to the events in the
+    window. Delta reads always return a cursor for the next poll, which
+    resumes as a delta read.
+    Point-in-time reads stop at the as-of position and guard with the status
+    folded up to it.
+    """
+    extra: dict[str, Any] = {}
+    if as_of_position is None and as_of is None:
+        status = load_run_status(store, run_id)
+        if status is None:
+            return None
+        projection = status.projection
+        end_position = None
+    else:
+        as_of_status = load_run_status_as_of(
+            store, run_id, as_of_position=as_of_position, as_of=as_of
+        )
+        if as_of_status is None:
+            return None
+        projection = as_of_status.projection
+        end_position = as_of_status.position
+        extra["as_of_sequence"] = as_of_status.position
+
+    after_index = 0
+    if since_index is not None:
+        after = _journal_anchor(store, run_id, index=since_index)
+        if after is None:
+            raise invalid_entry_id_error(run_id=run_id)
+    if after is not None:
+        after_index = store.count_by_run_id_through(
+            run_id, timestamp=after.timestamp, sequence=after.sequence
+        )
+        extra["resync_required"] = after_index != after.index
+    # One extra event tells us whether another page exists.
+    window = limit + 1 if end_position is None else min(limit + 1, max(0, end_position - after_index))
+    events: list[StoredEvent] = []
+    if window and after is None:
+        events = store.list_by_run_id_window(run_id, offset=after_index, limit=window)
+    elif window:
+        events = store.list_by_run_id_after(
+            run_id, timestamp=after.timestamp, sequence=after.sequence, limit=window
+        )
+    page = events[:limit]
+    fragments = _encode_journal_entries(
+        run_id=run_id,
+        events=page,
+        start_index=after_index + 1,
+        verification=verification,
+        fields=fields,
+    )
+    has_more = len(events) > limit
+    next_cursor = None
+    if page:
+        next_cursor = encode_journal_cursor(
+            timestamp=page[-1].timestamp,
+            sequence=page[-1].sequence,
+            index=after_index + len(page),
+            delta=delta,
+        )
+    elif after is not None:
+        next_cursor = encode_journal_cursor(
+            timestamp=after.timestamp, sequence=after.sequence, index=after_index, delta=delta
+        )
+    if not delta:
+        return _rendered_journal(
+            run_id=run_id,
+            fragments=fragments,
+            status=projection,
+            next_cursor=next_cursor if has_more else None,
+            **extra,
+        )
+    return _rendered_journal(
+        run_id=run_id,
+        fragments=fragments,
+        status=projection,
+        next_cursor=next_cursor,
+        has_more=has_more,
+        **extra,
+    )
+
+
+def _journal_anchor(store: EventStore, run_id: str, *, index: int) -> JournalCursor | None:
+    # The entry currently at a timeline position. Ids shift on out-of-order
+    # appends, so since_entry only seeds a delta; cursors carry on from there.
+    events = store.list_by_run_id_window(run_id, offset=index - 1, limit=1)
+    if not events:
+        return None
+    return JournalCursor(timestamp=events[0].timestamp, sequence=events[0].sequence, index=index)
+
+
+def load_workflow_journal_page(
+    store: EventStore,
+    workflow: str,
+    *,
+    after: tuple[datetime, str, int] | None,
+    limit: int,
+    verification: JournalVerification = "trusted",
+    fields: tuple[str, ...] | None = None,
+) -> RenderedWorkflowJournal:
+    """Merge the journals of a workflow's runs into one chronological page.
+
+    Each run is read lazily in small windows and the streams are k-way merged
+    on (timestamp, run_id, position), so memory grows with the number of runs
+    rather than events. after is the merge key of the last entry already
+    served; every run resumes just past it, including runs that first appear
+    after the cursor was issued. Runs whose event stream is inconsistent are
+    left out and listed in inconsistent_run_ids.
+    """
+    entries = store.list_runs(RunCatalogQuery(workflow=workflow, limit=None))
+    consistent = sorted(
+        (entry for entry in entries if entry.status is not None), key=lambda entry: entry.run_id
+    )
+    chunk = min(limit + 1, _WORKFLOW_MERGE_CHUNK)
+    streams = [
+        _iter_run_positions(store, entry.run_id, after_index=offset, chunk=chunk)
+        for entry in consistent
+        if (offset := _workflow_resume_offset(store, entry, after)) is not None
+    ]
+    # One extra entry tells us whether another page exists.
+    merged = list(islice(heapq.merge(*streams), limit + 1))
+
+    fragments: list[bytes] = []
+    for _, run_id, index, event in merged[:limit]:
+        fragment = _encode_journal_entry(
+            run_id=run_id, event=event, index=index, verification=verification, fields=fields
+        )
+        fragments.append(with_entry_run_id(run_id=run_id, fragment=fragment))
+    next_cursor = None
+    if len(merged) > limit:
+        timestamp, run_id, index, _ = merged[limit - 1]
+        next_cursor = encode_workflow_journal_cursor(timestamp=timestamp, run_id=run_id, index=index)
+    return RenderedWorkflowJournal(
+        workflow=workflow,
+        fragments=fragments,
+        extra={
+            "run_count": len(consistent),
+            "inconsistent_run_ids": sorted(entry.run_id for entry in entries if entry.status is None),
+            "next_cursor": next_cursor,
+        },
+    )
+
+
+def _workflow_resume_offset(
+    store: EventStore, entry: RunCatalogEntry, after: tuple[datetime, str, int] | None
+) -> int | None:
+    """Timeline offset of a run's first entry past the merge key after.
+
+    None when the whole run sorts at or before after, so it is not read.
+    """
+    if after is None:
+        return 0
+    timestamp, after_run_id, after_index = after
+    if entry.run_id == after_run_id:
+        return after_index
+    # At the cursor's own timestamp, runs ordered before its run are done.
+    inclusive = entry.run_id < after_run_id
+    if entry.last_event_at < timestamp or (inclusive and entry.last_event_at == timestamp):
+        return None
+    return store.count_by_run_id_before(entry.run_id, timestamp, inclusive=inclusive)
+
+
+def _iter_run_positions(
+    store: EventStore, run_id: str, *, after_index: int, chunk: int
+) -> Iterator[tuple[Any, str, int, StoredEvent]]:
+    # Merge keys are unique per event, so heapq never compares the events.
+    def _events() -> Iterator[StoredEvent]:
+        offset = after_index
+        while True:
+            events = store.list_by_run_id_window(run_id, offset=offset, limit=chunk)
+            yield from events
+            if len(events) < chunk:
+                return
+            offset += len(events)
+
+    for index, event in iter_journal_positions(run_id=run_id, events=_events(), start_index=after_index + 1):
+        yield event.timestamp, run_id, index, event
+
+
+def _rendered_journal(
+    *, run_id: str, fragments: list[bytes], status: RunStatusProjection, **extra: Any
+) -> RenderedRunJournal:
+    return RenderedRunJournal(
+        run_id=run_id,
+        fragments=fragments,
+        extra={
+            "run_status": {"status": status.status, "pending_approval": status.pending_approval},
+            **extra,
+        },
+    )
+
+
+def projection_cache_metrics() -> dict[str, Any]:
+    return _PROJECTION_CACHE.metrics()
+
+
+def journal_entry_cache_metrics() -> dict[str, Any]:
+    return _JOURNAL_ENTRY_CACHE.metrics()
+
+
+def _encode_journal_entries(
+    *,
+    run_id: str,
+    events: list[StoredEvent],
+    start_index: int,
+    fold: RunStatusFold | None = None,
+    verification: JournalVerification = "trusted",
+    fields: tuple[str, ...] | None = None,
+) -> list[bytes]:
+    # An entry is a pure function of its immutable event and timeline position;
+    # the chain hash identifies the event (and its run), so the encoded JSON is
+    # reused across requests, pages and appends.
+    fragments: list[bytes] = []
+    fold_error: InconsistentRunStateError | None = None
+    for index, event in iter_journal_positions(run_id=run_id, events=events, start_index=start_index):
+        fragments.append(
+            _encode_journal_entry(
+                run_id=run_id, event=event, index=index, verification=verification, fields=fields
+            )
+        )
+        if fold is not None and fold_error is None:
+            try:
+                fold.apply(event)
+            except InconsistentRunStateError as exc:
+                # Journal conflicts anywhere in the run take precedence over
+                # status conflicts, as when the status was projected afterwards.
+                fold_error = exc
+    if fold_error is not None:
+        raise fold_error
+    return fragments
+
+
+def _encode_journal_entry(
+    *,
+    run_id: str,
+    event: StoredEvent,
+    index: int,
+    verification: JournalVerification,
+    fields: tuple[str, ...] | None = None,
+) -> bytes:
+    # Sparse fieldsets are selected here, so their fragments are cached too.
+    key = (event.hash, index, fields)
+    fragment = None
+    if event.hash and verification == "trusted":
+        fragment = _JOURNAL_ENTRY_CACHE.get(key)
+    if fragment is None:
+        entry = build_journal_entry(run_id=run_id, event=event, index=index, verification=verification)
+        if fields is None:
+            fragment = encode_journal_entry(entry)
+        else:
+            fragment = encode_json(nest_fields(select_fields(entry.to_dict(), fields)))
+        if event.hash:
+            _JOURNAL_ENTRY_CACHE.put(key, fragment, size=sys.getsizeof(fragment))
+    return fragment
+
+
+def _approximate_size(value: Any) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_approximate_size(key) + _approximate_size(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_approximate_size(item) for item in value)
+    elif is_dataclass(value) and not isinstance(value, type):
+        size += sum(_approximate_size(getattr(value, field.name)) for field in fields(value))
+    return size
+
+
+def _configured_int(env_name: str, default: int) -> int:
+    configured = os.getenv(env_name)
+    if configured is None or configured.strip() == "":
+        return default
+    try:
+        return max(0, int(configured.strip()))
+    except ValueError:
+        return default
+
+
+_PROJECTION_CACHE = ProjectionCache(
+    max_entries=_configured_int(_PROJECTION_CACHE_MAX_ENTRIES_ENV, _DEFAULT_PROJECTION_CACHE_MAX_ENTRIES),
+    max_bytes=_configured_int(_PROJECTION_CACHE_MAX_BYTES_ENV, _DEFAULT_PROJECTION_CACHE_MAX_BYTES),
+)
+_JOURNAL_ENTRY_CACHE = BoundedLRUCache(
+    max_entries=_configured_int(
+        _JOURNAL_ENTRY_CACHE_MAX_ENTRIES_ENV, _DEFAULT_JOURNAL_ENTRY_CACHE_MAX_ENTRIES
+    ),
+    max_bytes=_configured_int(_JOURNAL_ENTRY_CACHE_MAX_BYTES_ENV, _DEFAULT_JOURNAL_ENTRY_CACHE_MAX_BYTES),
+)
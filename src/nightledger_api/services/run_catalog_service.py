@@ -0,0 +1,294 @@
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Any, Literal
+
+from nightledger_api.models.stored_event import StoredEvent
+from nightledger_api.services.cursor import decode_cursor, encode_cursor, invalid_cursor_error
+from nightledger_api.services.errors import InconsistentRunStateError
+from nightledger_api.services.run_status_service import RunStatusFold, RunWorkflowStatus
+
+
+@dataclass(frozen=True)
+class RunCatalogEntry:
+    """Per-run summary maintained by the event stores on append.
+
+    status is None when the run's event stream is inconsistent; the first
+    conflict is kept in inconsistency and the fold stops there, matching
+    project_run_status.
+    """
+
+    run_id: str
+    workflow: str | None
+    status: RunWorkflowStatus | None
+    first_event_at: datetime
+    last_event_at: datetime
+    event_count: int
+    fold_state: dict[str, Any] | None
+    inconsistency: dict[str, str] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        pending_approval = None
+        if self.fold_state is not None:
+            pending_approval = self.fold_state.get("pending_approval")
+        return {
+            "run_id": self.run_id,
+            "workflow": self.workflow,
+            "status": self.status,
+            "pending_approval": pending_approval,
+            "first_event_at": _format_timestamp(self.first_event_at),
+            "last_event_at": _format_timestamp(self.last_event_at),
+            "event_count": self.event_count,
+            "inconsistency": self.inconsistency,
+        }
+
+
+@dataclass(frozen=True)
+class RunCatalogQuery:
+    status: RunWorkflowStatus | None = None
+    workflow: str | None = None
+    updated_after: datetime | None = None
+    inconsistent_only: bool = False
+    # Keyset position: entries strictly after (last_event_at, run_id) in
+    # descending order.
+    after: tuple[datetime, str] | None = None
+    limit: int | None = 50
+    # "run_id" orders by run_id ascending instead, paged with after_run_id.
+    # Run ids never change, so such a walk is stable while runs take appends.
+    order: Literal["last_event_at", "run_id"] = "last_event_at"
+    after_run_id: str | None = None
+
+    def matches(self, entry: RunCatalogEntry) -> bool:
+        if self.status is not None and entry.status != self.status:
+            return False
+        if self.inconsistent_only and entry.status is not None:
+            return False
+        if self.workflow is not None and entry.workflow != self.workflow:
+            return False
+        if self.updated_after is not None and entry.last_event_at <= self.updated_after:
+            return False
+        if self.after is not None and (entry.last_event_at, entry.run_id) >= self.after:
+            return False
+        if self.after_run_id is not None and entry.run_id <= self.after_run_id:
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class PendingApprovalEntry:
+    """Open approval request of a paused run, indexed by the stores on append."""
+
+    event_id: str
+    decision_id: str | None
+    run_id: str
+    requested_at: str
+    requested_by: str | None
+    title: str | None
+    details: str | None
+    reason: str | None
+    risk_level: str | None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "event_id": self.event_id,
+            "decision_id": self.decision_id,
+            "run_id": self.run_id,
+            "requested_at": self.requested_at,
+            "requested_by": self.requested_by,
+            "title": self.title,
+            "details": self.details,
+            "reason": self.reason,
+            "risk_level": self.risk_level,
+        }
+
+
+@dataclass(frozen=True)
+class PendingApprovalQuery:
+    risk_level: str | None = None
+    requested_by: str | None = None
+    run_id: str | None = None
+    # Keyset position: entries strictly after (requested_at, event_id) in
+    # ascending order.
+    after: tuple[str, str] | None = None
+    limit: int | None = 100
+
+    def matches(self, entry: PendingApprovalEntry) -> bool:
+        if self.risk_level is not None and entry.risk_level != self.risk_level:
+            return False
+        if self.requested_by is not None and entry.requested_by != self.requested_by:
+            return False
+        if self.run_id is not None and entry.run_id != self.run_id:
+            return False
+        if self.after is not None and (entry.requested_at, entry.event_id) <= self.after:
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class RunProjectionSnapshot:
+    """Run status fold state right after the event at a timeline position.
+
+    Snapshots are taken every snapshot interval so point-in-time reads replay
+    at most one interval of events on top of the nearest snapshot.
+    """
+
+    run_id: str
+    position: int
+    last_event_at: datetime
+    fold_state: dict[str, Any] | None
+    inconsistency: dict[str, str] | None = None
+
+
+def replay_run_catalog(
+    run_id: str, events: list[StoredEvent], *, snapshot_interval: int = 0
+) -> tuple[RunCatalogEntry | None, list[RunProjectionSnapshot]]:
+    """Fold a run's timeline-ordered events into a fresh entry and its snapshots."""
+    entry: RunCatalogEntry | None = None
+    snapshots: list[RunProjectionSnapshot] = []
+    for event in events:
+        entry = advance_run_catalog_entry(entry, event)
+        snapshot = snapshot_run_catalog_entry(entry, snapshot_interval=snapshot_interval)
+        if snapshot is not None:
+            snapshots.append(snapshot)
+    return entry, snapshots
+
+
+def snapshot_run_catalog_entry(
+    entry: RunCatalogEntry, *, snapshot_interval: int
+) -> RunProjectionSnapshot | None:
+    """Return the snapshot due after an in-order advance, if any."""
+    if snapshot_interval <= 0 or entry.event_count % snapshot_interval != 0:
+        return None
+    return RunProjectionSnapshot(
+        run_id=entry.run_id,
+        position=entry.event_count,
+        last_event_at=entry.last_event_at,
+        fold_state=entry.fold_state,
+        inconsistency=entry.inconsistency,
+    )
+
+
+def advance_run_catalog_entry(entry: RunCatalogEntry | None, event: StoredEvent) -> RunCatalogEntry:
+    """Apply one event that sorts last in its run's timeline.
+
+    Out-of-order appends change the timeline before the latest event, so
+    stores rebuild those runs with replay_run_catalog instead.
+    """
+    workflow = _event_workflow(event)
+    if entry is None:
+        entry = RunCatalogEntry(
+            run_id=event.run_id,
+            workflow=workflow,
+            status="running",
+            first_event_at=event.timestamp,
+            last_event_at=event.timestamp,
+            event_count=0,
+            fold_state=RunStatusFold().to_state(),
+        )
+
+    status = entry.status
+    fold_state = entry.fold_state
+    inconsistency = entry.inconsistency
+    if fold_state is not None:
+        fold = RunStatusFold.from_state(fold_state)
+        try:
+            fold.apply(event)
+        except InconsistentRunStateError as exc:
+            status = None
+            fold_state = None
+            inconsistency = {
+                "path": exc.detail_path,
+                "message": exc.detail_message,
+                "code": exc.detail_code,
+            }
+        else:
+            fold_state = fold.to_state()
+            status = fold_state["status"]
+
+    return replace(
+        entry,
+        workflow=workflow if workflow is not None else entry.workflow,
+        status=status,
+        first_event_at=min(entry.first_event_at, event.timestamp),
+        last_event_at=max(entry.last_event_at, event.timestamp),
+        event_count=entry.event_count + 1,
+        fold_state=fold_state,
+        inconsistency=inconsistency,
+    )
+
+
+def inconsistency_error(inconsistency: dict[str, str]) -> InconsistentRunStateError:
+    """Rebuild the error recorded when a run's fold stopped at a conflict."""
+    return InconsistentRunStateError(
+        detail_path=inconsistency["path"],
+        detail_message=inconsistency["message"],
+        detail_code=inconsistency["code"],
+    )
+
+
+def pending_approval_context(entry: RunCatalogEntry) -> dict[str, Any] | None:
+    """Return the pending approval context of a paused, consistent run."""
+    if entry.status != "paused" or entry.fold_state is None:
+        return None
+    return entry.fold_state.get("pending_approval")
+
+
+def build_pending_approval_entry(*, pending: dict[str, Any], event: StoredEvent) -> PendingApprovalEntry:
+    payload = event.payload
+    approval = payload.get("approval")
+    decision_id = approval.get("decision_id") if isinstance(approval, dict) else None
+    return PendingApprovalEntry(
+        event_id=event.id,
+        decision_id=decision_id,
+        run_id=event.run_id,
+        requested_at=pending["requested_at"],
+        requested_by=pending["requested_by"],
+        title=payload.get("title"),
+        details=payload.get("details"),
+        reason=pending["reason"],
+        risk_level=payload.get("risk_level"),
+    )
+
+
+def encode_pending_approval_cursor(entry: PendingApprovalEntry) -> str:
+    return encode_cursor({"requested_at": entry.requested_at, "event_id": entry.event_id})
+
+
+def decode_pending_approval_cursor(cursor: str) -> tuple[str, str]:
+    fields = decode_cursor(cursor)
+    requested_at = fields.get("requested_at")
+    event_id = fields.get("event_id")
+    if not isinstance(requested_at, str) or not isinstance(event_id, str):
+        raise invalid_cursor_error()
+    return requested_at, event_id
+
+
+def encode_run_catalog_cursor(entry: RunCatalogEntry) -> str:
+    return encode_cursor({"last_event_at": entry.last_event_at.isoformat(), "run_id": entry.run_id})
+
+
+def decode_run_catalog_cursor(cursor: str) -> tuple[datetime, str]:
+    fields = decode_cursor(cursor)
+    last_event_at = fields.get("last_event_at")
+    run_id = fields.get("run_id")
+    if not isinstance(last_event_at, str) or not isinstance(run_id, str):
+        raise invalid_cursor_error()
+    try:
+        parsed = datetime.fromisoformat(last_event_at)
+    except ValueError as exc:
+        raise invalid_cursor_error() from exc
+    if parsed.tzinfo is None:
+        raise invalid_cursor_error()
+    return parsed.astimezone(timezone.utc), run_id
+
+
+def _event_workflow(event: StoredEvent) -> str | None:
+    meta = event.payload.get("meta")
+    if isinstance(meta, dict):
+        workflow = meta.get("workflow")
+        if isinstance(workflow, str):
+            return workflow
+    return None
+
+
+def _format_timestamp(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from typing import Any, Literal
 
 from nightledger_api.services.errors import InconsistentRunStateError
-from nightledger_api.services.event_store import StoredEvent
+from nightledger_api.models.stored_event import StoredEvent
 
 RunWorkflowStatus = Literal[
     "running",
@@ -46,29 +46,71 @@ class RunStatusProjection:
 
 
 def project_run_status(events: list[StoredEvent]) -> RunStatusProjection:
-    status: RunWorkflowStatus = "running"
-    pending_approval: PendingApprovalContext | None = None
-    terminal_status: RunWorkflowStatus | None = None
-
+    fold = RunStatusFold()
     for event in events:
+        fold.apply(event)
+    return fold.projection()
+
+
+class RunStatusFold:
+    """Incremental run status projection.
+
+    Applying a run's events one at a time, in timeline order, yields the same
+    projection (and raises the same InconsistentRunStateError) as
+    project_run_status over the full list. The state round-trips through
+    to_state/from_state so stores can persist it next to the run.
+    """
+
+    def __init__(self) -> None:
+        self._status: RunWorkflowStatus = "running"
+        self._pending_approval: PendingApprovalContext | None = None
+        self._terminal_status: RunWorkflowStatus | None = None
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "RunStatusFold":
+        fold = cls()
+        fold._status = state["status"]
+        fold._terminal_status = state.get("terminal_status")
+        pending = state.get("pending_approval")
+        fold._pending_approval = PendingApprovalContext(**pending) if pending is not None else None
+        return fold
+
+    def to_state(self) -> dict[str, Any]:
+        return {
+            "status": self._status,
+            "terminal_status": self._terminal_status,
+            "pending_approval": (
+                self._pending_approval.to_dict() if self._pending_approval is not None else None
+            ),
+        }
+
+    def projection(self) -> RunStatusProjection:
+        return RunStatusProjection(
+            status=self._status,
+            pending_approval=(
+                self._pending_approval.to_dict() if self._pending_approval is not None else None
+            ),
+        )
+
+    def apply(self, event: StoredEvent) -> None:
         payload = event.payload
         event_type = str(payload.get("type", ""))
         approval = payload.get("approval", {})
         approval_status = str(approval.get("status", ""))
         requires_approval = bool(payload.get("requires_approval", False))
 
-        if terminal_status is not None:
+        if self._terminal_status is not None:
             raise InconsistentRunStateError(
                 detail_path="workflow_status",
                 detail_message=(
-                    f"event stream continued after terminal status '{terminal_status}'"
+                    f"event stream continued after terminal status '{self._terminal_status}'"
                 ),
                 detail_code="TERMINAL_STATE_CONFLICT",
                 detail_type="state_conflict",
             )
 
-        next_terminal_status = _to_terminal_status(payload)
-        if status == "rejected" and next_terminal_status is None:
+        next_terminal_status = terminal_status_of(payload)
+        if self._status == "rejected" and next_terminal_status is None:
             raise InconsistentRunStateError(
                 detail_path="workflow_status",
                 detail_message="event stream continued after rejection without terminal stop",
@@ -77,10 +119,10 @@ def project_run_status(events: list[StoredEvent]) -> RunStatusProjection:
             )
 
         if next_terminal_status is not None:
-            terminal_status = next_terminal_status
-            status = next_terminal_status
-            pending_approval = None
-            continue
+            self._terminal_status = next_terminal_status
+            self._status = next_terminal_status
+            self._pending_approval = None
+            return
 
         if _is_resolution_signal(
             event_type=event_type,
@@ -94,7 +136,7 @@ def project_run_status(events: list[StoredEvent]) -> RunStatusProjection:
                     detail_code="INVALID_APPROVAL_TRANSITION",
                     detail_type="state_conflict",
                 )
-            if pending_approval is None:
+            if self._pending_approval is None:
                 raise InconsistentRunStateError(
                     detail_path="approval",
                     detail_message="approval_resolved encountered without pending approval",
@@ -117,37 +159,32 @@ def project_run_status(events: list[StoredEvent]) -> RunStatusProjection:
                     detail_code="MISSING_APPROVAL_TIMESTAMP",
                     detail_type="state_conflict",
                 )
-            pending_approval = None
-            status = "approved" if approval_status == "approved" else "rejected"
-            continue
+            self._pending_approval = None
+            self._status = "approved" if approval_status == "approved" else "rejected"
+            return
 
         if _is_pending_signal(
             event_type=event_type,
             approval_status=approval_status,
             requires_approval=requires_approval,
         ):
-            if pending_approval is not None:
+            if self._pending_approval is not None:
                 raise InconsistentRunStateError(
                     detail_path="approval",
                     detail_message="multiple pending approvals encountered without resolution",
                     detail_code="DUPLICATE_PENDING_APPROVAL",
                     detail_type="state_conflict",
                 )
-            pending_approval = _pending_context_from_event(event)
-            status = "paused"
-            continue
-
-        if pending_approval is not None:
-            status = "paused"
-            continue
+            self._pending_approval = _pending_context_from_event(event)
+            self._status = "paused"
+            return
 
-        if status == "approved":
-            status = "running"
+        if self._pending_approval is not None:
+            self._status = "paused"
+            return
 
-    return RunStatusProjection(
-        status=status,
-        pending_approval=pending_approval.to_dict() if pending_approval is not None else None,
-    )
+        if self._status == "approved":
+            self._status = "running"
 
 
 def _is_pending_signal(
@@ -184,7 +221,8 @@ def _pending_context_from_event(event: StoredEvent) -> PendingApprovalContext:
     )
 
 
-def _to_terminal_status(payload: dict[str, Any]) -> RunWorkflowStatus | None:
+def terminal_status_of(payload: dict[str, Any]) -> RunWorkflowStatus | None:
+    """Return the terminal status an event payload moves its run to, if any."""
     event_type = payload.get("type")
     if event_type == "summary":
         return "completed"
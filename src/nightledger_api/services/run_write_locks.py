@@ -0,0 +1,62 @@
+import threading
+from contextlib import AbstractContextManager, contextmanager
+from typing import Iterator
+
+
+class RunWriteLocks:
+    """Per-run locks for writers that check a run's state and then append to it.
+
+    Approval resolution and the expiry scheduler both read a pending approval
+    before appending its outcome; holding the run's lock across the read and
+    the append stops both from settling the same request. Locks are reentrant
+    and only exist while held or awaited. They serialize writers in this
+    process only; processes sharing a SQLite file are not covered.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # run_id -> (lock, number of holders and waiters)
+        self._locks: dict[str, tuple[threading.RLock, int]] = {}
+
+    @contextmanager
+    def hold(self, run_ids: list[str]) -> Iterator[None]:
+        # Runs are locked in sorted order, so writers holding several never
+        # deadlock each other.
+        ordered = sorted(set(run_ids))
+        with self._lock:
+            locks = []
+            for run_id in ordered:
+                lock, users = self._locks.get(run_id, (threading.RLock(), 0))
+                self._locks[run_id] = (lock, users + 1)
+                locks.append(lock)
+        acquired: list[threading.RLock] = []
+        try:
+            for lock in locks:
+                lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+            with self._lock:
+                for run_id in ordered:
+                    lock, users = self._locks[run_id]
+                    if users == 1:
+                        del self._locks[run_id]
+                    else:
+                        self._locks[run_id] = (lock, users - 1)
+
+    def locked_run_count(self) -> int:
+        with self._lock:
+            return len(self._locks)
+
+
+_RUN_WRITE_LOCKS = RunWriteLocks()
+
+
+def run_write_lock(*run_ids: str) -> AbstractContextManager[None]:
+    return _RUN_WRITE_LOCKS.hold(list(run_ids))
+
+
+def locked_run_count() -> int:
+    return _RUN_WRITE_LOCKS.locked_run_count()
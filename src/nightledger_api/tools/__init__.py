@@ -0,0 +1 @@
+"""Offline command-line tools for NightLedger operators."""
@@ -0,0 +1,293 @@
+import argparse
+import bisect
+import gzip
+import json
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Iterable, Iterator, TextIO
+
+from nightledger_api.models.event_schema import EventPayload
+from nightledger_api.services.business_rules_service import validate_event_business_rules
+from nightledger_api.services.errors import (
+    BusinessRuleValidationError,
+    DuplicateEventError,
+    SchemaValidationError,
+)
+from nightledger_api.services.event_ingest_service import validate_event_payload
+from nightledger_api.services.event_store import (
+    SQLiteAppendOnlyEventStore,
+    StoredEvent,
+    configured_event_store_db_path,
+)
+
+_DEFAULT_BATCH_SIZE = 1000
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+@dataclass(frozen=True)
+class ImportReject:
+    line: int
+    event_id: str | None
+    run_id: str | None
+    codes: list[str]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "line": self.line,
+            "event_id": self.event_id,
+            "run_id": self.run_id,
+            "codes": self.codes,
+        }
+
+
+@dataclass
+class ImportReport:
+    source: str
+    db_path: str
+    workers: int
+    lines_read: int = 0
+    accepted: int = 0
+    rejects: list[ImportReject] = field(default_factory=list)
+    run_ids: set[str] = field(default_factory=set)
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        codes = Counter(code for reject in self.rejects for code in reject.codes)
+        return {
+            "source": self.source,
+            "db_path": self.db_path,
+            "workers": self.workers,
+            "lines_read": self.lines_read,
+            "accepted": self.accepted,
+            "rejected": len(self.rejects),
+            "run_count": len(self.run_ids),
+            "rejects_by_code": dict(sorted(codes.items())),
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "events_per_second": (
+                round(self.accepted / self.elapsed_seconds, 1) if self.elapsed_seconds > 0 else None
+            ),
+        }
+
+
+@dataclass
+class _RunHistory:
+    """A run's stored events plus the events this import has appended to it."""
+
+    events: list[StoredEvent]
+    known_ids: set[str]
+
+
+def import_events(
+    *,
+    lines: Iterable[str],
+    store: SQLiteAppendOnlyEventStore,
+    report: ImportReport,
+    batch_size: int = _DEFAULT_BATCH_SIZE,
+) -> ImportReport:
+    started_at = perf_counter()
+    pool = ProcessPoolExecutor(max_workers=report.workers) if report.workers > 1 else None
+    histories: dict[str, _RunHistory] = {}
+    try:
+        for chunk in _chunks(_numbered_lines(lines), batch_size):
+            report.lines_read += len(chunk)
+            if pool is None:
+                validated = list(map(_validate_line, chunk))
+            else:
+                chunksize = max(1, len(chunk) // (report.workers * 4))
+                validated = list(pool.map(_validate_line, chunk, chunksize=chunksize))
+            _apply_chunk(validated=validated, store=store, report=report, histories=histories)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    report.elapsed_seconds = perf_counter() - started_at
+    return report
+
+
+def _apply_chunk(
+    *,
+    validated: list[tuple[int, EventPayload | None, ImportReject | None]],
+    store: SQLiteAppendOnlyEventStore,
+    report: ImportReport,
+    histories: dict[str, _RunHistory],
+) -> None:
+    events_by_run: dict[str, list[tuple[int, EventPayload]]] = {}
+    for line, event, reject in validated:
+        if reject is not None:
+            report.rejects.append(reject)
+            continue
+        assert event is not None  # pragma: no cover - _validate_line contract
+        events_by_run.setdefault(event.run_id, []).append((line, event))
+
+    for run_id, run_events in events_by_run.items():
+        # Business rules are order dependent, so each run is checked against its
+        # stored history plus the events accepted so far. The history is read
+        # from the store once per run and then kept across chunks.
+        history = histories.get(run_id)
+        if history is None:
+            existing = store.list_by_run_id(run_id)
+            history = _RunHistory(events=existing, known_ids={event.id for event in existing})
+            histories[run_id] = history
+        accepted: list[tuple[int, EventPayload]] = []
+        for line, event in run_events:
+            if event.id in history.known_ids:
+                report.rejects.append(
+                    ImportReject(line=line, event_id=event.id, run_id=run_id, codes=["DUPLICATE_EVENT"])
+                )
+                continue
+            try:
+                validate_event_business_rules(event=event, existing_events=history.events)
+            except BusinessRuleValidationError as exc:
+                report.rejects.append(
+                    ImportReject(
+                        line=line,
+                        event_id=event.id,
+                        run_id=run_id,
+                        codes=sorted({detail.code for detail in exc.details}),
+                    )
+                )
+                continue
+            bisect.insort(history.events, _provisional_stored_event(event), key=lambda item: item.timestamp)
+            history.known_ids.add(event.id)
+            accepted.append((line, event))
+        if accepted and not _append_run(run_id=run_id, accepted=accepted, store=store, report=report):
+            # Another writer changed the run, so the kept history is stale;
+            # the next chunk that touches the run reads it again.
+            del histories[run_id]
+
+
+def _append_run(
+    *,
+    run_id: str,
+    accepted: list[tuple[int, EventPayload]],
+    store: SQLiteAppendOnlyEventStore,
+    report: ImportReport,
+) -> bool:
+    # Each run is its own batch, so a concurrent writer racing one run only
+    # rejects that run's events instead of aborting the whole import.
+    try:
+        store.append_batch([event for _, event in accepted])
+    except DuplicateEventError:
+        report.rejects.extend(
+            ImportReject(line=line, event_id=event.id, run_id=run_id, codes=["DUPLICATE_EVENT"])
+            for line, event in accepted
+        )
+        return False
+    report.accepted += len(accepted)
+    report.run_ids.add(run_id)
+    return True
+
+
+def _validate_line(item: tuple[int, str]) -> tuple[int, EventPayload | None, ImportReject | None]:
+    line, raw = item
+    try:
+        parsed = json.loads(raw)
+    except json.JSONDecodeError:
+        return line, None, ImportReject(line=line, event_id=None, run_id=None, codes=["INVALID_JSON"])
+    if not isinstance(parsed, dict):
+        return line, None, ImportReject(line=line, event_id=None, run_id=None, codes=["INVALID_JSON"])
+
+    try:
+        return line, validate_event_payload(parsed), None
+    except SchemaValidationError as exc:
+        return line, None, ImportReject(
+            line=line,
+            event_id=_optional_string(parsed.get("id")),
+            run_id=_optional_string(parsed.get("run_id")),
+            codes=sorted({detail.code for detail in exc.details}),
+        )
+
+
+def _provisional_stored_event(event: EventPayload) -> StoredEvent:
+    return StoredEvent(
+        id=event.id,
+        timestamp=event.timestamp,
+        run_id=event.run_id,
+        payload=event.model_dump(mode="json"),
+    )
+
+
+def _numbered_lines(lines: Iterable[str]) -> Iterator[tuple[int, str]]:
+    for line_number, raw in enumerate(lines, start=1):
+        if raw.strip():
+            yield line_number, raw
+
+
+def _chunks(items: Iterator[tuple[int, str]], size: int) -> Iterator[list[tuple[int, str]]]:
+    chunk: list[tuple[int, str]] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _open_source(source: str) -> TextIO:
+    if source == "-":
+        return sys.stdin
+    with open(source, "rb") as handle:
+        magic = handle.read(2)
+    if magic == _GZIP_MAGIC:
+        return gzip.open(source, "rt", encoding="utf-8")
+    return open(source, "r", encoding="utf-8")
+
+
+def _optional_string(value: Any) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m nightledger_api.tools.import",
+        description="Bulk import NDJSON events (optionally gzip-compressed) into a SQLite event store.",
+    )
+    parser.add_argument("source", help="NDJSON/JSONL file path, '.gz' supported; '-' reads stdin")
+    parser.add_argument(
+        "--db",
+        default=None,
+        help="SQLite event store path (defaults to NIGHTLEDGER_EVENT_STORE_DB_PATH)",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="validation worker processes")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=_DEFAULT_BATCH_SIZE,
+        help="lines validated per chunk; each run's events in a chunk are appended in one store transaction",
+    )
+    parser.add_argument("--rejects", default=None, help="write rejected lines as NDJSON to this path")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be >= 1")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    db_path = args.db or configured_event_store_db_path()
+    report = ImportReport(source=args.source, db_path=db_path, workers=args.workers)
+    store = SQLiteAppendOnlyEventStore(path=db_path)
+
+    source = _open_source(args.source)
+    try:
+        import_events(lines=source, store=store, report=report, batch_size=args.batch_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+    if args.rejects:
+        with open(args.rejects, "w", encoding="utf-8") as handle:
+            for reject in report.rejects:
+                handle.write(json.dumps(reject.to_dict()) + "\n")
+
+    print(json.dumps(report.to_dict()))
+    return 1 if report.rejects else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Iterator
+
+from nightledger_api.services.event_store import (
+    _build_event_hash,
+    configured_event_store_db_path,
+    event_hash_algorithm,
+)
+
+_DEFAULT_EVENTS_PER_TASK = 20_000
+
+
+@dataclass(frozen=True)
+class BrokenRun:
+    run_id: str
+    sequence: int
+    event_id: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "sequence": self.sequence,
+            "event_id": self.event_id,
+            "code": "HASH_CHAIN_BROKEN",
+        }
+
+
+@dataclass
+class VerifyReport:
+    db_path: str
+    workers: int
+    run_count: int = 0
+    events_verified: int = 0
+    broken_runs: list[BrokenRun] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "db_path": self.db_path,
+            "workers": self.workers,
+            "run_count": self.run_count,
+            "events_verified": self.events_verified,
+            "broken_run_count": len(self.broken_runs),
+            "broken_runs": [broken.to_dict() for broken in self.broken_runs],
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "events_per_second": (
+                round(self.events_verified / self.elapsed_seconds, 1) if self.elapsed_seconds > 0 else None
+            ),
+        }
+
+
+def verify_ledger(
+    *,
+    report: VerifyReport,
+    events_per_task: int = _DEFAULT_EVENTS_PER_TASK,
+) -> VerifyReport:
+    """Recompute every run's hash chain straight from the SQLite file.
+
+    Runs are grouped into tasks of roughly events_per_task events and spread
+    across report.workers processes, each reading through its own read-only
+    connection. Only the first bad event of a broken run is reported, since
+    every later link depends on it.
+    """
+    started_at = perf_counter()
+    with _connect_read_only(report.db_path) as conn:
+        run_sizes = conn.execute(
+            "SELECT run_id, COUNT(*) FROM events GROUP BY run_id ORDER BY run_id"
+        ).fetchall()
+    tasks = [(report.db_path, run_ids) for run_ids in _run_groups(run_sizes, events_per_task)]
+    if report.workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=report.workers) as pool:
+            results = list(pool.map(_verify_runs, tasks))
+    else:
+        results = [_verify_runs(task) for task in tasks]
+    for events_verified, broken_runs in results:
+        report.events_verified += events_verified
+        report.broken_runs.extend(broken_runs)
+    report.run_count = len(run_sizes)
+    report.elapsed_seconds = perf_counter() - started_at
+    return report
+
+
+def _verify_runs(task: tuple[str, list[str]]) -> tuple[int, list[BrokenRun]]:
+    db_path, run_ids = task
+    events_verified = 0
+    broken_runs: list[BrokenRun] = []
+    with _connect_read_only(db_path) as conn:
+        for run_id in run_ids:
+            verified, broken = _verify_run(conn, run_id)
+            events_verified += verified
+            if broken is not None:
+                broken_runs.append(broken)
+    return events_verified, broken_runs
+
+
+def _verify_run(conn: sqlite3.Connection, run_id: str) -> tuple[int, BrokenRun | None]:
+    rows = conn.execute(
+        """
+        SELECT sequence, event_id, timestamp, payload_json, integrity_warning, prev_hash, hash
+        FROM events
+        WHERE run_id = ?
+        ORDER BY sequence ASC
+        """,
+        (run_id,),
+    )
+    previous_hash: str | None = None
+    verified = 0
+    # Rows are streamed from the cursor, so one long run is never held whole.
+    for sequence, event_id, timestamp, payload_json, integrity_warning, prev_hash, current_hash in rows:
+        expected_hash = _build_event_hash(
+            run_id=run_id,
+            event_id=str(event_id),
+            # Stored as the isoformat string the hash was built from.
+            timestamp=str(timestamp),
+            payload=json.loads(str(payload_json)),
+            integrity_warning=bool(integrity_warning),
+            prev_hash=previous_hash,
+            algorithm=event_hash_algorithm(str(current_hash or "")),
+        )
+        if prev_hash != previous_hash or not current_hash or current_hash != expected_hash:
+            return verified, BrokenRun(run_id=run_id, sequence=int(sequence), event_id=str(event_id))
+        previous_hash = str(current_hash)
+        verified += 1
+    return verified, None
+
+
+def _run_groups(run_sizes: list[tuple[str, int]], events_per_task: int) -> Iterator[list[str]]:
+    group: list[str] = []
+    group_events = 0
+    for run_id, event_count in run_sizes:
+        group.append(str(run_id))
+        group_events += int(event_count)
+        if group_events >= events_per_task:
+            yield group
+            group = []
+            group_events = 0
+    if group:
+        yield group
+
+
+def _connect_read_only(db_path: str) -> sqlite3.Connection:
+    return sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=ro", uri=True)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m nightledger_api.tools.verify",
+        description="Verify every run's hash chain in a SQLite event store.",
+    )
+    parser.add_argument(
+        "--db",
+        default=None,
+        help="SQLite event store path (defaults to NIGHTLEDGER_EVENT_STORE_DB_PATH)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="verification worker processes (defaults to the CPU count)",
+    )
+    parser.add_argument(
+        "--events-per-task",
+        type=int,
+        default=_DEFAULT_EVENTS_PER_TASK,
+        help="approximate events per unit of work handed to a worker",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.events_per_task < 1:
+        parser.error("--events-per-task must be >= 1")
+    args.db = args.db or configured_event_store_db_path()
+    if not os.path.exists(args.db):
+        parser.error(f"event store not found: {args.db}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    report = VerifyReport(db_path=args.db, workers=args.workers)
+    verify_ledger(report=report, events_per_task=args.events_per_task)
+    print(json.dumps(report.to_dict()))
+    return 1 if report.broken_runs else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
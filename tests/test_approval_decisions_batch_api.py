@@ -0,0 +1,149 @@
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+)
+
+client = TestClient(app)
+
+
+def register(decision_id: str, run_id: str) -> None:
+    response = client.post(
+        "/v1/approvals/requests",
+        json={
+            "decision_id": decision_id,
+            "run_id": run_id,
+            "requested_by": "agent",
+            "title": "Approval required",
+            "details": "Purchase amount exceeds threshold",
+            "risk_level": "high",
+        },
+    )
+    assert response.status_code == 200
+
+
+def batch_item(decision_id: str, decision: str = "approved") -> dict[str, Any]:
+    return {"decision_id": decision_id, "decision": decision, "approver_id": "human_reviewer"}
+
+
+class _CountingStore:
+    def __init__(self, base: Any) -> None:
+        self._base = base
+        self.calls: dict[str, int] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._base, name)
+        if not callable(attribute):
+            return attribute
+
+        def _counted(*args: Any, **kwargs: Any) -> Any:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            return attribute(*args, **kwargs)
+
+        return _counted
+
+
+@pytest.fixture(autouse=True)
+def reset_dependencies() -> None:
+    app.dependency_overrides.clear()
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_batch_resolves_each_decision_with_single_decision_results(tmp_path, backend: str) -> None:
+    base = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    app.dependency_overrides[get_event_store] = lambda: base
+    register("dec_batch_1", "run_batch_1")
+    register("dec_batch_2", "run_batch_2")
+    store = _CountingStore(base)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    response = client.post(
+        "/v1/approvals/decisions:batch",
+        json={"items": [batch_item("dec_batch_1"), batch_item("dec_batch_2", "rejected")]},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["item_count"] == 2
+    assert body["resolved_count"] == 2
+    first, second = body["results"]
+    assert first["decision_id"] == "dec_batch_1"
+    assert first["status"] == "resolved"
+    assert first["run_id"] == "run_batch_1"
+    assert first["run_status"] == "approved"
+    assert first["timing"]["state_transition"] == "paused->approved"
+    assert first["timing"]["target_ms"] == 1000
+    assert second["decision"] == "rejected"
+    assert second["run_status"] == "stopped"
+    assert store.calls["list_all"] == 1
+    assert store.calls["append_batch"] == 2
+    assert "append" not in store.calls
+
+    state = client.get("/v1/approvals/decisions/dec_batch_1").json()
+    assert state["status"] == "approved"
+    assert state["resolved_event_id"] == first["event_id"]
+
+
+def test_batch_reports_per_item_errors_with_single_decision_codes() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+    register("dec_batch_ok", "run_batch_ok")
+    register("dec_batch_done", "run_batch_done")
+    resolved = client.post("/v1/approvals/decisions/dec_batch_done", json=batch_item("dec_batch_done"))
+    assert resolved.status_code == 200
+
+    response = client.post(
+        "/v1/approvals/decisions:batch",
+        json={
+            "items": [
+                batch_item("dec_batch_missing"),
+                batch_item("dec_batch_ok"),
+                batch_item("dec_batch_ok", "rejected"),
+                batch_item("dec_batch_done"),
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert response.json()["resolved_count"] == 1
+    assert [result["status"] for result in results] == ["failed", "resolved", "failed", "failed"]
+    assert results[0]["error"]["code"] == "APPROVAL_NOT_FOUND"
+    assert results[0]["error"]["details"][0]["path"] == "decision_id"
+    assert results[2]["error"]["code"] == "DUPLICATE_APPROVAL"
+    assert results[3]["error"]["code"] == "DUPLICATE_APPROVAL"
+    assert [event.payload["type"] for event in store.list_by_run_id("run_batch_ok")] == [
+        "approval_requested",
+        "approval_resolved",
+    ]
+
+
+def test_batch_validation_uses_approval_error_codes() -> None:
+    app.dependency_overrides[get_event_store] = lambda: InMemoryAppendOnlyEventStore()
+
+    response = client.post(
+        "/v1/approvals/decisions:batch",
+        json={"items": [{"decision_id": "dec_batch_1", "decision": "maybe", "approver_id": " "}]},
+    )
+    empty = client.post("/v1/approvals/decisions:batch", json={"items": []})
+
+    assert response.status_code == 422
+    codes = {detail["code"] for detail in response.json()["error"]["details"]}
+    assert codes == {"INVALID_APPROVAL_DECISION", "MISSING_APPROVER_ID"}
+    assert empty.status_code == 422
@@ -0,0 +1,87 @@
+from pathlib import Path
+import sys
+
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import InMemoryAppendOnlyEventStore  # noqa: E402
+from nightledger_api.services.latency_metrics import LatencyHistogram  # noqa: E402
+
+client = TestClient(app)
+
+
+def test_histogram_reports_bounded_percentiles_and_target_ratio() -> None:
+    histogram = LatencyHistogram(target_ms=1000)
+    for value in range(1, 101):
+        histogram.record(value * 20)
+
+    summary = histogram.snapshot()
+
+    assert summary["count"] == 100
+    assert summary["min"] == 20
+    assert summary["max"] == 2000
+    assert summary["mean"] == 1010.0
+    assert 1000 <= summary["p50"] <= 1000 * 1.19
+    assert 1900 <= summary["p95"] <= 2000
+    assert summary["p99"] == 2000
+    assert summary["target_ms"] == 1000
+    assert summary["within_target_ratio"] == 0.5
+
+
+def test_empty_histogram_has_no_percentiles() -> None:
+    summary = LatencyHistogram().snapshot()
+
+    assert summary == {"count": 0, "min": None, "max": None, "mean": None, "p50": None, "p95": None, "p99": None}
+
+
+def test_resolutions_feed_approval_latency_endpoint() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+    try:
+        before = client.get("/v1/metrics/approval-latency").json()
+        store.append(
+            validate_event_payload(
+                {
+                    "id": "evt_latency_request",
+                    "run_id": "run_latency",
+                    "timestamp": "2026-02-20T10:00:00Z",
+                    "type": "approval_requested",
+                    "actor": "agent",
+                    "title": "Approval required",
+                    "details": "Latency metrics test",
+                    "confidence": 0.8,
+                    "risk_level": "medium",
+                    "requires_approval": True,
+                    "approval": {
+                        "status": "pending",
+                        "requested_by": "agent",
+                        "resolved_by": None,
+                        "resolved_at": None,
+                        "reason": None,
+                    },
+                    "evidence": [],
+                }
+            )
+        )
+        resolved = client.post(
+            "/v1/approvals/evt_latency_request",
+            json={"decision": "approved", "approver_id": "human_reviewer"},
+        )
+        after = client.get("/v1/metrics/approval-latency").json()
+    finally:
+        app.dependency_overrides.clear()
+
+    assert resolved.status_code == 200
+    state_update = after["approval_to_state_update_ms"]
+    assert state_update["count"] == before["approval_to_state_update_ms"]["count"] + 1
+    assert state_update["target_ms"] == 1000
+    assert 0 < state_update["within_target_ratio"] <= 1
+    wait = after["request_to_resolution_ms"]["medium"]
+    assert wait["count"] == before["request_to_resolution_ms"]["medium"]["count"] + 1
+    # The request is dated in the past, so the wait spans at least that gap.
+    assert wait["max"] >= 86_400_000
+    assert "within_target_ratio" not in wait
@@ -65,6 +65,9 @@ class _FailingApprovalAppendStore:
     def __init__(self) -> None:
         self._base = InMemoryAppendOnlyEventStore()
 
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._base, name)
+
     def append(self, event: Any) -> Any:
         if getattr(event, "type", None) == "approval_resolved":
             raise RuntimeError("storage backend append failed")
@@ -77,7 +80,7 @@ class _FailingApprovalAppendStore:
         return self._base.list_all()
 
 
-class _BrokenRegistrationStore:
+class _BrokenRegistrationStore(InMemoryAppendOnlyEventStore):
     def append(self, event: Any) -> Any:
         _ = event
         raise RuntimeError("unexpected append failure")
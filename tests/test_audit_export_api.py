@@ -83,7 +83,7 @@ def test_issue48_round3_audit_export_unknown_decision_returns_structured_not_fou
     assert body["error"]["details"][0]["path"] == "decision_id"
 
 
-class _TamperedDecisionTraceStore:
+class _TamperedDecisionTraceStore(InMemoryAppendOnlyEventStore):
     def append(self, event: object) -> object:
         _ = event
         raise RuntimeError("append should not be called")
@@ -95,6 +95,10 @@ class _TamperedDecisionTraceStore:
         _ = run_id
         return [self._tampered_event()]
 
+    def list_chain(self, run_id: str, *, after_sequence: int = 0) -> list[StoredEvent]:
+        _ = run_id, after_sequence
+        return [self._tampered_event()]
+
     def _tampered_event(self) -> StoredEvent:
         original_payload = {
             "id": "evt_issue48_tampered_1",
@@ -0,0 +1,314 @@
+import gzip
+import importlib
+import json
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.services.errors import DuplicateEventError  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+)
+
+import_tool = importlib.import_module("nightledger_api.tools.import")
+
+
+def build_payload(
+    *,
+    event_id: str,
+    run_id: str,
+    timestamp: str,
+    event_type: str = "action",
+    requires_approval: bool = False,
+    approval_status: str = "not_required",
+    meta_step: str = "work",
+) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "run_id": run_id,
+        "timestamp": timestamp,
+        "type": event_type,
+        "actor": "agent",
+        "title": f"Backfilled {event_type}",
+        "details": "Imported from historical agent log",
+        "confidence": 0.9,
+        "risk_level": "low",
+        "requires_approval": requires_approval,
+        "approval": {
+            "status": approval_status,
+            "requested_by": "agent" if approval_status == "pending" else None,
+            "resolved_by": None,
+            "resolved_at": None,
+            "reason": None,
+        },
+        "evidence": [],
+        "meta": {"workflow": "backfill", "step": meta_step},
+    }
+
+
+def write_ndjson(path: Path, lines: list[Any], *, compress: bool = False) -> None:
+    body = "\n".join(item if isinstance(item, str) else json.dumps(item) for item in lines) + "\n"
+    if compress:
+        with gzip.open(path, "wt", encoding="utf-8") as handle:
+            handle.write(body)
+    else:
+        path.write_text(body, encoding="utf-8")
+
+
+def run_import(argv: list[str], capsys) -> tuple[int, dict[str, Any]]:
+    exit_code = import_tool.main(argv)
+    report = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    return exit_code, report
+
+
+def test_import_writes_runs_to_sqlite_and_reports_throughput(tmp_path, capsys) -> None:
+    source = tmp_path / "events.ndjson"
+    db_path = tmp_path / "events.db"
+    write_ndjson(
+        source,
+        [
+            build_payload(event_id="evt_a1", run_id="run_import_a", timestamp="2026-02-20T10:00:00Z"),
+            build_payload(event_id="evt_b1", run_id="run_import_b", timestamp="2026-02-20T10:00:01Z"),
+            build_payload(event_id="evt_a2", run_id="run_import_a", timestamp="2026-02-20T10:00:02Z"),
+            build_payload(
+                event_id="evt_a3",
+                run_id="run_import_a",
+                timestamp="2026-02-20T10:00:03Z",
+                event_type="summary",
+                meta_step="run_completed",
+            ),
+        ],
+    )
+
+    exit_code, report = run_import([str(source), "--db", str(db_path), "--batch-size", "2"], capsys)
+
+    assert exit_code == 0
+    assert report["lines_read"] == 4
+    assert report["accepted"] == 4
+    assert report["rejected"] == 0
+    assert report["run_count"] == 2
+    assert report["events_per_second"] is None or report["events_per_second"] > 0
+
+    store = SQLiteAppendOnlyEventStore(path=str(db_path))
+    run_a = store.list_by_run_id("run_import_a")
+    assert [event.id for event in run_a] == ["evt_a1", "evt_a2", "evt_a3"]
+    assert run_a[0].prev_hash is None
+    assert run_a[1].prev_hash == run_a[0].hash
+    assert [event.id for event in store.list_by_run_id("run_import_b")] == ["evt_b1"]
+
+
+def test_import_reads_gzip_with_worker_pool_and_records_rejects(tmp_path, capsys) -> None:
+    source = tmp_path / "events.ndjson.gz"
+    db_path = tmp_path / "events.db"
+    rejects_path = tmp_path / "rejects.ndjson"
+    invalid = build_payload(event_id="evt_bad", run_id="run_import_c", timestamp="2026-02-20T10:00:00Z")
+    del invalid["title"]
+    write_ndjson(
+        source,
+        [
+            build_payload(event_id="evt_c1", run_id="run_import_c", timestamp="2026-02-20T10:00:00Z"),
+            "{not json",
+            invalid,
+            build_payload(event_id="evt_c1", run_id="run_import_c", timestamp="2026-02-20T10:00:01Z"),
+            build_payload(
+                event_id="evt_c2",
+                run_id="run_import_c",
+                timestamp="2026-02-20T10:00:02Z",
+                event_type="summary",
+                meta_step="run_completed",
+            ),
+            build_payload(event_id="evt_c3", run_id="run_import_c", timestamp="2026-02-20T10:00:03Z"),
+        ],
+        compress=True,
+    )
+
+    exit_code, report = run_import(
+        [str(source), "--db", str(db_path), "--workers", "2", "--rejects", str(rejects_path)],
+        capsys,
+    )
+
+    assert exit_code == 1
+    assert report["accepted"] == 2
+    assert report["rejected"] == 4
+    assert report["rejects_by_code"] == {
+        "DUPLICATE_EVENT": 1,
+        "INVALID_JSON": 1,
+        "MISSING_TIMELINE_FIELDS": 1,
+        "TERMINAL_STATE_CONFLICT": 1,
+    }
+    rejects = [json.loads(line) for line in rejects_path.read_text(encoding="utf-8").splitlines()]
+    assert sorted(reject["line"] for reject in rejects) == [2, 3, 4, 6]
+
+    store = SQLiteAppendOnlyEventStore(path=str(db_path))
+    assert [event.id for event in store.list_by_run_id("run_import_c")] == ["evt_c1", "evt_c2"]
+
+
+def test_import_applies_business_rules_against_previously_stored_history(tmp_path, capsys) -> None:
+    db_path = tmp_path / "events.db"
+    store = SQLiteAppendOnlyEventStore(path=str(db_path))
+    store.append(
+        validate_event_payload(
+            build_payload(
+                event_id="evt_d1",
+                run_id="run_import_d",
+                timestamp="2026-02-20T10:00:00Z",
+                event_type="approval_requested",
+                requires_approval=True,
+                approval_status="pending",
+            )
+        )
+    )
+    source = tmp_path / "events.jsonl"
+    write_ndjson(
+        source,
+        [
+            build_payload(
+                event_id="evt_d2",
+                run_id="run_import_d",
+                timestamp="2026-02-20T10:00:01Z",
+                event_type="summary",
+                meta_step="run_completed",
+            )
+        ],
+    )
+
+    exit_code, report = run_import([str(source), "--db", str(db_path)], capsys)
+
+    assert exit_code == 1
+    assert report["rejects_by_code"] == {"PENDING_APPROVAL_EXISTS": 1}
+    assert [event.id for event in store.list_by_run_id("run_import_d")] == ["evt_d1"]
+
+
+@pytest.mark.parametrize("store_factory", ["memory", "sqlite"])
+def test_append_batch_is_atomic_on_duplicate(tmp_path, store_factory: str) -> None:
+    store = (
+        InMemoryAppendOnlyEventStore()
+        if store_factory == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    first = validate_event_payload(
+        build_payload(event_id="evt_e1", run_id="run_batch_e", timestamp="2026-02-20T10:00:00Z")
+    )
+    second = validate_event_payload(
+        build_payload(event_id="evt_e2", run_id="run_batch_e", timestamp="2026-02-20T10:00:01Z")
+    )
+
+    with pytest.raises(DuplicateEventError):
+        store.append_batch([first, second, first])
+
+    assert store.list_by_run_id("run_batch_e") == []
+    stored = store.append_batch([first, second])
+    assert [event.id for event in stored] == ["evt_e1", "evt_e2"]
+    assert stored[1].prev_hash == stored[0].hash
+
+
+def test_import_rejects_a_run_raced_by_another_writer_and_keeps_the_rest(tmp_path) -> None:
+    class _RacedStore(SQLiteAppendOnlyEventStore):
+        def list_by_run_id(self, run_id: str) -> list[Any]:
+            # Another writer lands evt_r1 after the import read the run.
+            return [] if run_id == "run_import_raced" else super().list_by_run_id(run_id)
+
+    store = _RacedStore(path=str(tmp_path / "events.db"))
+    store.append(
+        validate_event_payload(
+            build_payload(event_id="evt_r1", run_id="run_import_raced", timestamp="2026-02-20T10:00:00Z")
+        )
+    )
+    lines = [
+        json.dumps(build_payload(event_id=event_id, run_id=run_id, timestamp=timestamp))
+        for event_id, run_id, timestamp in [
+            ("evt_r1", "run_import_raced", "2026-02-20T10:00:00Z"),
+            ("evt_ok1", "run_import_ok", "2026-02-20T10:00:01Z"),
+            ("evt_r2", "run_import_raced", "2026-02-20T10:00:02Z"),
+        ]
+    ]
+    report = import_tool.ImportReport(source="-", db_path=str(tmp_path / "events.db"), workers=1)
+
+    import_tool.import_events(lines=lines, store=store, report=report)
+
+    assert report.accepted == 1
+    assert report.run_ids == {"run_import_ok"}
+    assert [reject.to_dict() for reject in report.rejects] == [
+        {"line": 1, "event_id": "evt_r1", "run_id": "run_import_raced", "codes": ["DUPLICATE_EVENT"]},
+        {"line": 3, "event_id": "evt_r2", "run_id": "run_import_raced", "codes": ["DUPLICATE_EVENT"]},
+    ]
+    assert [event.id for event in store.list_by_run_id("run_import_ok")] == ["evt_ok1"]
+    assert [event.id for event in SQLiteAppendOnlyEventStore.list_by_run_id(store, "run_import_raced")] == ["evt_r1"]
+
+
+def test_import_reads_each_run_from_the_store_once_across_chunks(tmp_path) -> None:
+    reads: list[str] = []
+
+    class _CountingStore(SQLiteAppendOnlyEventStore):
+        def list_by_run_id(self, run_id: str) -> list[Any]:
+            reads.append(run_id)
+            return super().list_by_run_id(run_id)
+
+    store = _CountingStore(path=str(tmp_path / "events.db"))
+    lines = [
+        json.dumps(
+            build_payload(
+                event_id="evt_h1",
+                run_id="run_import_h",
+                timestamp="2026-02-20T10:00:00Z",
+                event_type="approval_requested",
+                requires_approval=True,
+                approval_status="pending",
+            )
+        ),
+        json.dumps(build_payload(event_id="evt_i1", run_id="run_import_i", timestamp="2026-02-20T10:00:01Z")),
+        json.dumps(build_payload(event_id="evt_h1", run_id="run_import_h", timestamp="2026-02-20T10:00:02Z")),
+        json.dumps(
+            build_payload(
+                event_id="evt_h2",
+                run_id="run_import_h",
+                timestamp="2026-02-20T10:00:03Z",
+                event_type="summary",
+                meta_step="run_completed",
+            )
+        ),
+        json.dumps(build_payload(event_id="evt_i2", run_id="run_import_i", timestamp="2026-02-20T10:00:04Z")),
+    ]
+    report = import_tool.ImportReport(source="-", db_path=str(tmp_path / "events.db"), workers=1)
+
+    import_tool.import_events(lines=lines, store=store, report=report, batch_size=2)
+
+    assert sorted(reads) == ["run_import_h", "run_import_i"]
+    assert report.accepted == 3
+    assert [reject.to_dict() for reject in report.rejects] == [
+        {"line": 3, "event_id": "evt_h1", "run_id": "run_import_h", "codes": ["DUPLICATE_EVENT"]},
+        {"line": 4, "event_id": "evt_h2", "run_id": "run_import_h", "codes": ["PENDING_APPROVAL_EXISTS"]},
+    ]
+    assert [event.id for event in SQLiteAppendOnlyEventStore.list_by_run_id(store, "run_import_i")] == [
+        "evt_i1",
+        "evt_i2",
+    ]
+
+
+def test_import_counts_only_runs_with_appended_events(tmp_path, capsys) -> None:
+    source = tmp_path / "events.jsonl"
+    db_path = tmp_path / "events.db"
+    invalid = build_payload(event_id="evt_f1", run_id="run_import_f", timestamp="2026-02-20T10:00:00Z")
+    invalid["approval"]["status"] = "approved"
+    invalid["type"] = "approval_resolved"
+    invalid["requires_approval"] = True
+    write_ndjson(
+        source,
+        [
+            build_payload(event_id="evt_g1", run_id="run_import_g", timestamp="2026-02-20T10:00:00Z"),
+            invalid,
+        ],
+    )
+
+    exit_code, report = run_import([str(source), "--db", str(db_path)], capsys)
+
+    assert exit_code == 1
+    assert report["accepted"] == 1
+    assert report["rejected"] == 1
+    assert report["run_count"] == 1
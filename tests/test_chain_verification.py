@@ -0,0 +1,122 @@
+from dataclasses import replace
+from pathlib import Path
+import sqlite3
+import sys
+from typing import Any
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.services import chain_verification  # noqa: E402
+from nightledger_api.services.chain_verification import verify_run_chain  # noqa: E402
+from nightledger_api.services.errors import InconsistentRunStateError  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+)
+
+
+def _event(event_id: str, timestamp: str, run_id: str = "run_chain") -> Any:
+    return validate_event_payload(
+        {
+            "id": event_id,
+            "run_id": run_id,
+            "timestamp": timestamp,
+            "type": "action",
+            "actor": "agent",
+            "title": "Step",
+            "details": f"Step {event_id}",
+            "confidence": 0.8,
+            "risk_level": "low",
+            "requires_approval": False,
+            "approval": {
+                "status": "not_required",
+                "requested_by": None,
+                "resolved_by": None,
+                "resolved_at": None,
+                "reason": None,
+            },
+            "evidence": [],
+        }
+    )
+
+
+def _count_hashes(monkeypatch) -> list[str]:
+    hashed: list[str] = []
+    build_event_hash = chain_verification._build_event_hash
+
+    def _counted(**kwargs: Any) -> str:
+        hashed.append(kwargs["event_id"])
+        return build_event_hash(**kwargs)
+
+    monkeypatch.setattr(chain_verification, "_build_event_hash", _counted)
+    return hashed
+
+
+def test_out_of_order_events_verify_in_insertion_order() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    store.append(_event("evt_1", "2026-02-20T10:00:00Z"))
+    store.append(_event("evt_2", "2026-02-20T10:05:00Z"))
+    late = store.append(_event("evt_late", "2026-02-20T10:01:00Z"))
+
+    assert late.integrity_warning is True
+    verify_run_chain(store=store, run_id="run_chain")
+
+    checkpoint = store.chain_checkpoint("run_chain")
+    assert checkpoint is not None
+    assert (checkpoint.sequence, checkpoint.hash) == (late.sequence, late.hash)
+
+
+def test_repeated_verification_only_hashes_new_events(monkeypatch) -> None:
+    store = InMemoryAppendOnlyEventStore()
+    store.append(_event("evt_1", "2026-02-20T10:00:00Z"))
+    store.append(_event("evt_2", "2026-02-20T10:01:00Z"))
+    hashed = _count_hashes(monkeypatch)
+
+    verify_run_chain(store=store, run_id="run_chain")
+    verify_run_chain(store=store, run_id="run_chain")
+    store.append(_event("evt_3", "2026-02-20T10:02:00Z"))
+    verify_run_chain(store=store, run_id="run_chain")
+
+    assert hashed == ["evt_1", "evt_2", "evt_3"]
+
+
+def test_tampering_after_checkpoint_is_detected() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    store.append(_event("evt_1", "2026-02-20T10:00:00Z"))
+    verify_run_chain(store=store, run_id="run_chain")
+    store.append(_event("evt_2", "2026-02-20T10:01:00Z"))
+    records = store._run_records_index["run_chain"]
+    records[1] = replace(records[1], payload={**records[1].payload, "details": "tampered"})
+
+    with pytest.raises(InconsistentRunStateError) as exc_info:
+        verify_run_chain(store=store, run_id="run_chain")
+
+    assert exc_info.value.detail_code == "HASH_CHAIN_BROKEN"
+    assert store.chain_checkpoint("run_chain").sequence == records[0].sequence
+
+
+def test_sqlite_checkpoint_persists_and_never_moves_back(tmp_path, monkeypatch) -> None:
+    path = str(tmp_path / "events.db")
+    store = SQLiteAppendOnlyEventStore(path=path)
+    store.append(_event("evt_1", "2026-02-20T10:00:00Z"))
+    store.append(_event("evt_2", "2026-02-20T10:05:00Z"))
+    store.append(_event("evt_late", "2026-02-20T10:01:00Z"))
+    verify_run_chain(store=store, run_id="run_chain")
+    verified = store.chain_checkpoint("run_chain")
+
+    reopened = SQLiteAppendOnlyEventStore(path=path)
+    assert reopened.chain_checkpoint("run_chain") == verified
+    reopened.save_chain_checkpoint(replace(verified, sequence=1, hash="sha256:stale"))
+    assert reopened.chain_checkpoint("run_chain") == verified
+
+    hashed = _count_hashes(monkeypatch)
+    reopened.append(_event("evt_4", "2026-02-20T10:06:00Z"))
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE events SET payload_json = '{}' WHERE event_id = 'evt_4'")
+
+    with pytest.raises(InconsistentRunStateError):
+        verify_run_chain(store=reopened, run_id="run_chain")
+    assert hashed == ["evt_4"]
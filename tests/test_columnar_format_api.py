@@ -0,0 +1,130 @@
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.presenters.columnar_presenter import (  # noqa: E402
+    COLUMNAR_MEDIA_TYPE,
+    accepts_columnar,
+)
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import InMemoryAppendOnlyEventStore  # noqa: E402
+
+client = TestClient(app)
+
+
+def build_event_payload(*, event_id: str, run_id: str, timestamp: str) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "run_id": run_id,
+        "timestamp": timestamp,
+        "type": "action",
+        "actor": "agent",
+        "title": "Columnar event",
+        "details": "Event used by columnar format tests",
+        "confidence": 0.8,
+        "risk_level": "low",
+        "requires_approval": False,
+        "approval": {
+            "status": "not_required",
+            "requested_by": None,
+            "resolved_by": None,
+            "resolved_at": None,
+            "reason": None,
+        },
+        "evidence": [{"kind": "log", "label": "Step log", "ref": f"log://{event_id}"}],
+        "meta": {"workflow": "wf_columnar", "step": "work"},
+    }
+
+
+def flatten(row: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    flat: dict[str, Any] = {}
+    for key, value in row.items():
+        if isinstance(value, dict) and value:
+            flat.update(flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def decode_columns(body: dict[str, Any], count: int) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = [{} for _ in range(count)]
+    for name, column in body["columns"].items():
+        for row, value in zip(rows, column["values"]):
+            if column.get("interned") and value is not None:
+                value = column.get("prefix", "") + body["strings"][value]
+            row[name] = value
+    return rows
+
+
+@pytest.fixture()
+def seeded_store() -> InMemoryAppendOnlyEventStore:
+    store = InMemoryAppendOnlyEventStore()
+    for index in range(1, 13):
+        store.append(
+            validate_event_payload(
+                build_event_payload(
+                    event_id=f"evt_columnar_{index:02d}",
+                    run_id="run_columnar",
+                    timestamp=f"2026-02-25T10:00:{index:02d}Z",
+                )
+            )
+        )
+    app.dependency_overrides[get_event_store] = lambda: store
+    yield store
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize(
+    ("path", "rows_key", "count_key"),
+    [
+        ("/v1/runs/run_columnar/journal", "entries", "entry_count"),
+        ("/v1/runs/run_columnar/events", "events", "event_count"),
+        ("/v1/workflows/wf_columnar/journal", "entries", "entry_count"),
+    ],
+)
+def test_columnar_representation_decodes_to_default_rows(
+    seeded_store, path: str, rows_key: str, count_key: str
+) -> None:
+    default = client.get(path)
+    columnar = client.get(path, headers={"Accept": COLUMNAR_MEDIA_TYPE})
+
+    assert default.headers["content-type"] == "application/json"
+    assert columnar.status_code == 200
+    assert columnar.headers["content-type"] == COLUMNAR_MEDIA_TYPE
+    assert columnar.headers["vary"] == "Accept"
+    body = columnar.json()
+    expected_rows = default.json()[rows_key]
+    assert body[count_key] == len(expected_rows)
+    decoded = decode_columns(body, len(expected_rows))
+    assert decoded == [
+        {name: flatten(row).get(name) for name in body["columns"]} for row in expected_rows
+    ]
+    assert {key for key in default.json() if key != rows_key} <= set(body)
+    assert len(columnar.content) * 2 < len(default.content)
+
+
+def test_columnar_journal_interns_repeated_strings_and_shared_prefixes(seeded_store) -> None:
+    body = client.get(
+        "/v1/runs/run_columnar/journal", headers={"Accept": COLUMNAR_MEDIA_TYPE}
+    ).json()
+
+    path_column = body["columns"]["payload_ref.path"]
+    assert path_column["prefix"] == "/v1/runs/run_columnar/events#evt_columnar_"
+    assert len(set(body["columns"]["payload_ref.run_id"]["values"])) == 1
+    assert body["columns"]["metadata.confidence"] == {"values": [0.8] * 12}
+    assert len(body["strings"]) == len(set(body["strings"]))
+
+
+def test_accept_negotiation_keeps_json_default() -> None:
+    assert accepts_columnar(f"application/json, {COLUMNAR_MEDIA_TYPE};q=0.9") is True
+    assert accepts_columnar(f"{COLUMNAR_MEDIA_TYPE};q=0") is False
+    assert accepts_columnar("application/json") is False
+    assert accepts_columnar("*/*") is False
+    assert accepts_columnar(None) is False
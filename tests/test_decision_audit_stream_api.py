@@ -0,0 +1,193 @@
+from dataclasses import replace
+import json
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services import audit_export_service  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+)
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def store() -> InMemoryAppendOnlyEventStore:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+    yield store
+    app.dependency_overrides.clear()
+
+
+def _request(store: Any, *, run_id: str, decision_id: str, day: int) -> None:
+    store.append(
+        validate_event_payload(
+            {
+                "id": f"evt_{decision_id}_request",
+                "run_id": run_id,
+                "timestamp": f"2026-02-{day:02d}T10:00:00Z",
+                "type": "approval_requested",
+                "actor": "agent",
+                "title": "Approval required",
+                "details": "Audit stream test",
+                "confidence": 0.8,
+                "risk_level": "high",
+                "requires_approval": True,
+                "approval": {
+                    "status": "pending",
+                    "decision_id": decision_id,
+                    "requested_by": "agent",
+                    "resolved_by": None,
+                    "resolved_at": None,
+                    "reason": None,
+                },
+                "evidence": [],
+            }
+        )
+    )
+
+
+def _resolve(decision_id: str) -> None:
+    response = client.post(
+        f"/v1/approvals/decisions/{decision_id}",
+        json={"decision": "approved", "approver_id": "human_reviewer"},
+    )
+    assert response.status_code == 200
+
+
+def _stream(**params: Any) -> list[dict[str, Any]]:
+    response = client.get("/v1/approvals/decisions:audit-export", params=params)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def _export(**params: Any) -> list[dict[str, Any]]:
+    *records, trailer = _stream(**params)
+    decision_count = sum(record["record_type"] == "decision" for record in records)
+    assert trailer == {"record_type": "end", "decision_count": decision_count}
+    return records
+
+
+def test_stream_emits_one_record_per_decision_with_hash_links(store) -> None:
+    _request(store, run_id="run_a", decision_id="dec_a", day=1)
+    _request(store, run_id="run_b", decision_id="dec_b", day=2)
+    _resolve("dec_a")
+
+    records = _export()
+
+    by_decision = {record["decision_id"]: record for record in records}
+    assert set(by_decision) == {"dec_a", "dec_b"}
+    approved = by_decision["dec_a"]
+    assert approved["record_type"] == "decision"
+    assert approved["status"] == "approved"
+    assert approved["event_count"] == len(approved["events"]) == 2
+    assert approved["events"][1]["prev_hash"] == approved["events"][0]["hash"]
+    assert approved["merkle"]["tree_size"] == len(store.list_by_run_id("run_a"))
+    assert by_decision["dec_b"]["status"] == "pending"
+
+
+def test_stream_filters_by_time_range_run_and_status(store, monkeypatch) -> None:
+    # Small catalog pages exercise the keyset walk across runs.
+    monkeypatch.setattr(audit_export_service, "_AUDIT_RUN_PAGE_SIZE", 2)
+    for day in range(1, 8):
+        _request(store, run_id=f"run_{day}", decision_id=f"dec_{day}", day=day)
+    _resolve("dec_4")
+
+    in_range = _export(since="2026-02-03T00:00:00Z", until="2026-02-06T00:00:00Z")
+    approved = _export(status="approved")
+    one_run = _export(run_id="run_7")
+
+    assert sorted(record["decision_id"] for record in in_range) == ["dec_3", "dec_4", "dec_5"]
+    assert [record["decision_id"] for record in approved] == ["dec_4"]
+    assert [record["decision_id"] for record in one_run] == ["dec_7"]
+    assert len(_export()) == 7
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_stream_is_pinned_to_the_events_stored_when_it_starts(tmp_path, monkeypatch, backend: str) -> None:
+    store = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    app.dependency_overrides[get_event_store] = lambda: store
+    monkeypatch.setattr(audit_export_service, "_AUDIT_RUN_PAGE_SIZE", 1)
+    for day, name in enumerate(["a", "b", "c"], start=1):
+        _request(store, run_id=f"run_{name}", decision_id=f"dec_{name}", day=day)
+    list_runs = store.list_runs
+    pages: list[Any] = []
+
+    def _list_runs_during_ingest(query: Any) -> Any:
+        entries = list_runs(query)
+        if not pages:
+            # Live ingest after the walk started: run_b becomes the most
+            # recently updated run, and a new run appears.
+            _resolve("dec_b")
+            _request(store, run_id="run_0", decision_id="dec_0", day=9)
+        pages.append(entries)
+        return entries
+
+    monkeypatch.setattr(store, "list_runs", _list_runs_during_ingest)
+    records = _export()
+
+    assert [(record["decision_id"], record["event_count"]) for record in records] == [
+        ("dec_a", 1),
+        ("dec_b", 1),
+        ("dec_c", 1),
+    ]
+    assert records[1]["merkle"]["tree_size"] == 1
+    assert records[1]["status"] == "pending"
+
+
+def test_stream_reports_broken_runs_and_continues(store) -> None:
+    _request(store, run_id="run_ok", decision_id="dec_ok", day=1)
+    _request(store, run_id="run_broken", decision_id="dec_broken", day=2)
+    records = store._run_records_index["run_broken"]
+    records[0] = replace(records[0], payload={**records[0].payload, "details": "tampered"})
+
+    exported = _export()
+
+    assert exported[0] == {
+        "record_type": "run_error",
+        "run_id": "run_broken",
+        "error": {"code": "HASH_CHAIN_BROKEN", "message": "stored hash chain integrity validation failed"},
+    }
+    assert [record["decision_id"] for record in exported[1:]] == ["dec_ok"]
+
+
+def test_storage_failure_mid_stream_ends_with_stream_error(store, monkeypatch) -> None:
+    _request(store, run_id="run_a", decision_id="dec_a", day=1)
+    _request(store, run_id="run_b", decision_id="dec_b", day=2)
+    list_chain = store.list_chain
+
+    def _failing_list_chain(run_id: str, **kwargs: Any) -> Any:
+        if run_id == "run_b":
+            raise OSError("disk I/O error")
+        return list_chain(run_id, **kwargs)
+
+    monkeypatch.setattr(store, "list_chain", _failing_list_chain)
+    records = _stream()
+
+    assert [record.get("decision_id") for record in records[:-1]] == ["dec_a"]
+    assert records[-1] == {
+        "record_type": "stream_error",
+        "error": {"code": "STORAGE_READ_ERROR", "message": "storage backend read failed"},
+    }
+
+
+def test_stream_rejects_naive_time_bounds(store) -> None:
+    response = client.get("/v1/approvals/decisions:audit-export", params={"since": "2026-02-01T00:00:00"})
+
+    assert response.status_code == 422
+    assert response.json()["error"]["details"][0]["code"] == "MISSING_TIMEZONE"
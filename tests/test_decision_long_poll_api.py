@@ -0,0 +1,218 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+import threading
+import time
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services.approval_service import (  # noqa: E402
+    resolve_pending_approval_by_decision_id,
+    wait_for_approval_decision_state,
+)
+from nightledger_api.services.decision_waiters import parked_decision_count  # noqa: E402
+from nightledger_api.services.event_store import InMemoryAppendOnlyEventStore  # noqa: E402
+from nightledger_api.services.expiry_scheduler import ExpiryScheduler  # noqa: E402
+
+client = TestClient(app)
+
+
+def register(decision_id: str) -> None:
+    response = client.post(
+        "/v1/approvals/requests",
+        json={
+            "decision_id": decision_id,
+            "run_id": f"run_{decision_id}",
+            "requested_by": "agent",
+            "title": "Approval required",
+            "details": "Purchase amount exceeds threshold",
+            "risk_level": "high",
+        },
+    )
+    assert response.status_code == 200
+
+
+def resolve(decision_id: str) -> None:
+    response = client.post(
+        f"/v1/approvals/decisions/{decision_id}",
+        json={"decision": "approved", "approver_id": "human_reviewer"},
+    )
+    assert response.status_code == 200
+
+
+def wait_until_parked(count: int) -> None:
+    deadline = time.monotonic() + 5
+    while parked_decision_count() < count:
+        assert time.monotonic() < deadline, "request never parked"
+        time.sleep(0.01)
+
+
+def wait_in_background(decision_id: str) -> tuple[threading.Thread, list[Any]]:
+    responses: list[Any] = []
+    waiter = threading.Thread(
+        target=lambda: responses.append(
+            client.get(f"/v1/approvals/decisions/{decision_id}", params={"wait": 20})
+        )
+    )
+    waiter.start()
+    wait_until_parked(1)
+    return waiter, responses
+
+
+@pytest.fixture(autouse=True)
+def store() -> InMemoryAppendOnlyEventStore:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+    yield store
+    app.dependency_overrides.clear()
+
+
+def test_parked_request_wakes_on_resolution(store, monkeypatch) -> None:
+    register("dec_wait_1")
+    reads: list[int] = []
+    list_all = store.list_all
+
+    def _counted_list_all() -> Any:
+        reads.append(1)
+        return list_all()
+
+    monkeypatch.setattr(store, "list_all", _counted_list_all)
+    responses: list[Any] = []
+    waiter = threading.Thread(
+        target=lambda: responses.append(
+            client.get("/v1/approvals/decisions/dec_wait_1", params={"wait": 20})
+        )
+    )
+    started_at = time.monotonic()
+    waiter.start()
+    wait_until_parked(1)
+    reads_while_parked = len(reads)
+    resolve("dec_wait_1")
+    waiter.join(timeout=10)
+
+    assert not waiter.is_alive()
+    assert time.monotonic() - started_at < 10
+    assert responses[0].status_code == 200
+    assert responses[0].json()["status"] == "approved"
+    assert reads_while_parked == 1
+    assert parked_decision_count() == 0
+
+
+def test_wait_returns_resolved_state_immediately() -> None:
+    register("dec_wait_2")
+    resolve("dec_wait_2")
+
+    started_at = time.monotonic()
+    response = client.get("/v1/approvals/decisions/dec_wait_2", params={"wait": 20})
+
+    assert response.json()["status"] == "approved"
+    assert time.monotonic() - started_at < 5
+
+
+def test_wait_times_out_with_pending_state_and_honors_max_wait(monkeypatch) -> None:
+    register("dec_wait_3")
+    monkeypatch.setenv("NIGHTLEDGER_APPROVAL_MAX_WAIT_SECONDS", "0.05")
+
+    started_at = time.monotonic()
+    response = client.get("/v1/approvals/decisions/dec_wait_3", params={"wait": 60})
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+    assert time.monotonic() - started_at < 5
+    assert parked_decision_count() == 0
+
+
+def test_wait_rejects_negative_values_and_unknown_decisions() -> None:
+    negative = client.get("/v1/approvals/decisions/dec_wait_4", params={"wait": -1})
+    unknown = client.get("/v1/approvals/decisions/dec_wait_missing", params={"wait": 1})
+
+    assert negative.status_code == 422
+    assert unknown.status_code == 404
+    assert unknown.json()["error"]["code"] == "APPROVAL_NOT_FOUND"
+
+
+def test_parked_requests_hold_no_worker_threads(store) -> None:
+    register("dec_wait_5")
+
+    async def scenario() -> list[str]:
+        # One worker thread: waiters that held it would starve the resolution.
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=1))
+        waiters = [
+            asyncio.create_task(
+                wait_for_approval_decision_state(store=store, decision_id="dec_wait_5", timeout=20)
+            )
+            for _ in range(8)
+        ]
+        while parked_decision_count() < 8:
+            await asyncio.sleep(0.01)
+        await asyncio.to_thread(
+            resolve_pending_approval_by_decision_id,
+            store=store,
+            decision_id="dec_wait_5",
+            decision="approved",
+            approver_id="human_reviewer",
+            reason=None,
+        )
+        states = await asyncio.wait_for(asyncio.gather(*waiters), timeout=10)
+        return [state["status"] for state in states]
+
+    assert asyncio.run(scenario()) == ["approved"] * 8
+    assert parked_decision_count() == 0
+
+
+def test_resolution_ingested_through_events_endpoint_wakes_waiter() -> None:
+    register("dec_wait_6")
+    waiter, responses = wait_in_background("dec_wait_6")
+    resolved_at = (datetime.now(timezone.utc) + timedelta(seconds=1)).isoformat().replace("+00:00", "Z")
+
+    ingested = client.post(
+        "/v1/events",
+        json={
+            "id": "evt_dec_wait_6_resolved",
+            "run_id": "run_dec_wait_6",
+            "timestamp": resolved_at,
+            "type": "approval_resolved",
+            "actor": "human",
+            "title": "Approval approved",
+            "details": "Approved out of band",
+            "confidence": None,
+            "risk_level": "high",
+            "requires_approval": True,
+            "approval": {
+                "status": "approved",
+                "decision_id": "dec_wait_6",
+                "requested_by": "agent",
+                "resolved_by": "human_reviewer",
+                "resolved_at": resolved_at,
+                "reason": None,
+            },
+            "evidence": [],
+        },
+    )
+    waiter.join(timeout=10)
+
+    assert ingested.status_code == 201
+    assert not waiter.is_alive()
+    assert responses[0].json()["status"] == "approved"
+
+
+def test_expiry_wakes_waiter(store) -> None:
+    register("dec_wait_7")
+    scheduler = ExpiryScheduler(store, approval_ttl=timedelta(minutes=10), run_ttl=None)
+    scheduler.rebuild()
+    waiter, responses = wait_in_background("dec_wait_7")
+
+    expired = scheduler.run_due(datetime.now(timezone.utc) + timedelta(hours=1))
+    waiter.join(timeout=10)
+
+    assert [event.payload["meta"]["step"] for event in expired] == ["approval_expired"]
+    assert not waiter.is_alive()
+    assert responses[0].json()["resolved_event_id"] == expired[0].id
@@ -0,0 +1,141 @@
+from dataclasses import replace
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import sys
+from typing import Any
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.services.chain_verification import verify_run_chain  # noqa: E402
+from nightledger_api.services.errors import InconsistentRunStateError  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+    configured_event_hash_algorithm,
+    event_hash_algorithm,
+)
+from nightledger_api.tools import verify as verify_tool  # noqa: E402
+
+
+def _event(event_id: str, minute: int) -> Any:
+    return validate_event_payload(
+        {
+            "id": event_id,
+            "run_id": "run_hash",
+            "timestamp": f"2026-02-20T10:{minute:02d}:00Z",
+            "type": "action",
+            "actor": "agent",
+            "title": "Hashed step",
+            "details": "Hash algorithm test",
+            "confidence": 0.8,
+            "risk_level": "low",
+            "requires_approval": False,
+            "approval": {
+                "status": "not_required",
+                "requested_by": None,
+                "resolved_by": None,
+                "resolved_at": None,
+                "reason": None,
+            },
+            "evidence": [],
+            "meta": {"workflow": "wf_hash", "step": "work"},
+        }
+    )
+
+
+def test_configured_algorithm_defaults_to_sha256(monkeypatch) -> None:
+    monkeypatch.delenv("NIGHTLEDGER_EVENT_HASH_ALGORITHM", raising=False)
+    assert configured_event_hash_algorithm() == "sha256"
+    monkeypatch.setenv("NIGHTLEDGER_EVENT_HASH_ALGORITHM", " BLAKE2b ")
+    assert configured_event_hash_algorithm() == "blake2b"
+    monkeypatch.setenv("NIGHTLEDGER_EVENT_HASH_ALGORITHM", "md5")
+    assert configured_event_hash_algorithm() == "sha256"
+
+
+def test_algorithm_is_read_from_the_hash_prefix() -> None:
+    assert event_hash_algorithm("blake2b:00") == "blake2b"
+    assert event_hash_algorithm("sha256:00") == "sha256"
+    assert event_hash_algorithm("unknown:00") == "sha256"
+
+
+def test_blake2b_chain_verifies_and_detects_tampering() -> None:
+    store = InMemoryAppendOnlyEventStore(hash_algorithm="blake2b")
+    first = store.append(_event("evt_1", 0))
+    store.append(_event("evt_2", 1))
+
+    assert first.hash.startswith("blake2b:") and len(first.hash) == len("blake2b:") + 64
+    verify_run_chain(store=store, run_id="run_hash")
+
+    tampered = InMemoryAppendOnlyEventStore(hash_algorithm="blake2b")
+    tampered.append(_event("evt_1", 0))
+    records = tampered._run_records_index["run_hash"]
+    records[0] = replace(records[0], payload={**records[0].payload, "details": "forged"})
+    with pytest.raises(InconsistentRunStateError):
+        verify_run_chain(store=tampered, run_id="run_hash")
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "blake2b"])
+def test_hash_survives_payload_key_reordering(algorithm: str) -> None:
+    store = InMemoryAppendOnlyEventStore(hash_algorithm=algorithm)
+    store.append(_event("evt_1", 0))
+    store.append(_event("evt_2", 1))
+    records = store._run_records_index["run_hash"]
+
+    def _reversed_keys(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {key: _reversed_keys(value[key]) for key in reversed(list(value))}
+        return value
+
+    # As after a round trip through a serializer that normalizes key order.
+    records[:] = [replace(record, payload=_reversed_keys(record.payload)) for record in records]
+
+    verify_run_chain(store=store, run_id="run_hash")
+
+
+def test_run_mixing_algorithms_after_a_switch_still_verifies(tmp_path, capsys) -> None:
+    db_path = tmp_path / "events.db"
+    legacy = SQLiteAppendOnlyEventStore(path=str(db_path), hash_algorithm="sha256")
+    legacy.append(_event("evt_1", 0))
+    legacy.append(_event("evt_2", 1))
+    switched = SQLiteAppendOnlyEventStore(path=str(db_path), hash_algorithm="blake2b")
+    switched.append(_event("evt_3", 2))
+
+    hashes = [event.hash for event in switched.list_by_run_id("run_hash")]
+    assert [event_hash_algorithm(value) for value in hashes] == ["sha256", "sha256", "blake2b"]
+    verify_run_chain(store=switched, run_id="run_hash")
+    assert verify_tool.main(["--db", str(db_path), "--workers", "1"]) == 0
+    capsys.readouterr()
+
+
+@pytest.mark.parametrize("algorithm", ["sha256", "blake2b"])
+def test_sqlite_stores_exactly_the_bytes_it_hashed(tmp_path, algorithm: str) -> None:
+    db_path = tmp_path / "events.db"
+    store = SQLiteAppendOnlyEventStore(path=str(db_path), hash_algorithm=algorithm)
+    appended = store.append(_event("evt_1", 0))
+    with sqlite3.connect(db_path) as conn:
+        (payload_json,) = conn.execute("SELECT payload_json FROM events").fetchone()
+
+    payload = json.loads(payload_json)
+    compact = json.dumps(payload, separators=(",", ":"), sort_keys=True)
+    assert payload_json == compact
+    assert store.list_by_run_id("run_hash") == [appended]
+    if algorithm == "sha256":
+        # Unchanged from the original key-sorted wrapper encoding.
+        wrapper = json.dumps(
+            {
+                "run_id": "run_hash",
+                "event_id": "evt_1",
+                "timestamp": appended.timestamp.isoformat(),
+                "payload": payload,
+                "integrity_warning": False,
+                "prev_hash": None,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        assert appended.hash == f"sha256:{hashlib.sha256(wrapper.encode('utf-8')).hexdigest()}"
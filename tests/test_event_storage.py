@@ -88,7 +88,7 @@ def test_get_run_events_returns_deterministic_ascending_order() -> None:
     assert set(events[0].keys()) == {"id", "timestamp", "run_id", "payload", "integrity_warning"}
 
 
-class _FailingAppendStore:
+class _FailingAppendStore(InMemoryAppendOnlyEventStore):
     def append(self, event: object) -> object:
         _ = event
         raise StorageWriteError("storage backend append failed")
@@ -98,7 +98,7 @@ class _FailingAppendStore:
         return []
 
 
-class _FailingReadStore:
+class _FailingReadStore(InMemoryAppendOnlyEventStore):
     def append(self, event: object) -> object:
         _ = event
         return object()
@@ -0,0 +1,264 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+import threading
+import time
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import (  # noqa: E402
+    add_event_store_reset_listener,
+    get_event_store,
+    remove_event_store_reset_listener,
+)
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services.approval_service import resolve_pending_approval_by_decision_id  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+)
+from nightledger_api.services.expiry_scheduler import (  # noqa: E402
+    ExpiryScheduler,
+    configured_expiry_scheduler,
+)
+from nightledger_api.services.run_write_locks import locked_run_count, run_write_lock  # noqa: E402
+
+client = TestClient(app)
+T0 = datetime(2026, 3, 1, 9, 0, tzinfo=timezone.utc)
+
+
+def build_event_payload(
+    *,
+    event_id: str,
+    run_id: str,
+    timestamp: datetime,
+    event_type: str = "action",
+    approval_status: str = "not_required",
+) -> dict[str, Any]:
+    pending = approval_status == "pending"
+    return {
+        "id": event_id,
+        "run_id": run_id,
+        "timestamp": timestamp.isoformat().replace("+00:00", "Z"),
+        "type": event_type,
+        "actor": "agent",
+        "title": "Expiry scheduler event",
+        "details": "Event used by expiry scheduler tests",
+        "confidence": 0.8,
+        "risk_level": "high" if pending else "low",
+        "requires_approval": pending,
+        "approval": {
+            "status": approval_status,
+            "decision_id": f"dec_{run_id}" if pending else None,
+            "requested_by": "agent" if pending else None,
+            "resolved_by": None,
+            "resolved_at": None,
+            "reason": None,
+        },
+        "evidence": [],
+        "meta": {"workflow": "wf_expiry", "step": "work"},
+    }
+
+
+def append(store: Any, **kwargs: Any) -> None:
+    store.append(validate_event_payload(build_event_payload(**kwargs)))
+
+
+def request_approval(store: Any, *, run_id: str, timestamp: datetime) -> None:
+    append(
+        store,
+        event_id=f"evt_{run_id}_request",
+        run_id=run_id,
+        timestamp=timestamp,
+        event_type="approval_requested",
+        approval_status="pending",
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_dependencies() -> None:
+    app.dependency_overrides.clear()
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def started() -> Any:
+    schedulers: list[ExpiryScheduler] = []
+
+    def _start(store: Any, **ttls: timedelta | None) -> ExpiryScheduler:
+        # A frozen clock keeps the worker asleep; tests drive run_due directly.
+        scheduler = ExpiryScheduler(
+            store,
+            approval_ttl=ttls.get("approval_ttl"),
+            run_ttl=ttls.get("run_ttl"),
+            clock=lambda: T0 - timedelta(days=1),
+        )
+        scheduler.start()
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield _start
+    for scheduler in schedulers:
+        scheduler.stop()
+
+
+def test_pending_approval_expires_at_its_deadline(started) -> None:
+    store = InMemoryAppendOnlyEventStore()
+    scheduler = started(store, approval_ttl=timedelta(minutes=10))
+    request_approval(store, run_id="run_expiry_1", timestamp=T0)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    assert scheduler.next_deadline() == T0 + timedelta(minutes=10)
+    assert scheduler.run_due(T0 + timedelta(minutes=9)) == []
+    expired = scheduler.run_due(T0 + timedelta(minutes=10))
+
+    assert [event.payload["meta"]["step"] for event in expired] == ["approval_expired"]
+    assert expired[0].payload["approval"]["decision_id"] == "dec_run_expiry_1"
+    assert expired[0].payload["meta"]["workflow"] == "wf_expiry"
+    assert client.get("/v1/runs/run_expiry_1/status").json()["status"] == "expired"
+    assert client.get("/v1/approvals/pending").json()["pending_count"] == 0
+    assert scheduler.next_deadline() is None
+
+
+def test_resolved_approval_is_dropped_without_reading_the_store(started, monkeypatch) -> None:
+    store = InMemoryAppendOnlyEventStore()
+    scheduler = started(store, approval_ttl=timedelta(minutes=10))
+    request_approval(store, run_id="run_expiry_2", timestamp=T0)
+    app.dependency_overrides[get_event_store] = lambda: store
+    resolved = client.post(
+        "/v1/approvals/decisions/dec_run_expiry_2",
+        json={"decision": "approved", "approver_id": "human_reviewer"},
+    )
+    assert resolved.status_code == 200
+
+    def _no_reads(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("stale deadlines must not read the store")
+
+    monkeypatch.setattr(store, "list_by_run_id", _no_reads)
+    monkeypatch.setattr(store, "list_all", _no_reads)
+
+    assert scheduler.run_due(T0 + timedelta(hours=1)) == []
+
+
+def test_run_deadline_moves_with_activity(started) -> None:
+    store = InMemoryAppendOnlyEventStore()
+    scheduler = started(store, run_ttl=timedelta(minutes=30))
+    append(store, event_id="evt_run_expiry_1", run_id="run_expiry_3", timestamp=T0)
+    append(store, event_id="evt_run_expiry_2", run_id="run_expiry_3", timestamp=T0 + timedelta(minutes=20))
+    append(store, event_id="evt_run_done_1", run_id="run_expiry_done", timestamp=T0)
+    append(
+        store,
+        event_id="evt_run_done_2",
+        run_id="run_expiry_done",
+        timestamp=T0 + timedelta(minutes=1),
+        event_type="summary",
+    )
+
+    assert scheduler.run_due(T0 + timedelta(minutes=35)) == []
+    assert scheduler.next_deadline() == T0 + timedelta(minutes=50)
+    expired = scheduler.run_due(T0 + timedelta(minutes=50))
+
+    assert [(event.run_id, event.payload["meta"]["step"]) for event in expired] == [
+        ("run_expiry_3", "run_expired")
+    ]
+
+
+def test_sqlite_deadlines_are_rebuilt_from_indexes_after_restart(tmp_path, started) -> None:
+    db_path = str(tmp_path / "events.db")
+    seeded = SQLiteAppendOnlyEventStore(path=db_path)
+    request_approval(seeded, run_id="run_expiry_4", timestamp=T0)
+    append(seeded, event_id="evt_run_expiry_5", run_id="run_expiry_5", timestamp=T0)
+
+    store = SQLiteAppendOnlyEventStore(path=db_path)
+    scheduler = started(store, approval_ttl=timedelta(minutes=10), run_ttl=timedelta(hours=1))
+    expired = scheduler.run_due(T0 + timedelta(hours=2))
+
+    assert sorted((event.run_id, event.payload["meta"]["step"]) for event in expired) == [
+        ("run_expiry_4", "approval_expired"),
+        ("run_expiry_5", "run_expired"),
+    ]
+    assert [event.payload["meta"]["step"] for event in store.list_by_run_id("run_expiry_4")][-1] == (
+        "approval_expired"
+    )
+
+
+def test_scheduler_is_disabled_without_ttls(monkeypatch) -> None:
+    monkeypatch.delenv("NIGHTLEDGER_APPROVAL_TTL_SECONDS", raising=False)
+    monkeypatch.setenv("NIGHTLEDGER_RUN_TTL_SECONDS", "0")
+
+    assert configured_expiry_scheduler(InMemoryAppendOnlyEventStore()) is None
+
+    monkeypatch.setenv("NIGHTLEDGER_APPROVAL_TTL_SECONDS", "900")
+    assert configured_expiry_scheduler(InMemoryAppendOnlyEventStore()) is not None
+
+
+def test_rebound_scheduler_tracks_the_replacement_store_only(started) -> None:
+    replaced = InMemoryAppendOnlyEventStore()
+    scheduler = started(replaced, approval_ttl=timedelta(minutes=10))
+    store = InMemoryAppendOnlyEventStore()
+    scheduler.rebind(store)
+    request_approval(replaced, run_id="run_expiry_replaced", timestamp=T0)
+    request_approval(store, run_id="run_expiry_rebound", timestamp=T0 + timedelta(minutes=1))
+
+    expired = scheduler.run_due(T0 + timedelta(hours=1))
+
+    assert [event.run_id for event in expired] == ["run_expiry_rebound"]
+    assert [event.payload["type"] for event in replaced.list_by_run_id("run_expiry_replaced")] == [
+        "approval_requested"
+    ]
+
+
+def test_demo_reset_seed_rebinds_the_scheduler(started) -> None:
+    scheduler = started(InMemoryAppendOnlyEventStore(), approval_ttl=timedelta(minutes=10))
+    add_event_store_reset_listener(scheduler.rebind)
+    try:
+        response = client.post("/v1/demo/triage_inbox/reset-seed")
+    finally:
+        remove_event_store_reset_listener(scheduler.rebind)
+
+    # The seeded request's deadline is long past on the fixture clock, so the
+    # worker expires it in the replacement store.
+    seeded = get_event_store()
+    for _ in range(50):
+        if seeded.list_by_run_id("run_triage_inbox_demo_1")[-1].payload["meta"]["step"] == "approval_expired":
+            break
+        time.sleep(0.1)
+
+    assert response.status_code == 200
+    assert scheduler.next_deadline() is None
+    assert seeded.list_by_run_id("run_triage_inbox_demo_1")[-1].payload["meta"]["step"] == "approval_expired"
+
+
+def test_expiry_waits_for_an_approval_resolution_in_flight(started) -> None:
+    store = InMemoryAppendOnlyEventStore()
+    scheduler = started(store, approval_ttl=timedelta(minutes=10))
+    request_approval(store, run_id="run_expiry_race", timestamp=T0)
+    expired: list[Any] = []
+    worker = threading.Thread(target=lambda: expired.extend(scheduler.run_due(T0 + timedelta(hours=1))))
+
+    # The resolver holds the run's lock from its pending check to its append.
+    with run_write_lock("run_expiry_race"):
+        worker.start()
+        worker.join(timeout=0.2)
+        assert worker.is_alive()
+        resolve_pending_approval_by_decision_id(
+            store=store,
+            decision_id="dec_run_expiry_race",
+            decision="approved",
+            approver_id="human_reviewer",
+            reason=None,
+        )
+    worker.join(timeout=5)
+
+    assert expired == []
+    assert [event.payload["type"] for event in store.list_by_run_id("run_expiry_race")] == [
+        "approval_requested",
+        "approval_resolved",
+    ]
+    assert locked_run_count() == 0
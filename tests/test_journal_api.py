@@ -1,5 +1,6 @@
 from datetime import datetime
 from pathlib import Path
+import sqlite3
 import sys
 from typing import Any
 
@@ -11,7 +12,11 @@ sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
 from nightledger_api.main import app  # noqa: E402
 from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
-from nightledger_api.services.event_store import InMemoryAppendOnlyEventStore, StoredEvent  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+    StoredEvent,
+)
 
 client = TestClient(app)
 
@@ -127,6 +132,7 @@ def test_round1_get_run_journal_returns_projection_for_known_run() -> None:
                 ],
             }
         ],
+        "run_status": {"status": "running", "pending_approval": None},
     }
 
 
@@ -142,7 +148,7 @@ def test_round2_get_run_journal_returns_not_found_for_unknown_run() -> None:
     assert body["error"]["details"][0]["path"] == "run_id"
 
 
-class _FailingJournalReadStore:
+class _FailingJournalReadStore(InMemoryAppendOnlyEventStore):
     def append(self, event: Any) -> Any:
         _ = event
         raise RuntimeError("append should not be called")
@@ -163,7 +169,7 @@ def test_round3_get_run_journal_surfaces_storage_read_error() -> None:
     assert body["error"]["details"][0]["code"] == "STORAGE_READ_FAILED"
 
 
-class _InvalidTimestampJournalStore:
+class _InvalidTimestampJournalStore(InMemoryAppendOnlyEventStore):
     def append(self, event: Any) -> Any:
         _ = event
         raise RuntimeError("append should not be called")
@@ -205,7 +211,7 @@ def test_round4_get_run_journal_surfaces_inconsistent_state_for_invalid_timestam
     assert body["error"]["details"][0]["code"] == "INVALID_EVENT_TIMESTAMP"
 
 
-class _InvalidPayloadJournalStore:
+class _InvalidPayloadJournalStore(InMemoryAppendOnlyEventStore):
     def append(self, event: Any) -> Any:
         _ = event
         raise RuntimeError("append should not be called")
@@ -234,7 +240,7 @@ def test_round5_get_run_journal_surfaces_inconsistent_state_for_invalid_payload(
     assert body["error"]["details"][0]["code"] == "INVALID_EVENT_PAYLOAD"
 
 
-class _MissingReadableFieldsJournalStore:
+class _MissingReadableFieldsJournalStore(InMemoryAppendOnlyEventStore):
     def append(self, event: Any) -> Any:
         _ = event
         raise RuntimeError("append should not be called")
@@ -276,7 +282,7 @@ def test_issue15_round3_get_run_journal_fails_loud_on_missing_readability_fields
     assert body["error"]["details"][0]["code"] == "MISSING_TIMELINE_FIELDS"
 
 
-class _TraceabilityMismatchJournalStore:
+class _TraceabilityMismatchJournalStore(InMemoryAppendOnlyEventStore):
     def append(self, event: Any) -> Any:
         _ = event
         raise RuntimeError("append should not be called")
@@ -318,7 +324,7 @@ def test_issue15_round4_get_run_journal_fails_loud_on_traceability_identity_mism
     assert body["error"]["details"][0]["code"] == "TRACEABILITY_LINK_BROKEN"
 
 
-class _RiskyActionWithoutEvidenceJournalStore:
+class _RiskyActionWithoutEvidenceJournalStore(InMemoryAppendOnlyEventStore):
     def append(self, event: Any) -> Any:
         _ = event
         raise RuntimeError("append should not be called")
@@ -525,3 +531,259 @@ def test_issue34_round5_get_run_journal_inconsistency_uses_full_error_envelope()
             ],
         }
     }
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_get_run_journal_pages_with_stable_entry_ids(tmp_path, backend: str) -> None:
+    store = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    app.dependency_overrides[get_event_store] = lambda: store
+    for index in range(1, 6):
+        append_direct(
+            store,
+            build_event_payload(
+                event_id=f"evt_page_{index}",
+                run_id="run_journal_pages",
+                timestamp=f"2026-02-24T10:00:0{index}Z",
+            ),
+        )
+    full = client.get("/v1/runs/run_journal_pages/journal").json()
+
+    first = client.get("/v1/runs/run_journal_pages/journal", params={"limit": 2}).json()
+    second = client.get(
+        "/v1/runs/run_journal_pages/journal",
+        params={"limit": 2, "cursor": first["next_cursor"]},
+    ).json()
+    third = client.get(
+        "/v1/runs/run_journal_pages/journal",
+        params={"limit": 2, "cursor": second["next_cursor"]},
+    ).json()
+
+    assert [entry["entry_id"] for entry in first["entries"]] == [
+        "jrnl_run_journal_pages_0001",
+        "jrnl_run_journal_pages_0002",
+    ]
+    assert [entry["entry_id"] for entry in third["entries"]] == ["jrnl_run_journal_pages_0005"]
+    assert third["next_cursor"] is None
+    assert first["entries"] + second["entries"] + third["entries"] == full["entries"]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_get_run_journal_cursor_survives_out_of_order_appends(tmp_path, backend: str) -> None:
+    store = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    app.dependency_overrides[get_event_store] = lambda: store
+    run_id = f"run_journal_keyset_{backend}"
+    for second in (1, 3, 5, 7, 9):
+        append_direct(
+            store,
+            build_event_payload(
+                event_id=f"evt_keyset_{backend}_{second}",
+                run_id=run_id,
+                timestamp=f"2026-02-24T10:00:0{second}Z",
+            ),
+        )
+
+    first = client.get(f"/v1/runs/{run_id}/journal", params={"limit": 2}).json()
+    for second in (2, 6):
+        append_direct(
+            store,
+            build_event_payload(
+                event_id=f"evt_keyset_{backend}_{second}",
+                run_id=run_id,
+                timestamp=f"2026-02-24T10:00:0{second}Z",
+            ),
+        )
+    second_page = client.get(
+        f"/v1/runs/{run_id}/journal", params={"limit": 2, "cursor": first["next_cursor"]}
+    ).json()
+    third_page = client.get(
+        f"/v1/runs/{run_id}/journal", params={"limit": 2, "cursor": second_page["next_cursor"]}
+    ).json()
+
+    def served(page: dict[str, Any]) -> list[str]:
+        return [entry["event_id"] for entry in page["entries"]]
+
+    assert served(first) == [f"evt_keyset_{backend}_1", f"evt_keyset_{backend}_3"]
+    assert served(second_page) == [f"evt_keyset_{backend}_5", f"evt_keyset_{backend}_6"]
+    assert [entry["entry_id"] for entry in second_page["entries"]] == [
+        f"jrnl_{run_id}_0004",
+        f"jrnl_{run_id}_0005",
+    ]
+    assert second_page["resync_required"] is True
+    assert served(third_page) == [f"evt_keyset_{backend}_7", f"evt_keyset_{backend}_9"]
+    assert third_page["resync_required"] is False
+    assert third_page["next_cursor"] is None
+
+
+def test_get_run_journal_page_keeps_whole_run_consistency_guard() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+    append_direct(
+        store,
+        build_event_payload(event_id="evt_guard_1", run_id="run_journal_guard", timestamp="2026-02-24T10:00:00Z"),
+    )
+    append_direct(
+        store,
+        build_event_payload(
+            event_id="evt_guard_2",
+            run_id="run_journal_guard",
+            timestamp="2026-02-24T10:00:01Z",
+            event_type="approval_resolved",
+            approval_status="approved",
+            resolved_by="human_1",
+            resolved_at="2026-02-24T10:00:01Z",
+        ),
+    )
+
+    response = client.get("/v1/runs/run_journal_guard/journal", params={"limit": 1})
+
+    assert response.status_code == 409
+    assert response.json()["error"]["details"][0]["code"] == "NO_PENDING_APPROVAL"
+
+
+def test_get_run_journal_rejects_invalid_cursor() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    response = client.get("/v1/runs/run_any/journal", params={"cursor": "%%%"})
+
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "INVALID_QUERY_PARAMETER"
+
+
+def test_get_run_journal_since_entry_returns_only_newer_entries_with_status() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+    for index in range(1, 3):
+        append_direct(
+            store,
+            build_event_payload(
+                event_id=f"evt_delta_{index}",
+                run_id="run_journal_delta",
+                timestamp=f"2026-02-24T11:00:0{index}Z",
+            ),
+        )
+    latest = client.get("/v1/runs/run_journal_delta/journal").json()["entries"][-1]["entry_id"]
+
+    unchanged = client.get("/v1/runs/run_journal_delta/journal", params={"since_entry": latest}).json()
+    append_direct(
+        store,
+        build_event_payload(
+            event_id="evt_delta_3",
+            run_id="run_journal_delta",
+            timestamp="2026-02-24T11:00:03Z",
+            event_type="approval_requested",
+            requires_approval=True,
+            approval_status="pending",
+            requested_by="agent",
+            evidence=[{"kind": "log", "label": "request", "ref": "log://delta"}],
+        ),
+    )
+    delta = client.get("/v1/runs/run_journal_delta/journal", params={"since_entry": latest}).json()
+    polled = client.get("/v1/runs/run_journal_delta/journal", params={"cursor": delta["next_cursor"]}).json()
+
+    assert unchanged["entries"] == []
+    assert unchanged["run_status"] == {"status": "running", "pending_approval": None}
+    assert [entry["entry_id"] for entry in delta["entries"]] == ["jrnl_run_journal_delta_0003"]
+    assert delta["run_status"]["status"] == "paused"
+    assert delta["run_status"]["pending_approval"]["event_id"] == "evt_delta_3"
+    assert delta["has_more"] is False
+    assert polled["entries"] == []
+    assert polled["has_more"] is False
+    assert polled["next_cursor"] is not None
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_get_run_journal_delta_cursor_flags_appends_before_it(tmp_path, backend: str) -> None:
+    store = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    app.dependency_overrides[get_event_store] = lambda: store
+    run_id = f"run_journal_delta_keyset_{backend}"
+
+    def append_at(name: str, second: int) -> None:
+        append_direct(
+            store,
+            build_event_payload(
+                event_id=f"evt_{name}_{backend}",
+                run_id=run_id,
+                timestamp=f"2026-02-24T11:00:0{second}Z",
+            ),
+        )
+
+    append_at("e1", 1)
+    append_at("e2", 3)
+    seeded = client.get(f"/v1/runs/{run_id}/journal", params={"since_entry": f"jrnl_{run_id}_0002"}).json()
+    append_at("e3", 2)
+    append_at("e4", 4)
+    polled = client.get(f"/v1/runs/{run_id}/journal", params={"cursor": seeded["next_cursor"]}).json()
+
+    assert seeded["entries"] == []
+    assert [entry["event_id"] for entry in polled["entries"]] == [f"evt_e4_{backend}"]
+    assert [entry["entry_id"] for entry in polled["entries"]] == [f"jrnl_{run_id}_0004"]
+    assert polled["resync_required"] is True
+    assert polled["has_more"] is False
+
+
+def test_get_run_journal_since_entry_rejects_positions_past_the_journal() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+    for index in range(1, 3):
+        append_direct(
+            store,
+            build_event_payload(
+                event_id=f"evt_delta_range_{index}",
+                run_id="run_journal_delta_range",
+                timestamp=f"2026-02-24T11:00:0{index}Z",
+            ),
+        )
+
+    response = client.get(
+        "/v1/runs/run_journal_delta_range/journal", params={"since_entry": "jrnl_run_journal_delta_range_0099"}
+    )
+
+    assert response.status_code == 422
+    assert response.json()["error"]["details"][0]["code"] == "INVALID_ENTRY_ID"
+
+
+def test_get_run_journal_since_entry_rejects_foreign_entry_ids() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    response = client.get(
+        "/v1/runs/run_journal_delta/journal", params={"since_entry": "jrnl_other_run_0001"}
+    )
+
+    assert response.status_code == 422
+    assert response.json()["error"]["details"][0]["code"] == "INVALID_ENTRY_ID"
+
+
+def test_get_run_journal_full_verification_rechecks_stored_events(tmp_path) -> None:
+    db_path = tmp_path / "events.db"
+    store = SQLiteAppendOnlyEventStore(path=str(db_path))
+    app.dependency_overrides[get_event_store] = lambda: store
+    append_direct(
+        store,
+        build_event_payload(event_id="evt_verify_1", run_id="run_journal_verify", timestamp="2026-02-24T12:00:00Z"),
+    )
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "UPDATE events SET payload_json = json_set(payload_json, '$.title', '') WHERE event_id = ?",
+            ("evt_verify_1",),
+        )
+
+    trusted = client.get("/v1/runs/run_journal_verify/journal")
+    audited = client.get("/v1/runs/run_journal_verify/journal", params={"verify": "full"})
+
+    assert trusted.status_code == 200
+    assert audited.status_code == 409
+    assert audited.json()["error"]["details"][0]["code"] == "MISSING_TIMELINE_FIELDS"
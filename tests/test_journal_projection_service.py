@@ -1,3 +1,4 @@
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 import sys
@@ -227,3 +228,19 @@ def test_round5_project_run_journal_fails_loud_on_unordered_input() -> None:
 
     assert exc_info.value.detail_path == "timestamp"
     assert exc_info.value.detail_code == "UNORDERED_EVENT_STREAM"
+
+
+def test_trusted_projection_skips_write_time_checks_only_for_validated_events() -> None:
+    event = _stored_event(event_id="evt_trusted_1", run_id="run_journal_trusted", timestamp="2026-02-17T13:00:00Z")
+    tampered = replace(event, payload={**event.payload, "id": "evt_other"}, validated=True)
+
+    trusted = project_run_journal(run_id="run_journal_trusted", events=[tampered])
+    assert trusted.entries[0].event_id == "evt_trusted_1"
+
+    with pytest.raises(InconsistentRunStateError) as full_exc:
+        project_run_journal(run_id="run_journal_trusted", events=[tampered], verification="full")
+    assert full_exc.value.detail_code == "TRACEABILITY_LINK_BROKEN"
+
+    with pytest.raises(InconsistentRunStateError) as unvalidated_exc:
+        project_run_journal(run_id="run_journal_trusted", events=[replace(tampered, validated=False)])
+    assert unvalidated_exc.value.detail_code == "TRACEABILITY_LINK_BROKEN"
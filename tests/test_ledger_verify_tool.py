@@ -0,0 +1,102 @@
+import json
+from pathlib import Path
+import sqlite3
+import sys
+from typing import Any
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import SQLiteAppendOnlyEventStore  # noqa: E402
+from nightledger_api.tools import verify as verify_tool  # noqa: E402
+
+
+def build_payload(*, event_id: str, run_id: str, minute: int) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "run_id": run_id,
+        "timestamp": f"2026-02-20T10:{minute:02d}:00Z",
+        "type": "action",
+        "actor": "agent",
+        "title": "Verified step",
+        "details": "Ledger verification test",
+        "confidence": 0.9,
+        "risk_level": "low",
+        "requires_approval": False,
+        "approval": {
+            "status": "not_required",
+            "requested_by": None,
+            "resolved_by": None,
+            "resolved_at": None,
+            "reason": None,
+        },
+        "evidence": [],
+    }
+
+
+def seed_ledger(db_path: Path) -> None:
+    store = SQLiteAppendOnlyEventStore(path=str(db_path))
+    for run_index in range(4):
+        run_id = f"run_{run_index}"
+        # The last event is out of order, so chains must be walked by sequence.
+        for event_index, minute in enumerate([0, 5, 10, 2]):
+            store.append(
+                validate_event_payload(
+                    build_payload(event_id=f"evt_{event_index}", run_id=run_id, minute=minute)
+                )
+            )
+
+
+def run_verify(argv: list[str], capsys) -> tuple[int, dict[str, Any]]:
+    exit_code = verify_tool.main(argv)
+    report = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    return exit_code, report
+
+
+def test_verify_reports_intact_ledger_with_throughput(tmp_path, capsys) -> None:
+    db_path = tmp_path / "events.db"
+    seed_ledger(db_path)
+
+    exit_code, report = run_verify(["--db", str(db_path), "--workers", "1"], capsys)
+
+    assert exit_code == 0
+    assert report["run_count"] == 4
+    assert report["events_verified"] == 16
+    assert report["broken_runs"] == []
+    assert report["events_per_second"] is None or report["events_per_second"] > 0
+
+
+def test_verify_reports_first_bad_sequence_across_worker_pool(tmp_path, capsys) -> None:
+    db_path = tmp_path / "events.db"
+    seed_ledger(db_path)
+    with sqlite3.connect(db_path) as conn:
+        (sequence,) = conn.execute(
+            "SELECT sequence FROM events WHERE run_id = 'run_2' AND event_id = 'evt_1'"
+        ).fetchone()
+        conn.execute(
+            "UPDATE events SET payload_json = replace(payload_json, 'Ledger', 'Forged') WHERE sequence = ?",
+            (sequence,),
+        )
+
+    exit_code, report = run_verify(
+        ["--db", str(db_path), "--workers", "2", "--events-per-task", "4"],
+        capsys,
+    )
+
+    assert exit_code == 1
+    assert report["workers"] == 2
+    assert report["events_verified"] == 13
+    assert report["broken_runs"] == [
+        {"run_id": "run_2", "sequence": sequence, "event_id": "evt_1", "code": "HASH_CHAIN_BROKEN"}
+    ]
+
+
+def test_verify_opens_the_store_read_only(tmp_path) -> None:
+    db_path = tmp_path / "events.db"
+    seed_ledger(db_path)
+
+    with verify_tool._connect_read_only(str(db_path)) as conn:
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            conn.execute("DELETE FROM events")
@@ -0,0 +1,202 @@
+from dataclasses import replace
+from pathlib import Path
+import sqlite3
+import sys
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+)
+from nightledger_api.services import merkle_tree  # noqa: E402
+from nightledger_api.services.merkle_tree import (  # noqa: E402
+    MerkleSnapshot,
+    build_frontier,
+    inclusion_proof,
+    verify_inclusion,
+)
+
+client = TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def reset_dependencies() -> None:
+    app.dependency_overrides.clear()
+    yield
+    app.dependency_overrides.clear()
+
+
+def _event(event_id: str, minute: int, *, decision_id: str | None = None) -> Any:
+    return validate_event_payload(
+        {
+            "id": event_id,
+            "run_id": "run_merkle",
+            "timestamp": f"2026-02-20T10:{minute:02d}:00Z",
+            "type": "approval_requested" if decision_id else "action",
+            "actor": "agent",
+            "title": "Merkle proof event",
+            "details": f"Event {event_id}",
+            "confidence": 0.8,
+            "risk_level": "high" if decision_id else "low",
+            "requires_approval": decision_id is not None,
+            "approval": {
+                "status": "pending" if decision_id else "not_required",
+                "decision_id": decision_id,
+                "requested_by": "agent" if decision_id else None,
+                "resolved_by": None,
+                "resolved_at": None,
+                "reason": None,
+            },
+            "evidence": [],
+        }
+    )
+
+
+def _fill(store: Any) -> None:
+    for minute in range(6):
+        store.append(_event(f"evt_{minute}", minute))
+    store.append(_event("evt_request", 30, decision_id="dec_merkle"))
+    # Lands mid-timeline, so its leaf index differs from its timeline position.
+    store.append(_event("evt_late", 10))
+
+
+def test_every_leaf_proves_against_the_incremental_root() -> None:
+    for size in range(1, 40):
+        event_hashes = [f"sha256:{index:064x}" for index in range(size)]
+        tree = build_frontier(run_id="run", event_hashes=event_hashes)
+
+        assert tree is not None and tree.size == size
+        assert len(tree.frontier) == bin(size).count("1")
+        snapshot = MerkleSnapshot(event_hashes)
+        assert snapshot.root == tree.root
+        for index, event_hash in enumerate(event_hashes):
+            audit_path = snapshot.inclusion_proof(index)
+            assert audit_path == inclusion_proof(event_hashes, index)
+            assert len(audit_path) <= (size - 1).bit_length()
+            assert verify_inclusion(
+                event_hash=event_hash, index=index, tree_size=size, audit_path=audit_path, root=tree.root
+            )
+            assert not verify_inclusion(
+                event_hash="sha256:tampered", index=index, tree_size=size, audit_path=audit_path, root=tree.root
+            )
+
+
+def test_audit_export_returns_inclusion_proofs_against_stored_root() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    _fill(store)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    plain = client.get("/v1/approvals/decisions/dec_merkle/audit-export")
+    proved = client.get("/v1/approvals/decisions/dec_merkle/audit-export", params={"proofs": "true"})
+
+    assert plain.status_code == 200
+    assert proved.status_code == 200
+    head = store.merkle_head("run_merkle")
+    assert plain.json()["merkle"] == {"tree_size": 8, "root": head.root}
+    assert "inclusion_proof" not in plain.json()["events"][0]
+    body = proved.json()
+    assert body["merkle"] == plain.json()["merkle"]
+    [event] = body["events"]
+    assert event["inclusion_proof"]["leaf_index"] == 6
+    assert verify_inclusion(
+        event_hash=event["hash"],
+        index=event["inclusion_proof"]["leaf_index"],
+        tree_size=body["merkle"]["tree_size"],
+        audit_path=event["inclusion_proof"]["audit_path"],
+        root=body["merkle"]["root"],
+    )
+
+
+def test_audit_export_hashes_each_leaf_once_across_receipts(monkeypatch) -> None:
+    store = InMemoryAppendOnlyEventStore()
+    _fill(store)
+    store.append(_event("evt_request_again", 40, decision_id="dec_merkle"))
+    app.dependency_overrides[get_event_store] = lambda: store
+    hashed: list[str] = []
+    counted_leaf_hash = merkle_tree.leaf_hash
+
+    def _counting_leaf_hash(event_hash: str) -> str:
+        hashed.append(event_hash)
+        return counted_leaf_hash(event_hash)
+
+    monkeypatch.setattr(merkle_tree, "leaf_hash", _counting_leaf_hash)
+    response = client.get("/v1/approvals/decisions/dec_merkle/audit-export", params={"proofs": "true"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [event["inclusion_proof"]["leaf_index"] for event in body["events"]] == [6, 8]
+    assert len(hashed) == 9
+    for event in body["events"]:
+        assert verify_inclusion(
+            event_hash=event["hash"],
+            index=event["inclusion_proof"]["leaf_index"],
+            tree_size=body["merkle"]["tree_size"],
+            audit_path=event["inclusion_proof"]["audit_path"],
+            root=body["merkle"]["root"],
+        )
+
+
+def test_audit_export_proofs_reject_a_stored_root_that_disagrees_with_the_chain() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    _fill(store)
+    head = store.merkle_head("run_merkle")
+    store._merkle_by_run["run_merkle"] = replace(head, root=f"sha256:{'0' * 64}")
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    response = client.get("/v1/approvals/decisions/dec_merkle/audit-export", params={"proofs": "true"})
+
+    assert response.status_code == 409
+    assert response.json()["error"]["details"][0]["code"] == "MERKLE_ROOT_MISMATCH"
+
+
+def test_audit_export_proofs_stay_on_the_head_read_while_the_run_grows() -> None:
+    base = InMemoryAppendOnlyEventStore()
+    _fill(base)
+
+    class _GrowingStore:
+        def __getattr__(self, name: str) -> Any:
+            return getattr(base, name)
+
+        def merkle_head(self, run_id: str) -> Any:
+            head = base.merkle_head(run_id)
+            base.append(_event("evt_racing", 50))
+            return head
+
+    app.dependency_overrides[get_event_store] = lambda: _GrowingStore()
+
+    response = client.get("/v1/approvals/decisions/dec_merkle/audit-export", params={"proofs": "true"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["merkle"]["tree_size"] == 8
+    [event] = body["events"]
+    assert verify_inclusion(
+        event_hash=event["hash"],
+        index=event["inclusion_proof"]["leaf_index"],
+        tree_size=8,
+        audit_path=event["inclusion_proof"]["audit_path"],
+        root=body["merkle"]["root"],
+    )
+
+
+def test_sqlite_merkle_head_matches_memory_and_is_backfilled(tmp_path) -> None:
+    path = str(tmp_path / "events.db")
+    memory_store = InMemoryAppendOnlyEventStore()
+    sqlite_store = SQLiteAppendOnlyEventStore(path=path)
+    _fill(memory_store)
+    _fill(sqlite_store)
+
+    head = sqlite_store.merkle_head("run_merkle")
+    assert (head.size, head.root) == (8, memory_store.merkle_head("run_merkle").root)
+
+    with sqlite3.connect(path) as conn:
+        conn.execute("DELETE FROM run_merkle")
+    assert SQLiteAppendOnlyEventStore(path=path).merkle_head("run_merkle") == head
@@ -0,0 +1,252 @@
+from pathlib import Path
+import sqlite3
+import sys
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+    StoredEvent,
+)
+
+client = TestClient(app)
+
+
+def build_pending_payload(
+    *,
+    event_id: str,
+    run_id: str,
+    timestamp: str,
+    risk_level: str = "high",
+    requested_by: str = "agent",
+) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "run_id": run_id,
+        "timestamp": timestamp,
+        "type": "approval_requested",
+        "actor": "agent",
+        "title": f"Approval for {run_id}",
+        "details": "Pending approval used by inbox index tests",
+        "confidence": 0.8,
+        "risk_level": risk_level,
+        "requires_approval": True,
+        "approval": {
+            "status": "pending",
+            "requested_by": requested_by,
+            "resolved_by": None,
+            "resolved_at": None,
+            "reason": "Needs a human",
+        },
+        "evidence": [],
+    }
+
+
+def build_store(backend: str, tmp_path: Path) -> Any:
+    if backend == "memory":
+        return InMemoryAppendOnlyEventStore()
+    return SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+
+
+def seed_inbox(store: Any) -> None:
+    rows = [
+        ("evt_inbox_1", "run_inbox_1", "2026-02-27T09:00:00Z", "high", "agent"),
+        ("evt_inbox_2", "run_inbox_2", "2026-02-27T09:01:00Z", "low", "agent"),
+        ("evt_inbox_3", "run_inbox_3", "2026-02-27T09:02:00Z", "high", "planner"),
+        ("evt_inbox_4", "run_inbox_4", "2026-02-27T09:03:00Z", "high", "agent"),
+    ]
+    for event_id, run_id, timestamp, risk_level, requested_by in rows:
+        store.append(
+            validate_event_payload(
+                build_pending_payload(
+                    event_id=event_id,
+                    run_id=run_id,
+                    timestamp=timestamp,
+                    risk_level=risk_level,
+                    requested_by=requested_by,
+                )
+            )
+        )
+
+
+class _IndexOnlyStore:
+    def __init__(self, base: Any) -> None:
+        self._base = base
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._base, name)
+
+    def list_by_run_id(self, run_id: str) -> list[StoredEvent]:
+        raise AssertionError("the pending inbox must not read run events")
+
+    def list_all(self) -> list[StoredEvent]:
+        raise AssertionError("the pending inbox must not scan history")
+
+    def list_runs(self, query: Any) -> Any:
+        return self._base.list_runs(query)
+
+    def list_pending_approvals(self, query: Any) -> Any:
+        return self._base.list_pending_approvals(query)
+
+    def count_pending_approvals(self, query: Any) -> int:
+        return self._base.count_pending_approvals(query)
+
+
+@pytest.fixture(autouse=True)
+def reset_dependencies() -> None:
+    app.dependency_overrides.clear()
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_pending_index_tracks_requests_and_resolutions(tmp_path, backend: str) -> None:
+    store = build_store(backend, tmp_path)
+    app.dependency_overrides[get_event_store] = lambda: store
+    seed_inbox(store)
+
+    resolved = client.post(
+        "/v1/approvals/evt_inbox_2",
+        json={"decision": "approved", "approver_id": "human_approver"},
+    )
+    assert resolved.status_code == 200
+
+    app.dependency_overrides[get_event_store] = lambda: _IndexOnlyStore(store)
+    response = client.get("/v1/approvals/pending")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [approval["event_id"] for approval in body["approvals"]] == [
+        "evt_inbox_1",
+        "evt_inbox_3",
+        "evt_inbox_4",
+    ]
+    assert body["approvals"][0] == {
+        "event_id": "evt_inbox_1",
+        "decision_id": None,
+        "run_id": "run_inbox_1",
+        "requested_at": "2026-02-27T09:00:00Z",
+        "requested_by": "agent",
+        "title": "Approval for run_inbox_1",
+        "details": "Pending approval used by inbox index tests",
+        "reason": "Needs a human",
+        "risk_level": "high",
+    }
+    assert body["next_cursor"] is None
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_pending_inbox_filters_and_paginates(tmp_path, backend: str) -> None:
+    store = build_store(backend, tmp_path)
+    app.dependency_overrides[get_event_store] = lambda: store
+    seed_inbox(store)
+
+    first = client.get("/v1/approvals/pending", params={"risk_level": "high", "limit": 2}).json()
+    second = client.get(
+        "/v1/approvals/pending",
+        params={"risk_level": "high", "limit": 2, "cursor": first["next_cursor"]},
+    ).json()
+    by_requester = client.get("/v1/approvals/pending", params={"requested_by": "planner"}).json()
+    by_run = client.get("/v1/approvals/pending", params={"run_id": "run_inbox_2"}).json()
+
+    assert [approval["event_id"] for approval in first["approvals"]] == ["evt_inbox_1", "evt_inbox_3"]
+    assert (first["pending_count"], first["page_count"]) == (3, 2)
+    assert [approval["event_id"] for approval in second["approvals"]] == ["evt_inbox_4"]
+    assert (second["pending_count"], second["page_count"]) == (3, 1)
+    assert second["next_cursor"] is None
+    assert [approval["event_id"] for approval in by_requester["approvals"]] == ["evt_inbox_3"]
+    assert [approval["event_id"] for approval in by_run["approvals"]] == ["evt_inbox_2"]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_pending_inbox_is_unpaginated_without_limit_or_cursor(tmp_path, backend: str) -> None:
+    store = build_store(backend, tmp_path)
+    app.dependency_overrides[get_event_store] = lambda: store
+    for index in range(105):
+        store.append(
+            validate_event_payload(
+                build_pending_payload(
+                    event_id=f"evt_bulk_{index:03d}",
+                    run_id=f"run_bulk_{index:03d}",
+                    timestamp=f"2026-02-27T09:{index // 60:02d}:{index % 60:02d}Z",
+                )
+            )
+        )
+
+    everything = client.get("/v1/approvals/pending").json()
+    first_page = client.get("/v1/approvals/pending", params={"limit": 100}).json()
+    second_page = client.get("/v1/approvals/pending", params={"cursor": first_page["next_cursor"]}).json()
+
+    assert (everything["pending_count"], everything["page_count"]) == (105, 105)
+    assert everything["next_cursor"] is None
+    assert (first_page["pending_count"], first_page["page_count"]) == (105, 100)
+    assert (second_page["pending_count"], second_page["page_count"]) == (105, 5)
+    assert second_page["next_cursor"] is None
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_pending_inbox_after_out_of_order_appends(tmp_path, backend: str) -> None:
+    store = build_store(backend, tmp_path)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    def _action(event_id: str, run_id: str, timestamp: str, event_type: str = "action") -> None:
+        payload = build_pending_payload(event_id=event_id, run_id=run_id, timestamp=timestamp)
+        payload.update(
+            type=event_type,
+            risk_level="low",
+            requires_approval=False,
+            approval={"status": "not_required"},
+        )
+        store.append(validate_event_payload(payload))
+
+    # The third event of each run sorts after the row before it but still
+    # lands before the run's newest event.
+    _action("evt_done_summary", "run_done", "2026-02-27T09:10:00Z", event_type="summary")
+    _action("evt_done_early", "run_done", "2026-02-27T09:01:00Z")
+    _action("evt_done_middle", "run_done", "2026-02-27T09:05:00Z")
+    _action("evt_wait_late", "run_wait", "2026-02-27T09:10:00Z")
+    _action("evt_wait_early", "run_wait", "2026-02-27T09:01:00Z")
+    store.append(
+        validate_event_payload(
+            build_pending_payload(
+                event_id="evt_wait_request", run_id="run_wait", timestamp="2026-02-27T09:05:00Z"
+            )
+        )
+    )
+
+    response = client.get("/v1/approvals/pending")
+    status = client.get("/v1/runs/run_wait/status").json()
+
+    assert response.status_code == 200
+    assert [approval["event_id"] for approval in response.json()["approvals"]] == ["evt_wait_request"]
+    assert status["pending_approval"]["event_id"] == "evt_wait_request"
+
+
+def test_sqlite_pending_index_is_backfilled_for_existing_databases(tmp_path) -> None:
+    db_path = tmp_path / "events.db"
+    seed_inbox(SQLiteAppendOnlyEventStore(path=str(db_path)))
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE pending_approvals")
+
+    store = SQLiteAppendOnlyEventStore(path=str(db_path))
+    app.dependency_overrides[get_event_store] = lambda: store
+    response = client.get("/v1/approvals/pending")
+
+    assert response.json()["pending_count"] == 4
+
+
+def test_pending_inbox_rejects_invalid_cursor() -> None:
+    app.dependency_overrides[get_event_store] = lambda: InMemoryAppendOnlyEventStore()
+
+    response = client.get("/v1/approvals/pending", params={"cursor": "bogus"})
+
+    assert response.status_code == 422
+    assert response.json()["error"]["details"][0]["code"] == "INVALID_CURSOR"
@@ -0,0 +1,242 @@
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.errors import InconsistentRunStateError  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+    StoredEvent,
+)
+from nightledger_api.services.run_status_service import project_run_status  # noqa: E402
+
+client = TestClient(app)
+
+
+def build_event_payload(
+    *,
+    event_id: str,
+    run_id: str,
+    timestamp: str,
+    event_type: str = "action",
+    requires_approval: bool = False,
+    approval_status: str = "not_required",
+) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "run_id": run_id,
+        "timestamp": timestamp,
+        "type": event_type,
+        "actor": "agent",
+        "title": "Point-in-time event",
+        "details": "Event used by point-in-time read tests",
+        "confidence": 0.8,
+        "risk_level": "low",
+        "requires_approval": requires_approval,
+        "approval": {
+            "status": approval_status,
+            "requested_by": "agent" if approval_status == "pending" else None,
+            "resolved_by": "human_1" if approval_status in {"approved", "rejected"} else None,
+            "resolved_at": timestamp if approval_status in {"approved", "rejected"} else None,
+            "reason": None,
+        },
+        "evidence": [],
+    }
+
+
+def seed_approval_run(store: Any, run_id: str) -> None:
+    payloads = [
+        build_event_payload(event_id=f"{run_id}_1", run_id=run_id, timestamp="2026-02-23T10:00:00Z"),
+        build_event_payload(
+            event_id=f"{run_id}_2",
+            run_id=run_id,
+            timestamp="2026-02-23T10:00:10Z",
+            event_type="approval_requested",
+            requires_approval=True,
+            approval_status="pending",
+        ),
+        build_event_payload(
+            event_id=f"{run_id}_3",
+            run_id=run_id,
+            timestamp="2026-02-23T10:00:20Z",
+            event_type="approval_resolved",
+            requires_approval=True,
+            approval_status="approved",
+        ),
+        build_event_payload(event_id=f"{run_id}_4", run_id=run_id, timestamp="2026-02-23T10:00:30Z"),
+        build_event_payload(event_id=f"{run_id}_5", run_id=run_id, timestamp="2026-02-23T10:00:40Z"),
+    ]
+    for payload in payloads:
+        store.append(validate_event_payload(payload))
+
+
+class _WindowRecordingStore:
+    def __init__(self, base: Any) -> None:
+        self._base = base
+        self.window_offsets: list[int] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._base, name)
+
+    def list_by_run_id(self, run_id: str) -> list[StoredEvent]:
+        raise AssertionError("point-in-time reads must not load the whole run")
+
+    def list_by_run_id_window(self, run_id: str, *, offset: int, limit: int) -> list[StoredEvent]:
+        self.window_offsets.append(offset)
+        return self._base.list_by_run_id_window(run_id, offset=offset, limit=limit)
+
+    def latest_snapshot(self, run_id: str, **bounds: Any) -> Any:
+        return self._base.latest_snapshot(run_id, **bounds)
+
+
+def build_store(backend: str, tmp_path: Path, *, snapshot_interval: int) -> Any:
+    if backend == "memory":
+        return InMemoryAppendOnlyEventStore(snapshot_interval=snapshot_interval)
+    return SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"), snapshot_interval=snapshot_interval)
+
+
+@pytest.fixture(autouse=True)
+def reset_dependencies() -> None:
+    app.dependency_overrides.clear()
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_status_as_of_sequence_and_timestamp_replay_the_timeline_prefix(tmp_path, backend: str) -> None:
+    store = build_store(backend, tmp_path, snapshot_interval=2)
+    app.dependency_overrides[get_event_store] = lambda: store
+    seed_approval_run(store, "run_pit")
+
+    paused = client.get("/v1/runs/run_pit/status", params={"as_of_sequence": 2})
+    resumed = client.get("/v1/runs/run_pit/status", params={"as_of_sequence": 3})
+    by_time = client.get("/v1/runs/run_pit/status", params={"as_of": "2026-02-23T10:00:15Z"})
+    clamped = client.get("/v1/runs/run_pit/status", params={"as_of_sequence": 99})
+    current = client.get("/v1/runs/run_pit/status")
+
+    assert paused.status_code == 200
+    assert paused.json()["status"] == "paused"
+    assert paused.json()["pending_approval"]["event_id"] == "run_pit_2"
+    assert paused.json()["as_of_sequence"] == 2
+    assert resumed.json()["status"] == "approved"
+    assert resumed.json()["pending_approval"] is None
+    assert by_time.json() == paused.json()
+    assert clamped.json()["as_of_sequence"] == 5
+    assert {key: value for key, value in clamped.json().items() if key != "as_of_sequence"} == current.json()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_as_of_reads_replay_only_events_after_the_nearest_snapshot(tmp_path, backend: str) -> None:
+    base = build_store(backend, tmp_path, snapshot_interval=2)
+    seed_approval_run(base, "run_pit_snapshot")
+    store = _WindowRecordingStore(base)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    snapshot = base.latest_snapshot("run_pit_snapshot", max_position=5)
+    response = client.get("/v1/runs/run_pit_snapshot/status", params={"as_of_sequence": 5})
+
+    assert snapshot is not None
+    assert snapshot.position == 4
+    assert response.json()["status"] == "running"
+    assert store.window_offsets == [4]
+
+
+def test_journal_as_of_stops_at_the_point_in_time() -> None:
+    store = InMemoryAppendOnlyEventStore(snapshot_interval=2)
+    app.dependency_overrides[get_event_store] = lambda: store
+    seed_approval_run(store, "run_pit_journal")
+
+    response = client.get("/v1/runs/run_pit_journal/journal", params={"as_of_sequence": 2})
+    first_page = client.get("/v1/runs/run_pit_journal/journal", params={"as_of_sequence": 3, "limit": 2})
+    second_page = client.get(
+        "/v1/runs/run_pit_journal/journal",
+        params={"as_of_sequence": 3, "limit": 2, "cursor": first_page.json()["next_cursor"]},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["entry_count"] == 2
+    assert body["as_of_sequence"] == 2
+    assert body["next_cursor"] is None
+    assert body["run_status"]["status"] == "paused"
+    assert [entry["event_id"] for entry in second_page.json()["entries"]] == ["run_pit_journal_3"]
+    assert second_page.json()["next_cursor"] is None
+
+
+def test_out_of_order_append_rebuilds_snapshots() -> None:
+    store = InMemoryAppendOnlyEventStore(snapshot_interval=2)
+    app.dependency_overrides[get_event_store] = lambda: store
+    seed_approval_run(store, "run_pit_reorder")
+    store.append(
+        validate_event_payload(
+            build_event_payload(
+                event_id="run_pit_reorder_0",
+                run_id="run_pit_reorder",
+                timestamp="2026-02-23T09:59:00Z",
+            )
+        )
+    )
+
+    snapshot = store.latest_snapshot("run_pit_reorder", max_position=3)
+    response = client.get("/v1/runs/run_pit_reorder/status", params={"as_of_sequence": 3})
+
+    assert snapshot is not None
+    assert snapshot.position == 2
+    assert snapshot.fold_state is not None
+    assert snapshot.fold_state["status"] == "running"
+    assert response.json()["status"] == "paused"
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_as_of_status_matches_a_prefix_fold_after_out_of_order_appends(tmp_path, backend: str) -> None:
+    store = build_store(backend, tmp_path, snapshot_interval=2)
+    app.dependency_overrides[get_event_store] = lambda: store
+    seed_approval_run(store, "run_pit_prefix")
+    # After the first reorder, each late event sorts after the row before it
+    # but still lands mid-timeline.
+    for event_id, timestamp in [
+        ("run_pit_prefix_early", "2026-02-23T09:59:00Z"),
+        ("run_pit_prefix_middle", "2026-02-23T10:00:15Z"),
+        ("run_pit_prefix_later", "2026-02-23T10:00:25Z"),
+    ]:
+        store.append(
+            validate_event_payload(
+                build_event_payload(event_id=event_id, run_id="run_pit_prefix", timestamp=timestamp)
+            )
+        )
+    timeline = store.list_by_run_id("run_pit_prefix")
+
+    for position in range(1, len(timeline) + 1):
+        response = client.get("/v1/runs/run_pit_prefix/status", params={"as_of_sequence": position})
+        try:
+            expected = project_run_status(timeline[:position])
+        except InconsistentRunStateError as exc:
+            assert response.status_code == 409
+            assert response.json()["error"]["details"][0]["code"] == exc.detail_code
+            continue
+        assert response.status_code == 200
+        assert response.json()["status"] == expected.status
+        assert response.json()["pending_approval"] == expected.pending_approval
+
+
+def test_point_in_time_before_first_event_and_naive_timestamp_are_rejected() -> None:
+    store = InMemoryAppendOnlyEventStore(snapshot_interval=2)
+    app.dependency_overrides[get_event_store] = lambda: store
+    seed_approval_run(store, "run_pit_errors")
+
+    before = client.get("/v1/runs/run_pit_errors/status", params={"as_of": "2026-02-23T09:00:00Z"})
+    naive = client.get("/v1/runs/run_pit_errors/journal", params={"as_of": "2026-02-23T10:00:00"})
+
+    assert before.status_code == 404
+    assert before.json()["error"]["code"] == "RUN_NOT_FOUND"
+    assert naive.status_code == 422
+    assert naive.json()["error"]["details"][0]["code"] == "MISSING_TIMEZONE"
+    assert naive.json()["error"]["details"][0]["path"] == "as_of"
@@ -0,0 +1,338 @@
+from datetime import datetime
+import json
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+    StoredEvent,
+)
+from nightledger_api.services.journal_projection_service import (  # noqa: E402
+    RenderedRunJournal,
+    encode_journal_entry,
+    project_run_journal,
+)
+from nightledger_api.services import projection_cache  # noqa: E402
+from nightledger_api.services.projection_cache import BoundedLRUCache  # noqa: E402
+
+client = TestClient(app)
+
+
+def build_event_payload(
+    *,
+    event_id: str,
+    run_id: str,
+    timestamp: str,
+    event_type: str = "action",
+    requires_approval: bool = False,
+    approval_status: str = "not_required",
+) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "run_id": run_id,
+        "timestamp": timestamp,
+        "type": event_type,
+        "actor": "agent",
+        "title": "Cached projection event",
+        "details": "Event used by projection cache tests",
+        "confidence": 0.8,
+        "risk_level": "low",
+        "requires_approval": requires_approval,
+        "approval": {
+            "status": approval_status,
+            "requested_by": "agent" if approval_status == "pending" else None,
+            "resolved_by": None,
+            "resolved_at": None,
+            "reason": None,
+        },
+        "evidence": [],
+    }
+
+
+class _CountingStore:
+    def __init__(self, base: Any) -> None:
+        self._base = base
+        self.list_by_run_id_calls = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._base, name)
+
+    def append(self, event: Any) -> StoredEvent:
+        return self._base.append(event)
+
+    def list_by_run_id(self, run_id: str) -> list[StoredEvent]:
+        self.list_by_run_id_calls += 1
+        return self._base.list_by_run_id(run_id)
+
+    def list_all(self) -> list[StoredEvent]:
+        return self._base.list_all()
+
+    def run_head(self, run_id: str) -> str | None:
+        return self._base.run_head(run_id)
+
+
+@pytest.fixture(autouse=True)
+def reset_dependencies() -> None:
+    app.dependency_overrides.clear()
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_unchanged_run_status_and_journal_are_served_without_reading_events(tmp_path, backend: str) -> None:
+    base = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    store = _CountingStore(base)
+    app.dependency_overrides[get_event_store] = lambda: store
+    store.append(
+        validate_event_payload(
+            build_event_payload(
+                event_id=f"evt_cache_{backend}_1",
+                run_id=f"run_cache_{backend}",
+                timestamp="2026-02-21T09:00:00Z",
+            )
+        )
+    )
+
+    first_status = client.get(f"/v1/runs/run_cache_{backend}/status")
+    first_journal = client.get(f"/v1/runs/run_cache_{backend}/journal")
+    reads_after_warmup = store.list_by_run_id_calls
+    second_status = client.get(f"/v1/runs/run_cache_{backend}/status")
+    second_journal = client.get(f"/v1/runs/run_cache_{backend}/journal")
+
+    assert first_status.json() == second_status.json()
+    assert first_journal.json() == second_journal.json()
+    assert store.list_by_run_id_calls == reads_after_warmup
+
+
+def test_append_invalidates_cached_projections() -> None:
+    store = _CountingStore(InMemoryAppendOnlyEventStore())
+    app.dependency_overrides[get_event_store] = lambda: store
+    store.append(
+        validate_event_payload(
+            build_event_payload(
+                event_id="evt_cache_invalidate_1",
+                run_id="run_cache_invalidate",
+                timestamp="2026-02-21T09:00:00Z",
+            )
+        )
+    )
+    assert client.get("/v1/runs/run_cache_invalidate/status").json()["status"] == "running"
+    before = client.get("/v1/metrics/projection-cache").json()
+
+    response = client.post(
+        "/v1/events",
+        json=build_event_payload(
+            event_id="evt_cache_invalidate_2",
+            run_id="run_cache_invalidate",
+            timestamp="2026-02-21T09:00:01Z",
+            event_type="approval_requested",
+            requires_approval=True,
+            approval_status="pending",
+        ),
+    )
+    assert response.status_code == 201
+
+    status = client.get("/v1/runs/run_cache_invalidate/status").json()
+    journal = client.get("/v1/runs/run_cache_invalidate/journal").json()
+    after = client.get("/v1/metrics/projection-cache").json()
+
+    assert status["status"] == "paused"
+    assert status["pending_approval"]["event_id"] == "evt_cache_invalidate_2"
+    assert journal["entry_count"] == 2
+    assert after["invalidations"] > before["invalidations"]
+    assert after["misses"] > before["misses"]
+
+
+def test_projection_cache_metrics_endpoint_reports_hits_and_bounds() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+    store.append(
+        validate_event_payload(
+            build_event_payload(
+                event_id="evt_cache_metrics_1",
+                run_id="run_cache_metrics",
+                timestamp="2026-02-21T09:00:00Z",
+            )
+        )
+    )
+    client.get("/v1/runs/run_cache_metrics/status")
+    before = client.get("/v1/metrics/projection-cache").json()
+    client.get("/v1/runs/run_cache_metrics/status")
+    after = client.get("/v1/metrics/projection-cache").json()
+
+    assert after["hits"] == before["hits"] + 1
+    assert set(after) == {
+        "hits",
+        "misses",
+        "hit_ratio",
+        "evictions",
+        "invalidations",
+        "entries",
+        "bytes",
+        "max_entries",
+        "max_bytes",
+    }
+    assert 0 < after["bytes"] <= after["max_bytes"]
+
+
+def test_bounded_lru_evicts_least_recently_used_by_count_and_bytes() -> None:
+    cache = BoundedLRUCache(max_entries=2, max_bytes=100)
+    cache.put("a", "A", size=10)
+    cache.put("b", "B", size=10)
+    assert cache.get("a") == "A"
+    cache.put("c", "C", size=10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+
+    cache.put("d", "D", size=95)
+    assert cache.get("a") is None
+    assert cache.get("c") is None
+    assert cache.get("d") == "D"
+    assert cache.metrics()["bytes"] == 95
+
+    cache.put("huge", "H", size=101)
+    assert cache.get("huge") is None
+    assert cache.metrics()["evictions"] == 3
+
+
+def test_bounded_lru_version_mismatch_invalidates_entry() -> None:
+    cache = BoundedLRUCache(max_entries=4, max_bytes=100)
+    cache.put("run", "projection", size=10, version="sha256:old")
+
+    assert cache.get("run", version="sha256:new") is None
+    assert cache.get("run", version="sha256:old") is None
+    assert cache.metrics()["invalidations"] == 1
+
+
+def test_journal_entries_are_served_from_encoded_fragment_cache_after_append() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+    for index in range(1, 4):
+        store.append(
+            validate_event_payload(
+                build_event_payload(
+                    event_id=f"evt_fragment_{index}",
+                    run_id="run_fragment_cache",
+                    timestamp=f"2026-02-21T09:00:0{index}Z",
+                )
+            )
+        )
+    client.get("/v1/runs/run_fragment_cache/journal")
+    store.append(
+        validate_event_payload(
+            build_event_payload(
+                event_id="evt_fragment_4",
+                run_id="run_fragment_cache",
+                timestamp="2026-02-21T09:00:04Z",
+            )
+        )
+    )
+    before = client.get("/v1/metrics/journal-entry-cache").json()
+
+    response = client.get("/v1/runs/run_fragment_cache/journal")
+    after = client.get("/v1/metrics/journal-entry-cache").json()
+
+    assert response.headers["content-type"] == "application/json"
+    expected = project_run_journal(
+        run_id="run_fragment_cache", events=store.list_by_run_id("run_fragment_cache")
+    ).to_dict()
+    assert response.json() == {**expected, "run_status": {"status": "running", "pending_approval": None}}
+    assert after["hits"] == before["hits"] + 3
+    assert after["misses"] == before["misses"] + 1
+
+
+def test_rendered_journal_bytes_match_json_encoding_of_projection() -> None:
+    base = InMemoryAppendOnlyEventStore()
+    base.append(
+        validate_event_payload(
+            build_event_payload(event_id="evt_render_1", run_id="run_render", timestamp="2026-02-21T09:00:00Z")
+        )
+    )
+    projection = project_run_journal(run_id="run_render", events=base.list_by_run_id("run_render"))
+    rendered = RenderedRunJournal(
+        run_id="run_render",
+        fragments=[encode_journal_entry(entry) for entry in projection.entries],
+        extra={"next_cursor": None},
+    )
+
+    assert json.loads(rendered.to_json_bytes()) == {**projection.to_dict(), "next_cursor": None}
+
+
+def test_journal_read_folds_status_in_the_same_pass(monkeypatch) -> None:
+    store = _CountingStore(InMemoryAppendOnlyEventStore())
+    app.dependency_overrides[get_event_store] = lambda: store
+    store.append(
+        validate_event_payload(
+            build_event_payload(
+                event_id="evt_fused_1",
+                run_id="run_fused",
+                timestamp="2026-02-21T09:00:00Z",
+                event_type="approval_requested",
+                requires_approval=True,
+                approval_status="pending",
+            )
+        )
+    )
+
+    def _second_pass(events: Any) -> Any:
+        raise AssertionError("journal reads must not re-project status separately")
+
+    monkeypatch.setattr(projection_cache, "project_run_status", _second_pass)
+    journal = client.get("/v1/runs/run_fused/journal").json()
+    status = client.get("/v1/runs/run_fused/status").json()
+
+    assert store.list_by_run_id_calls == 1
+    assert journal["run_status"]["status"] == "paused"
+    assert journal["run_status"]["pending_approval"]["event_id"] == "evt_fused_1"
+    assert status["pending_approval"] == journal["run_status"]["pending_approval"]
+
+
+class _ConflictingRunStore(InMemoryAppendOnlyEventStore):
+    def list_by_run_id(self, run_id: str) -> list[StoredEvent]:
+        payloads = [
+            build_event_payload(
+                event_id="evt_done", run_id=run_id, timestamp="2026-02-21T09:00:00Z", event_type="summary"
+            ),
+            # Continues past the terminal summary, a status conflict.
+            build_event_payload(event_id="evt_after", run_id=run_id, timestamp="2026-02-21T09:01:00Z"),
+            # Payload identity drifted from the stored event, a journal conflict.
+            build_event_payload(event_id="evt_drifted", run_id=run_id, timestamp="2026-02-21T09:02:00Z"),
+        ]
+        return [
+            StoredEvent(
+                id="evt_stored" if payload["id"] == "evt_drifted" else payload["id"],
+                timestamp=datetime.fromisoformat(payload["timestamp"].replace("Z", "+00:00")),
+                run_id=run_id,
+                payload=payload,
+                integrity_warning=False,
+            )
+            for payload in payloads
+        ]
+
+
+def test_journal_conflicts_take_precedence_over_earlier_status_conflicts() -> None:
+    app.dependency_overrides[get_event_store] = lambda: _ConflictingRunStore()
+
+    journal = client.get("/v1/runs/run_conflicts/journal")
+    status = client.get("/v1/runs/run_conflicts/status")
+
+    assert journal.status_code == 409
+    assert journal.json()["error"]["details"][0]["code"] == "TRACEABILITY_LINK_BROKEN"
+    assert status.status_code == 409
+    assert status.json()["error"]["details"][0]["code"] == "TERMINAL_STATE_CONFLICT"
@@ -0,0 +1,112 @@
+import ast
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.services.authorize_action_service import (  # noqa: E402
+    RuleDefinition,
+    RuleEvaluator,
+    UserRulesRepository,
+)
+from nightledger_api.services.errors import (  # noqa: E402
+    RuleConfigurationError,
+    RuleExpressionError,
+    RuleInputError,
+)
+
+
+def _write_rules(tmp_path: Path, when: str) -> Path:
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(
+        (
+            "users:\n"
+            "  user_test:\n"
+            "    rules:\n"
+            "      - id: compiled_rule\n"
+            "        type: guardrail\n"
+            "        applies_to: [\"purchase.create\"]\n"
+            f"        when: {when!r}\n"
+            "        action: \"require_approval\"\n"
+            "        reason: \"Compiled\"\n"
+        ),
+        encoding="utf-8",
+    )
+    return rules_file
+
+
+@pytest.mark.parametrize(
+    ("when", "message"),
+    [
+        ("context.amount >", "Invalid rule expression syntax"),
+        ("__import__('os').system('true')", "unsupported syntax: Call"),
+        ("context.amount is None", "unsupported comparison operator"),
+        ("secrets.amount > 1", "Unknown rule symbol 'secrets'"),
+    ],
+)
+def test_invalid_expressions_fail_when_the_catalog_loads(monkeypatch, tmp_path, when: str, message: str) -> None:
+    monkeypatch.setenv("NIGHTLEDGER_USER_RULES_FILE", str(_write_rules(tmp_path, when)))
+
+    with pytest.raises(RuleConfigurationError, match=message) as exc_info:
+        UserRulesRepository().load()
+
+    assert isinstance(exc_info.value, RuleExpressionError)
+    assert exc_info.value.rule_id == "compiled_rule"
+
+
+def test_expressions_are_parsed_once_per_catalog_load(monkeypatch, tmp_path) -> None:
+    when = "context.amount > 100 and context.merchant in ['ACME', 'Globex'] and not run.has_pending_approval"
+    monkeypatch.setenv("NIGHTLEDGER_USER_RULES_FILE", str(_write_rules(tmp_path, when)))
+    parse = ast.parse
+    parsed: list[str] = []
+
+    def _counted_parse(source: str, *args, **kwargs) -> ast.AST:
+        parsed.append(source)
+        return parse(source, *args, **kwargs)
+
+    monkeypatch.setattr(ast, "parse", _counted_parse)
+    repository = UserRulesRepository()
+    [rule] = repository.rules_for_user(user_id="user_test")
+    evaluator = RuleEvaluator()
+    outcomes = [
+        evaluator.evaluate(
+            rule=rule,
+            context={"amount": amount, "merchant": merchant},
+            run={"event_count": 0, "has_pending_approval": False},
+        )
+        for amount, merchant in [(500, "ACME"), (50, "ACME"), (500, "Initech")]
+    ]
+    repository.rules_for_user(user_id="user_test")
+
+    assert outcomes == [True, False, False]
+    assert parsed == [when]
+
+
+def test_compiled_predicates_keep_evaluation_semantics() -> None:
+    evaluator = RuleEvaluator()
+    run = {"event_count": 3, "has_pending_approval": True}
+
+    def evaluate(when: str, context: dict) -> bool:
+        rule = RuleDefinition(
+            id="inline_rule",
+            type="guardrail",
+            applies_to=("purchase.create",),
+            when=when,
+            action="deny",
+            reason="Inline",
+        )
+        return evaluator.evaluate(rule=rule, context=context, run=run)
+
+    assert evaluate("1 < context.amount <= 10", {"amount": 10}) is True
+    assert evaluate("1 < context.amount <= 10", {"amount": 11}) is False
+    assert evaluate("context.currency not in ('USD',) or run.event_count > 5", {"currency": "EUR"}) is True
+    # `or` short-circuits before the missing input is read.
+    assert evaluate("run.has_pending_approval or context.missing", {}) is True
+    with pytest.raises(RuleInputError, match="context.missing"):
+        evaluate("context.missing == 1", {})
+    with pytest.raises(RuleExpressionError, match="must evaluate to a boolean"):
+        evaluate("context.amount", {"amount": 3})
+    with pytest.raises(RuleExpressionError, match="evaluation failed"):
+        evaluate("context.amount > 'ten'", {"amount": 3})
@@ -69,7 +69,7 @@ def append_direct(store: InMemoryAppendOnlyEventStore, payload: dict[str, Any])
     store.append(event)
 
 
-class _FailingStatusReadStore:
+class _FailingStatusReadStore(InMemoryAppendOnlyEventStore):
     """Mock EventStore that simulates storage read failures for testing."""
     
     def append(self, event: Any) -> Any:
@@ -0,0 +1,241 @@
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+    StoredEvent,
+)
+
+client = TestClient(app)
+
+
+def build_event_payload(
+    *,
+    event_id: str,
+    run_id: str,
+    timestamp: str,
+    event_type: str = "action",
+    requires_approval: bool = False,
+    approval_status: str = "not_required",
+) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "run_id": run_id,
+        "timestamp": timestamp,
+        "type": event_type,
+        "actor": "agent",
+        "title": "Batch status event",
+        "details": "Event used by batch status tests",
+        "confidence": 0.8,
+        "risk_level": "low",
+        "requires_approval": requires_approval,
+        "approval": {
+            "status": approval_status,
+            "requested_by": "agent" if approval_status == "pending" else None,
+            "resolved_by": "human_1" if approval_status in {"approved", "rejected"} else None,
+            "resolved_at": timestamp if approval_status in {"approved", "rejected"} else None,
+            "reason": None,
+        },
+        "evidence": [],
+    }
+
+
+class _SingleQueryStore:
+    def __init__(self, base: Any) -> None:
+        self._base = base
+        self.batch_reads = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._base, name)
+
+    def append(self, event: Any) -> StoredEvent:
+        return self._base.append(event)
+
+    def list_by_run_id(self, run_id: str) -> list[StoredEvent]:
+        raise AssertionError("batch status must not read runs one by one")
+
+    def list_by_run_ids(self, run_ids: list[str]) -> dict[str, list[StoredEvent]]:
+        self.batch_reads += 1
+        return self._base.list_by_run_ids(run_ids)
+
+
+class _HeadTrackingStore(_SingleQueryStore):
+    def __init__(self, base: Any) -> None:
+        super().__init__(base)
+        self.batch_read_run_ids: list[list[str]] = []
+
+    def list_by_run_ids(self, run_ids: list[str]) -> dict[str, list[StoredEvent]]:
+        self.batch_read_run_ids.append(list(run_ids))
+        return super().list_by_run_ids(run_ids)
+
+
+@pytest.fixture(autouse=True)
+def reset_dependencies() -> None:
+    app.dependency_overrides.clear()
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_batch_status_reads_all_runs_in_one_query(tmp_path, backend: str) -> None:
+    base = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    store = _SingleQueryStore(base)
+    app.dependency_overrides[get_event_store] = lambda: store
+    for payload in [
+        build_event_payload(event_id="evt_1", run_id="run_batch_running", timestamp="2026-02-22T10:00:00Z"),
+        build_event_payload(
+            event_id="evt_2",
+            run_id="run_batch_paused",
+            timestamp="2026-02-22T10:00:00Z",
+            event_type="approval_requested",
+            requires_approval=True,
+            approval_status="pending",
+        ),
+    ]:
+        store.append(validate_event_payload(payload))
+
+    response = client.post(
+        "/v1/runs/status:batch",
+        json={"run_ids": ["run_batch_paused", "run_batch_missing", "run_batch_running", "run_batch_paused"]},
+    )
+
+    assert response.status_code == 200
+    assert store.batch_reads == 1
+    body = response.json()
+    assert body["run_count"] == 3
+    assert body["runs"] == [
+        {
+            "run_id": "run_batch_paused",
+            "found": True,
+            "status": "paused",
+            "pending_approval": {
+                "event_id": "evt_2",
+                "requested_by": "agent",
+                "requested_at": "2026-02-22T10:00:00Z",
+                "reason": "Event used by batch status tests",
+            },
+        },
+        {
+            "run_id": "run_batch_missing",
+            "found": False,
+            "error": {
+                "code": "RUN_NOT_FOUND",
+                "message": "Run not found",
+                "details": [
+                    {
+                        "path": "run_id",
+                        "message": "No events found for run 'run_batch_missing'",
+                        "type": "not_found",
+                        "code": "RUN_NOT_FOUND",
+                    }
+                ],
+            },
+        },
+        {
+            "run_id": "run_batch_running",
+            "found": True,
+            "status": "running",
+            "pending_approval": None,
+        },
+    ]
+
+
+def test_batch_status_reports_inconsistent_run_per_item() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+    store.append(
+        validate_event_payload(
+            build_event_payload(
+                event_id="evt_bad_resolution",
+                run_id="run_batch_inconsistent",
+                timestamp="2026-02-22T10:00:00Z",
+                event_type="approval_resolved",
+                requires_approval=True,
+                approval_status="approved",
+            )
+        )
+    )
+    store.append(
+        validate_event_payload(
+            build_event_payload(event_id="evt_ok", run_id="run_batch_ok", timestamp="2026-02-22T10:00:00Z")
+        )
+    )
+
+    response = client.post(
+        "/v1/runs/status:batch",
+        json={"run_ids": ["run_batch_inconsistent", "run_batch_ok"]},
+    )
+
+    assert response.status_code == 200
+    inconsistent, ok = response.json()["runs"]
+    assert inconsistent["found"] is True
+    assert inconsistent["error"]["code"] == "INCONSISTENT_RUN_STATE"
+    assert inconsistent["error"]["details"][0]["code"] == "NO_PENDING_APPROVAL"
+    assert ok["status"] == "running"
+
+
+def test_batch_status_rejects_empty_and_oversized_requests() -> None:
+    app.dependency_overrides[get_event_store] = lambda: InMemoryAppendOnlyEventStore()
+
+    assert client.post("/v1/runs/status:batch", json={"run_ids": []}).status_code == 422
+    assert client.post("/v1/runs/status:batch", json={"run_ids": ["run_1", ""]}).status_code == 422
+    assert client.post("/v1/runs/status:batch", json={"run_ids": ["   "]}).status_code == 422
+    too_many = [f"run_{index}" for index in range(201)]
+    assert client.post("/v1/runs/status:batch", json={"run_ids": too_many}).status_code == 422
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_batch_status_serves_unchanged_runs_from_the_projection_cache(tmp_path, backend: str) -> None:
+    base = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    store = _HeadTrackingStore(base)
+    app.dependency_overrides[get_event_store] = lambda: store
+    # Heads are content hashes, so each backend gets its own runs.
+    for run_id in [f"run_{backend}_a", f"run_{backend}_b"]:
+        store.append(
+            validate_event_payload(
+                build_event_payload(event_id=f"evt_{run_id}", run_id=run_id, timestamp="2026-02-22T10:00:00Z")
+            )
+        )
+    request = {"run_ids": [f"run_{backend}_a", f"run_{backend}_b", f"run_{backend}_missing"]}
+
+    first = client.post("/v1/runs/status:batch", json=request).json()
+    second = client.post("/v1/runs/status:batch", json=request).json()
+    store.append(
+        validate_event_payload(
+            build_event_payload(
+                event_id="evt_b_2",
+                run_id=f"run_{backend}_b",
+                timestamp="2026-02-22T10:01:00Z",
+                event_type="approval_requested",
+                requires_approval=True,
+                approval_status="pending",
+            )
+        )
+    )
+    third = client.post("/v1/runs/status:batch", json=request).json()
+
+    assert store.batch_read_run_ids == [
+        [f"run_{backend}_a", f"run_{backend}_b", f"run_{backend}_missing"],
+        [f"run_{backend}_missing"],
+        [f"run_{backend}_b", f"run_{backend}_missing"],
+    ]
+    assert second == first
+    assert [run.get("status") for run in third["runs"]] == ["running", "paused", None]
@@ -0,0 +1,263 @@
+from pathlib import Path
+import sqlite3
+import sys
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+)
+from nightledger_api.services.run_catalog_service import RunCatalogQuery  # noqa: E402
+
+client = TestClient(app)
+
+
+def build_event_payload(
+    *,
+    event_id: str,
+    run_id: str,
+    timestamp: str,
+    event_type: str = "action",
+    requires_approval: bool = False,
+    approval_status: str = "not_required",
+    workflow: str | None = None,
+    step: str = "work",
+) -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "id": event_id,
+        "run_id": run_id,
+        "timestamp": timestamp,
+        "type": event_type,
+        "actor": "agent",
+        "title": "Catalog event",
+        "details": "Event used by runs catalog tests",
+        "confidence": 0.8,
+        "risk_level": "low",
+        "requires_approval": requires_approval,
+        "approval": {
+            "status": approval_status,
+            "requested_by": "agent" if approval_status == "pending" else None,
+            "resolved_by": "human_1" if approval_status in {"approved", "rejected"} else None,
+            "resolved_at": timestamp if approval_status in {"approved", "rejected"} else None,
+            "reason": None,
+        },
+        "evidence": [],
+    }
+    if workflow is not None:
+        payload["meta"] = {"workflow": workflow, "step": step}
+    return payload
+
+
+def build_store(backend: str, tmp_path: Path) -> Any:
+    if backend == "memory":
+        return InMemoryAppendOnlyEventStore()
+    return SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+
+
+def seed_runs(store: Any) -> None:
+    for payload in [
+        build_event_payload(
+            event_id="evt_a1", run_id="run_a", timestamp="2026-02-23T10:00:00Z", workflow="billing"
+        ),
+        build_event_payload(
+            event_id="evt_a2",
+            run_id="run_a",
+            timestamp="2026-02-23T10:05:00Z",
+            event_type="approval_requested",
+            requires_approval=True,
+            approval_status="pending",
+            workflow="billing",
+        ),
+        build_event_payload(
+            event_id="evt_b1", run_id="run_b", timestamp="2026-02-23T10:01:00Z", workflow="billing"
+        ),
+        build_event_payload(
+            event_id="evt_c1",
+            run_id="run_c",
+            timestamp="2026-02-23T10:02:00Z",
+            event_type="approval_requested",
+            requires_approval=True,
+            approval_status="pending",
+            workflow="triage",
+        ),
+        build_event_payload(
+            event_id="evt_d1",
+            run_id="run_d",
+            timestamp="2026-02-23T10:03:00Z",
+            event_type="approval_requested",
+            requires_approval=True,
+            approval_status="pending",
+            workflow="billing",
+        ),
+    ]:
+        store.append(validate_event_payload(payload))
+
+
+@pytest.fixture(autouse=True)
+def reset_dependencies() -> None:
+    app.dependency_overrides.clear()
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_runs_catalog_filters_by_status_and_workflow(tmp_path, backend: str) -> None:
+    store = build_store(backend, tmp_path)
+    seed_runs(store)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    response = client.get("/v1/runs", params={"status": "paused", "workflow": "billing"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["next_cursor"] is None
+    assert [run["run_id"] for run in body["runs"]] == ["run_a", "run_d"]
+    assert body["runs"][0] == {
+        "run_id": "run_a",
+        "workflow": "billing",
+        "status": "paused",
+        "pending_approval": {
+            "event_id": "evt_a2",
+            "requested_by": "agent",
+            "requested_at": "2026-02-23T10:05:00Z",
+            "reason": "Event used by runs catalog tests",
+        },
+        "first_event_at": "2026-02-23T10:00:00Z",
+        "last_event_at": "2026-02-23T10:05:00Z",
+        "event_count": 2,
+        "inconsistency": None,
+    }
+
+    updated = client.get("/v1/runs", params={"updated_after": "2026-02-23T10:01:30Z"}).json()
+    assert [run["run_id"] for run in updated["runs"]] == ["run_a", "run_d", "run_c"]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_runs_catalog_paginates_with_opaque_cursor(tmp_path, backend: str) -> None:
+    store = build_store(backend, tmp_path)
+    seed_runs(store)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    first = client.get("/v1/runs", params={"limit": 3}).json()
+    second = client.get("/v1/runs", params={"limit": 3, "cursor": first["next_cursor"]}).json()
+
+    assert [run["run_id"] for run in first["runs"]] == ["run_a", "run_d", "run_c"]
+    assert [run["run_id"] for run in second["runs"]] == ["run_b"]
+    assert second["next_cursor"] is None
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_runs_catalog_refolds_out_of_order_appends_and_flags_inconsistent_runs(
+    tmp_path, backend: str
+) -> None:
+    store = build_store(backend, tmp_path)
+    store.append(
+        validate_event_payload(
+            build_event_payload(event_id="evt_late", run_id="run_order", timestamp="2026-02-23T10:05:00Z")
+        )
+    )
+    store.append(
+        validate_event_payload(
+            build_event_payload(
+                event_id="evt_early",
+                run_id="run_order",
+                timestamp="2026-02-23T10:00:00Z",
+                event_type="approval_requested",
+                requires_approval=True,
+                approval_status="pending",
+            )
+        )
+    )
+    store.append(
+        validate_event_payload(
+            build_event_payload(
+                event_id="evt_orphan_resolution",
+                run_id="run_broken",
+                timestamp="2026-02-23T10:00:00Z",
+                event_type="approval_resolved",
+                requires_approval=True,
+                approval_status="approved",
+            )
+        )
+    )
+
+    broken, ordered = sorted(store.list_runs(RunCatalogQuery()), key=lambda entry: entry.run_id)
+
+    assert ordered.run_id == "run_order"
+    assert ordered.status == "paused"
+    assert ordered.event_count == 2
+    assert broken.status is None
+    assert broken.inconsistency is not None
+    assert broken.inconsistency["code"] == "NO_PENDING_APPROVAL"
+    assert [entry.run_id for entry in store.list_runs(RunCatalogQuery(inconsistent_only=True))] == [
+        "run_broken"
+    ]
+
+
+def test_sqlite_catalog_is_backfilled_for_existing_databases(tmp_path) -> None:
+    db_path = tmp_path / "events.db"
+    store = SQLiteAppendOnlyEventStore(path=str(db_path))
+    seed_runs(store)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE runs")
+
+    reopened = SQLiteAppendOnlyEventStore(path=str(db_path))
+
+    paused = reopened.list_runs(RunCatalogQuery(status="paused", workflow="billing"))
+    assert [entry.run_id for entry in paused] == ["run_a", "run_d"]
+
+
+def test_runs_catalog_rejects_invalid_cursor_and_naive_updated_after() -> None:
+    app.dependency_overrides[get_event_store] = lambda: InMemoryAppendOnlyEventStore()
+
+    bad_cursor = client.get("/v1/runs", params={"cursor": "not-a-cursor"})
+    naive = client.get("/v1/runs", params={"updated_after": "2026-02-23T10:00:00"})
+
+    assert bad_cursor.status_code == 422
+    assert bad_cursor.json()["error"]["details"][0]["code"] == "INVALID_CURSOR"
+    assert naive.status_code == 422
+    assert naive.json()["error"]["details"][0]["code"] == "MISSING_TIMEZONE"
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_runs_catalog_refolds_events_landing_mid_timeline_after_an_earlier_reorder(
+    tmp_path, backend: str
+) -> None:
+    store = build_store(backend, tmp_path)
+    app.dependency_overrides[get_event_store] = lambda: store
+    # 10:05 closes the run; 10:01 arrives out of order; 10:03 is later than the
+    # row before it but still lands before the run's summary.
+    for event_id, minute, event_type, step in [
+        ("evt_summary", 5, "summary", "run_completed"),
+        ("evt_early", 1, "action", "work"),
+        ("evt_middle", 3, "action", "work"),
+    ]:
+        store.append(
+            validate_event_payload(
+                build_event_payload(
+                    event_id=event_id,
+                    run_id="run_mid",
+                    timestamp=f"2026-02-23T10:{minute:02d}:00Z",
+                    event_type=event_type,
+                    workflow="billing",
+                    step=step,
+                )
+            )
+        )
+
+    [entry] = store.list_runs(RunCatalogQuery())
+    status = client.get("/v1/runs/run_mid/status").json()
+
+    assert status["status"] == "completed"
+    assert entry.status == "completed"
+    assert entry.inconsistency is None
+    assert entry.event_count == 3
+    assert store.list_runs(RunCatalogQuery(inconsistent_only=True)) == []
@@ -0,0 +1,263 @@
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services import projection_cache  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+)
+
+client = TestClient(app)
+
+
+def build_event_payload(
+    *,
+    event_id: str,
+    run_id: str,
+    timestamp: str,
+    event_type: str = "action",
+    requires_approval: bool = False,
+    approval_status: str = "not_required",
+) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "run_id": run_id,
+        "timestamp": timestamp,
+        "type": event_type,
+        "actor": "agent",
+        "title": "Sparse fieldset event",
+        "details": "Event used by sparse fieldset tests",
+        "confidence": 0.8,
+        "risk_level": "low",
+        "requires_approval": requires_approval,
+        "approval": {
+            "status": approval_status,
+            "requested_by": "agent" if approval_status == "pending" else None,
+            "resolved_by": None,
+            "resolved_at": None,
+            "reason": None,
+        },
+        "evidence": [{"kind": "log", "label": "Step log", "ref": f"log://{event_id}"}],
+        "meta": {"workflow": "wf_sparse", "step": "work"},
+    }
+
+
+def seed(store: Any) -> None:
+    store.append(
+        validate_event_payload(
+            build_event_payload(event_id="evt_sparse_1", run_id="run_sparse", timestamp="2026-02-26T10:00:00Z")
+        )
+    )
+    store.append(
+        validate_event_payload(
+            build_event_payload(
+                event_id="evt_sparse_2",
+                run_id="run_sparse",
+                timestamp="2026-02-26T10:00:05Z",
+                event_type="approval_requested",
+                requires_approval=True,
+                approval_status="pending",
+            )
+        )
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_dependencies() -> None:
+    app.dependency_overrides.clear()
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_events_fields_return_only_selected_dotted_paths(tmp_path, monkeypatch, backend: str) -> None:
+    store = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    seed(store)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    def _full_read(self: Any, run_id: str) -> Any:
+        raise AssertionError("sparse reads must not load full events")
+
+    monkeypatch.setattr(type(store), "list_by_run_id", _full_read)
+    response = client.get(
+        "/v1/runs/run_sparse/events",
+        params={"fields": "id,timestamp,payload.type,payload.approval.status,payload.meta.missing"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "run_id": "run_sparse",
+        "event_count": 2,
+        "events": [
+            {
+                "id": "evt_sparse_1",
+                "timestamp": "2026-02-26T10:00:00Z",
+                "payload": {"type": "action", "approval": {"status": "not_required"}, "meta": {"missing": None}},
+            },
+            {
+                "id": "evt_sparse_2",
+                "timestamp": "2026-02-26T10:00:05Z",
+                "payload": {"type": "approval_requested", "approval": {"status": "pending"}, "meta": {"missing": None}},
+            },
+        ],
+    }
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_events_fields_with_selected_ancestor_match_default_values(tmp_path, backend: str) -> None:
+    store = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    seed(store)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    default = client.get("/v1/runs/run_sparse/events").json()
+    sparse = client.get(
+        "/v1/runs/run_sparse/events", params={"fields": "payload.evidence,payload,integrity_warning"}
+    ).json()
+
+    assert sparse["events"] == [
+        {"payload": event["payload"], "integrity_warning": event["integrity_warning"]}
+        for event in default["events"]
+    ]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_events_fields_keep_json_booleans_and_missing_paths(tmp_path, backend: str) -> None:
+    store = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    seed(store)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    response = client.get(
+        "/v1/runs/run_sparse/events",
+        params={"fields": "id,payload.requires_approval,payload.approval.resolved_by,payload.no.such.path"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["events"] == [
+        {
+            "id": "evt_sparse_1",
+            "payload": {
+                "requires_approval": False,
+                "approval": {"resolved_by": None},
+                "no": {"such": {"path": None}},
+            },
+        },
+        {
+            "id": "evt_sparse_2",
+            "payload": {
+                "requires_approval": True,
+                "approval": {"resolved_by": None},
+                "no": {"such": {"path": None}},
+            },
+        },
+    ]
+    assert all(type(event["payload"]["requires_approval"]) is bool for event in response.json()["events"])
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_events_fields_omit_paths_through_scalars(tmp_path, backend: str) -> None:
+    store = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    seed(store)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    response = client.get(
+        "/v1/runs/run_sparse/events",
+        params={"fields": "id,payload.title.x,payload.approval.resolved_by.name,payload.approval.status"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["events"] == [
+        {"id": "evt_sparse_1", "payload": {"approval": {"status": "not_required"}}},
+        {"id": "evt_sparse_2", "payload": {"approval": {"status": "pending"}}},
+    ]
+
+
+def test_journal_fields_select_entry_paths() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    seed(store)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    response = client.get(
+        "/v1/runs/run_sparse/journal", params={"fields": "entry_id,approval_context.status"}
+    )
+    workflow = client.get("/v1/workflows/wf_sparse/journal", params={"fields": "event_id"})
+
+    assert response.status_code == 200
+    assert response.json()["entries"] == [
+        {"entry_id": "jrnl_run_sparse_0001", "approval_context": {"status": "not_required"}},
+        {"entry_id": "jrnl_run_sparse_0002", "approval_context": {"status": "pending"}},
+    ]
+    assert response.json()["run_status"]["status"] == "paused"
+    assert workflow.json()["entries"] == [
+        {"run_id": "run_sparse", "event_id": "evt_sparse_1"},
+        {"run_id": "run_sparse", "event_id": "evt_sparse_2"},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("path", "fields"),
+    [
+        ("/v1/runs/run_sparse/events", "id,unknown"),
+        ("/v1/runs/run_sparse/events", "timestamp.year"),
+        ("/v1/runs/run_sparse/events", "payload.$bad"),
+        ("/v1/runs/run_sparse/events", " , "),
+        ("/v1/runs/run_sparse/journal", "payload"),
+    ],
+)
+def test_unknown_fields_are_rejected(path: str, fields: str) -> None:
+    store = InMemoryAppendOnlyEventStore()
+    seed(store)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    response = client.get(path, params={"fields": fields})
+
+    assert response.status_code == 422
+    detail = response.json()["error"]["details"][0]
+    assert detail["path"] == "fields"
+    assert detail["code"] == "INVALID_FIELD"
+
+
+def test_journal_fields_are_selected_when_entries_are_rendered(monkeypatch) -> None:
+    store = InMemoryAppendOnlyEventStore()
+    seed(store)
+    app.dependency_overrides[get_event_store] = lambda: store
+    params = {"fields": "entry_id,approval_context.status,approval_context.requested_by.name", "limit": 10}
+
+    first = client.get("/v1/runs/run_sparse/journal", params=params)
+
+    def _rebuild(**kwargs: Any) -> Any:
+        raise AssertionError("sparse entries must be served from the fragment cache")
+
+    monkeypatch.setattr(projection_cache, "build_journal_entry", _rebuild)
+    second = client.get("/v1/runs/run_sparse/journal", params=params)
+
+    assert first.status_code == 200
+    assert first.json()["entries"] == [
+        {"entry_id": "jrnl_run_sparse_0001", "approval_context": {"status": "not_required"}},
+        {"entry_id": "jrnl_run_sparse_0002", "approval_context": {"status": "pending"}},
+    ]
+    assert second.json()["entries"] == first.json()["entries"]
@@ -64,6 +64,9 @@ def test_round3_orchestration_append_failure_is_structured_and_journaled() -> No
         def __init__(self) -> None:
             self._base = InMemoryAppendOnlyEventStore()
 
+        def __getattr__(self, name: str) -> object:
+            return getattr(self._base, name)
+
         def append(self, event: object) -> object:
             if getattr(event, "id", None) == "evt_triage_inbox_004":
                 raise RuntimeError("orchestration append exploded")
@@ -0,0 +1,216 @@
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from nightledger_api.controllers.events_controller import get_event_store  # noqa: E402
+from nightledger_api.main import app  # noqa: E402
+from nightledger_api.services.event_ingest_service import validate_event_payload  # noqa: E402
+from nightledger_api.services.event_store import (  # noqa: E402
+    InMemoryAppendOnlyEventStore,
+    SQLiteAppendOnlyEventStore,
+    StoredEvent,
+)
+
+client = TestClient(app)
+
+
+def build_event_payload(
+    *,
+    event_id: str,
+    run_id: str,
+    timestamp: str,
+    workflow: str = "wf_merge",
+    event_type: str = "action",
+    requires_approval: bool = False,
+    approval_status: str = "not_required",
+) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "run_id": run_id,
+        "timestamp": timestamp,
+        "type": event_type,
+        "actor": "agent",
+        "title": "Workflow journal event",
+        "details": "Event used by workflow journal tests",
+        "confidence": 0.8,
+        "risk_level": "low",
+        "requires_approval": requires_approval,
+        "approval": {
+            "status": approval_status,
+            "requested_by": None,
+            "resolved_by": "human_1" if approval_status in {"approved", "rejected"} else None,
+            "resolved_at": timestamp if approval_status in {"approved", "rejected"} else None,
+            "reason": None,
+        },
+        "evidence": [],
+        "meta": {"workflow": workflow, "step": "work"},
+    }
+
+
+def seed_workflow(store: Any) -> None:
+    payloads = [
+        build_event_payload(event_id="evt_b1", run_id="run_b", timestamp="2026-02-24T10:00:01Z"),
+        build_event_payload(event_id="evt_a1", run_id="run_a", timestamp="2026-02-24T10:00:00Z"),
+        build_event_payload(event_id="evt_c1", run_id="run_c", timestamp="2026-02-24T10:00:02Z"),
+        build_event_payload(event_id="evt_a2", run_id="run_a", timestamp="2026-02-24T10:00:03Z"),
+        build_event_payload(event_id="evt_b2", run_id="run_b", timestamp="2026-02-24T10:00:03Z"),
+        build_event_payload(event_id="evt_a3", run_id="run_a", timestamp="2026-02-24T10:00:05Z"),
+        build_event_payload(
+            event_id="evt_other",
+            run_id="run_other",
+            timestamp="2026-02-24T10:00:04Z",
+            workflow="wf_unrelated",
+        ),
+    ]
+    for payload in payloads:
+        store.append(validate_event_payload(payload))
+
+
+class _WindowRecordingStore:
+    def __init__(self, base: Any) -> None:
+        self._base = base
+        self.window_limits: list[int] = []
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._base, name)
+
+    def list_by_run_id(self, run_id: str) -> list[StoredEvent]:
+        raise AssertionError("workflow journal must read runs in windows")
+
+    def list_by_run_id_window(self, run_id: str, *, offset: int, limit: int) -> list[StoredEvent]:
+        self.window_limits.append(limit)
+        return self._base.list_by_run_id_window(run_id, offset=offset, limit=limit)
+
+    def count_by_run_id_before(self, run_id: str, timestamp: Any, *, inclusive: bool = False) -> int:
+        return self._base.count_by_run_id_before(run_id, timestamp, inclusive=inclusive)
+
+    def list_runs(self, query: Any) -> Any:
+        return self._base.list_runs(query)
+
+
+@pytest.fixture(autouse=True)
+def reset_dependencies() -> None:
+    app.dependency_overrides.clear()
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_workflow_journal_merges_runs_chronologically(tmp_path, backend: str) -> None:
+    store = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    app.dependency_overrides[get_event_store] = lambda: store
+    seed_workflow(store)
+
+    response = client.get("/v1/workflows/wf_merge/journal")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["workflow"] == "wf_merge"
+    assert body["run_count"] == 3
+    assert body["inconsistent_run_ids"] == []
+    assert body["next_cursor"] is None
+    assert [(entry["run_id"], entry["event_id"]) for entry in body["entries"]] == [
+        ("run_a", "evt_a1"),
+        ("run_b", "evt_b1"),
+        ("run_c", "evt_c1"),
+        ("run_a", "evt_a2"),
+        ("run_b", "evt_b2"),
+        ("run_a", "evt_a3"),
+    ]
+    assert body["entries"][3]["entry_id"] == "jrnl_run_a_0002"
+    run_a_journal = client.get("/v1/runs/run_a/journal").json()
+    assert {key: value for key, value in body["entries"][0].items() if key != "run_id"} == (
+        run_a_journal["entries"][0]
+    )
+
+
+def test_workflow_journal_pages_concatenate_to_full_merge() -> None:
+    store = InMemoryAppendOnlyEventStore()
+    app.dependency_overrides[get_event_store] = lambda: store
+    seed_workflow(store)
+    full = client.get("/v1/workflows/wf_merge/journal").json()["entries"]
+
+    collected: list[dict[str, Any]] = []
+    params: dict[str, Any] = {"limit": 4}
+    while True:
+        page = client.get("/v1/workflows/wf_merge/journal", params=params).json()
+        collected.extend(page["entries"])
+        if page["next_cursor"] is None:
+            break
+        params = {"limit": 4, "cursor": page["next_cursor"]}
+
+    assert collected == full
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_workflow_journal_cursor_is_a_fixed_size_keyset(tmp_path, backend: str) -> None:
+    store = (
+        InMemoryAppendOnlyEventStore()
+        if backend == "memory"
+        else SQLiteAppendOnlyEventStore(path=str(tmp_path / "events.db"))
+    )
+    app.dependency_overrides[get_event_store] = lambda: store
+    seed_workflow(store)
+
+    first = client.get("/v1/workflows/wf_merge/journal", params={"limit": 3}).json()
+    # A run that first shows up after the cursor was issued, with entries both
+    # before and after the page boundary.
+    for event_id, timestamp in [("evt_d1", "2026-02-24T10:00:00Z"), ("evt_d2", "2026-02-24T10:00:04Z")]:
+        store.append(
+            validate_event_payload(build_event_payload(event_id=event_id, run_id="run_d", timestamp=timestamp))
+        )
+    second = client.get(
+        "/v1/workflows/wf_merge/journal", params={"limit": 3, "cursor": first["next_cursor"]}
+    ).json()
+
+    assert [entry["event_id"] for entry in first["entries"]] == ["evt_a1", "evt_b1", "evt_c1"]
+    # Nothing earlier than the first page's last entry is served afterwards.
+    assert [entry["event_id"] for entry in second["entries"]] == ["evt_a2", "evt_b2", "evt_d2"]
+    assert second["entries"][2]["entry_id"] == "jrnl_run_d_0002"
+    assert len(second["next_cursor"]) == len(first["next_cursor"])
+
+
+def test_workflow_journal_reads_bounded_windows_and_skips_inconsistent_runs() -> None:
+    base = InMemoryAppendOnlyEventStore()
+    seed_workflow(base)
+    base.append(
+        validate_event_payload(
+            build_event_payload(
+                event_id="evt_broken",
+                run_id="run_broken",
+                timestamp="2026-02-24T10:00:00Z",
+                event_type="approval_resolved",
+                requires_approval=True,
+                approval_status="approved",
+            )
+        )
+    )
+    store = _WindowRecordingStore(base)
+    app.dependency_overrides[get_event_store] = lambda: store
+
+    response = client.get("/v1/workflows/wf_merge/journal", params={"limit": 2})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["inconsistent_run_ids"] == ["run_broken"]
+    assert [entry["event_id"] for entry in body["entries"]] == ["evt_a1", "evt_b1"]
+    assert body["next_cursor"] is not None
+    assert store.window_limits and max(store.window_limits) <= 3
+
+
+def test_workflow_journal_rejects_invalid_cursor() -> None:
+    app.dependency_overrides[get_event_store] = lambda: InMemoryAppendOnlyEventStore()
+
+    response = client.get("/v1/workflows/wf_merge/journal", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 422
+    assert response.json()["error"]["details"][0]["code"] == "INVALID_CURSOR"